@@ -1,5 +1,7 @@
 import streamlit as st
 
+from scouting.pages import PAGES_BY_LABEL
+
 st.set_page_config(page_title="Scouting App", layout="wide")
 
 st.title("⚽ Scouting & Similarity App")
@@ -8,22 +10,7 @@ st.sidebar.header("Select Position")
 
 position = st.sidebar.radio(
     "Choose a player position:",
-    [
-        "Fullbacks",
-        "Center Backs",
-        "Midfielders",
-        "Attacking Mids & Wingers",
-        "Forwards"
-    ]
+    list(PAGES_BY_LABEL)
 )
 
-if position == "Fullbacks":
-    exec(open("app_fb.py").read())
-elif position == "Center Backs":
-    exec(open("app_cb.py").read())
-elif position == "Midfielders":
-    exec(open("app_mid.py").read())
-elif position == "Attacking Mids & Wingers":
-    exec(open("app_am.py").read())
-elif position == "Forwards":
-    exec(open("app_fw.py").read())
+PAGES_BY_LABEL[position].render()
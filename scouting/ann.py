@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# ann.py  ─────────────────────────────────────────────
+"""
+IVFIndex(engine, n_lists=None, nprobe=8)  —  approximate similarity search.
+
+Pure-NumPy inverted-file index over the (L2-normalised) PCA space
+of a SimilarityEngine: a spherical k-means coarse quantiser splits
+the players into ~√n lists stored contiguously; a query scores the
+`nprobe` closest centroids, then scores every player in those lists
+exactly (same boost / cap / rounding / tie order as the engine).
+`nprobe` is the recall ↔ latency dial; nprobe = n_lists is exact.
+
+all_positions_engine() builds one engine over the whole player
+database (union of the position feature sets, Position as the
+boost label) that the apps' "All Positions Search" page queries,
+unboosted, across leagues and positions.  The loader switches that
+page to IVF once the database holds ANN_MIN_ROWS players, and the
+page says its results are approximate; position pages stay exact.
+
+    python -m scouting.ann --nprobe 1 2 4 8 16
+
+benchmarks recall@k and ms/query against exact search on the real
+database: the query players are held out of the index, so every
+query is a new vector rather than one the index already holds.
+"""
+
+from __future__ import annotations
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from scouting.positions import POSITIONS
+from scouting.similarity import SimilarityEngine, _boosted, _rank, fit_pca_space
+
+# ——— config
+ANN_MIN_ROWS   = 5000      # below this, exact search is already sub-millisecond
+DEFAULT_NPROBE = 8
+KMEANS_ITERS   = 20
+
+
+# ——— coarse quantiser
+def _spherical_kmeans(X: np.ndarray, k: int, iters: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    C = X[rng.choice(len(X), size=k, replace=False)].copy()
+    assign = np.full(len(X), -1, dtype=np.intp)
+    for _ in range(iters):
+        new = np.argmax(X @ C.T, axis=1)
+        if np.array_equal(new, assign):                # converged
+            break
+        assign = new
+        C = np.zeros_like(C)
+        np.add.at(C, assign, X)
+        empty = ~C.any(axis=1)
+        C[empty] = X[rng.choice(len(X), size=int(empty.sum()), replace=False)]
+        C /= np.maximum(np.linalg.norm(C, axis=1, keepdims=True), 1e-12)
+    return C, assign
+
+
+class IVFIndex:
+    def __init__(self, engine: SimilarityEngine, n_lists: Optional[int] = None,
+                 nprobe: int = DEFAULT_NPROBE, seed: int = 42):
+        self.engine = engine
+        self.nprobe = nprobe
+        X = engine.unit[engine.rows]                       # player_index order
+        n_lists = min(n_lists or max(1, int(np.sqrt(len(X)))), len(X))
+        self.centroids, assign = _spherical_kmeans(X, n_lists, KMEANS_ITERS, seed)
+
+        self.perm = np.argsort(assign, kind="stable")      # list-major layout
+        self.offsets = np.searchsorted(assign[self.perm], np.arange(n_lists + 1))
+        self.vectors = np.ascontiguousarray(X[self.perm])
+        self.labels = engine.labels[engine.rows][self.perm]
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    def query(self, player_name: str, top_n: Optional[int] = None, boost: float = 1.1,
+              nprobe: Optional[int] = None) -> List[Tuple[str, float]]:
+        e = self.engine
+        base = e.player_index[player_name]
+        return self.search(e.unit[base], e.labels[base], top_n, boost, nprobe, exclude=e._pos[player_name])
+
+    def search(self, q: np.ndarray, label, top_n: Optional[int] = None, boost: float = 1.1,
+               nprobe: Optional[int] = None, exclude: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Nearest players to a unit vector `q` with cluster `label`; `exclude` is a player_index position."""
+        e = self.engine
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        probe = np.argpartition(-(self.centroids @ q), nprobe - 1)[:nprobe]
+        idx = np.concatenate([np.arange(self.offsets[l], self.offsets[l + 1]) for l in probe])
+
+        pos = self.perm[idx]
+        order = np.argsort(pos)                            # ties break in player_index order
+        idx, pos = idx[order], pos[order]
+        scores = _boosted(self.vectors[idx] @ q, self.labels[idx] == label, boost)
+        if exclude is not None:
+            scores[pos == exclude] = -np.inf
+
+        n_found = int(np.isfinite(scores).sum())
+        ranked = _rank(scores, n_found if top_n is None else min(top_n, n_found))
+        return [(e.names[pos[i]], float(scores[i])) for i in ranked]
+
+
+# ——— all positions, whole database
+def player_keys(df: pd.DataFrame) -> pd.Series:
+    """'Player (Club)': names alone repeat across positions."""
+    return df["Player"].astype(str) + " (" + df["Club"].astype(str) + ")"
+
+def all_positions_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """The most-played row per player_keys(), in database order."""
+    keep = df.assign(_key=player_keys(df)).sort_values("Minutes", ascending=False, kind="stable")
+    return df.loc[keep.drop_duplicates("_key").index.sort_values()]
+
+def all_positions_engine(df: pd.DataFrame) -> SimilarityEngine:
+    """One PCA space over every position's features; Position is the boost label."""
+    features = list(dict.fromkeys(f for cfg in POSITIONS.values() for f in cfg["features"]))
+    _, _, df_pca = fit_pca_space(df, features)
+    labels, _ = pd.factorize(df["Position"])
+    return SimilarityEngine(df_pca, labels, {k: i for i, k in enumerate(player_keys(df))})
+
+
+# ——— benchmark
+def _exact(X: np.ndarray, labels: np.ndarray, q: np.ndarray, label, top_n: int, boost: float) -> List[int]:
+    return list(_rank(_boosted(X @ q, labels == label, boost), min(top_n, len(X))))
+
+def benchmark(engine: SimilarityEngine, nprobes: List[int], n_queries: int = 200,
+              top_n: int = 10, boost: float = 1.1, seed: int = 0):
+    """recall@top_n of IVF vs exact search, for `n_queries` players held out of the index."""
+    X, labels = engine.unit[engine.rows], engine.labels[engine.rows]
+    held = np.random.default_rng(seed).permutation(len(X))
+    queries, kept = held[:min(n_queries, len(X) // 2)], np.sort(held[min(n_queries, len(X) // 2):])
+    names = engine.names[kept]
+    indexed = SimilarityEngine(X[kept], labels[kept], {n: i for i, n in enumerate(names)})
+
+    t = time.perf_counter()
+    exact = [set(names[_exact(indexed.unit, indexed.labels, X[q], labels[q], top_n, boost)]) for q in queries]
+    exact_ms = (time.perf_counter() - t) / len(queries) * 1e3
+
+    t = time.perf_counter()
+    ivf = IVFIndex(indexed)
+    build_s = time.perf_counter() - t
+    print(f"{len(kept)} players indexed, {len(queries)} held-out queries, "
+          f"{ivf.n_lists} lists (built in {build_s:.2f}s)")
+    print(f"  exact           {exact_ms:7.3f} ms/query")
+    for nprobe in nprobes:
+        t = time.perf_counter()
+        approx = [{n for n, _ in ivf.search(X[q], labels[q], top_n, boost, nprobe)} for q in queries]
+        ms = (time.perf_counter() - t) / len(queries) * 1e3
+        recall = np.mean([len(a & e) / max(len(e), 1) for a, e in zip(approx, exact)])
+        print(f"  nprobe={nprobe:<4}     {ms:7.3f} ms/query   recall@{top_n} {recall:.3f}")
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    from scouting.player_store import PLAYERS_CSV
+    from scouting.store import read_table
+
+    pa = argparse.ArgumentParser()
+    pa.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    pa.add_argument("--queries", type=int, default=200)
+    pa.add_argument("--top", type=int, default=10)
+    a = pa.parse_args()
+
+    engine = all_positions_engine(all_positions_rows(read_table(PLAYERS_CSV)))
+    benchmark(engine, a.nprobe, a.queries, a.top)
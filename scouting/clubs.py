@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# clubs.py  ─────────────────────────────────────────────
+"""
+fbref club names → rows of elo_clubs/Elo_Club_VF.csv.
+
+    python -m scouting.clubs [--rebuild]      # resolve every players_data_clean club
+
+Each distinct name is resolved once, in order:
+    alias   ALIASES (names no string measure gets right, e.g. NEC → Nijmegen)
+    exact   same name after normalise() (case, accents, punctuation)
+    fuzzy   best score() among the Elo clubs sharing the most character
+            trigrams with the name (inverted index, MAX_CANDIDATES scored);
+            below MIN_SCORE the club is left unmatched rather than forced
+            onto the nearest Elo club (merge_elo gives it its league's
+            median club Elo)
+Ties go to the earlier row of the Elo table, so the result is
+deterministic.  Decisions are kept in CLUB_MAP
+(Club;EloClub;Score;Method;EloTable); later runs reuse them and only
+resolve new names, plus unmatched ones whose EloTable (a digest of the
+Elo club names they were tried against) is not the current table's.
+Edit EloClub there to override a match.  Unmatched and low-confidence
+clubs are reported.
+
+    final_df = merge_elo(df_combined)       # the notebooks' fuzzy merge
+"""
+
+from __future__ import annotations
+import hashlib, re, time, unicodedata
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import pandas as pd
+
+# ——— config
+ELO_CSV        = "elo_clubs/Elo_Club_VF.csv"
+CLUB_MAP       = "elo_clubs/club_map.csv"
+MIN_SCORE      = 80          # below: unmatched
+CONFIDENT      = 90          # below: reported as low confidence
+MAX_CANDIDATES = 20
+PARTIAL_MIN    = 5           # shorter name length for substring matches (avoids Roma ⊂ Romania)
+
+ALIASES = {
+    "Athletic Club":        "Bilbao",
+    "NEC":                  "Nijmegen",
+    "Paris Saint-Germain":  "Paris SG",
+    "Queens Park Rangers":  "QPR",
+    "Vitória Guimarães":    "Guimarães",
+}
+
+
+class Match(NamedTuple):
+    club: str
+    elo_club: Optional[str]
+    score: float
+    method: str              # alias | exact | fuzzy | unmatched | manual
+    elo_table: str = ""      # unmatched: table_digest() of the Elo clubs tried
+
+
+# ——— string measures
+def normalise(name: str) -> str:
+    """'Saint-Étienne' → 'saint etienne'."""
+    s = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode()
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", s.lower()).split())
+
+def trigrams(norm: str) -> set:
+    s = f"  {norm} "
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+def score(a: str, b: str) -> float:
+    """0–100 between two normalised names: ratio, token containment (95), substring (90 × partial)."""
+    short, long_ = sorted((a, b), key=len)
+    best = 100 * SequenceMatcher(None, a, b).ratio()
+    if set(short.split()) <= set(long_.split()):
+        best = max(best, 95.0)
+    if len(short) >= PARTIAL_MIN and len(long_) > len(short):
+        part = max(SequenceMatcher(None, short, long_[k:k + len(short)]).ratio()
+                   for k in range(len(long_) - len(short) + 1))
+        best = max(best, 90 * part)
+    return round(best, 1)
+
+
+def table_digest(elo_clubs: Iterable[str]) -> str:
+    """Short sha256 of the Elo club names, in table order."""
+    return hashlib.sha256("\n".join(elo_clubs).encode()).hexdigest()[:16]
+
+
+# ——— resolver
+class ClubResolver:
+    def __init__(self, elo_clubs: Iterable[str], aliases: Dict[str, str] = ALIASES,
+                 min_score: float = MIN_SCORE):
+        self.elo_clubs: List[str] = list(dict.fromkeys(elo_clubs))
+        self.norm = [normalise(c) for c in self.elo_clubs]
+        self.exact = {}
+        for c, n in zip(self.elo_clubs, self.norm):
+            self.exact.setdefault(n, c)
+        self.aliases = {normalise(k): v for k, v in aliases.items() if v in self.elo_clubs}
+        self.min_score = min_score
+        self.table = table_digest(self.elo_clubs)
+        self.index: Dict[str, List[int]] = defaultdict(list)     # trigram → Elo rows
+        for i, n in enumerate(self.norm):
+            for g in trigrams(n):
+                self.index[g].append(i)
+
+    def candidates(self, norm: str) -> List[int]:
+        hits = Counter(i for g in trigrams(norm) for i in self.index.get(g, ()))
+        return [i for i, _ in sorted(hits.items(), key=lambda kv: (-kv[1], kv[0]))[:MAX_CANDIDATES]]
+
+    def match(self, club: str) -> Match:
+        n = normalise(club)
+        if n in self.aliases:
+            return Match(club, self.aliases[n], 100.0, "alias")
+        if n in self.exact:
+            return Match(club, self.exact[n], 100.0, "exact")
+        best_i, best = None, -1.0
+        for i in self.candidates(n):
+            s = score(n, self.norm[i])
+            if s > best or (s == best and i < best_i):
+                best_i, best = i, s
+        if best_i is None or best < self.min_score:
+            return Match(club, None, max(best, 0.0), "unmatched", self.table)
+        return Match(club, self.elo_clubs[best_i], best, "fuzzy")
+
+    def resolve(self, clubs: Iterable[str], known: Optional[Dict[str, Match]] = None) -> Dict[str, Match]:
+        """
+        Distinct non-null names → Match; `known` entries pointing at a current
+        Elo club, or left unmatched against this same Elo table, are reused.
+        """
+        known, out = known or {}, {}
+        for club in dict.fromkeys(c for c in clubs if isinstance(c, str)):
+            m = known.get(club)
+            out[club] = m if m and (m.elo_club in self.elo_clubs
+                                    or (m.method == "unmatched" and m.elo_table == self.table)) \
+                else self.match(club)
+        return out
+
+
+# ——— persisted mapping
+def load_map(path: str = CLUB_MAP) -> Dict[str, Match]:
+    if not Path(path).exists():
+        return {}
+    df = pd.read_csv(path, sep=";", dtype={"Club": str, "EloClub": str, "Method": str, "EloTable": str})
+    if "EloTable" not in df.columns:                     # maps written before EloTable: retry unmatched
+        df["EloTable"] = ""
+    return {r.Club: Match(r.Club, None if pd.isna(r.EloClub) else r.EloClub,
+                          float(r.Score), r.Method, "" if pd.isna(r.EloTable) else r.EloTable)
+            for r in df.itertuples(index=False)}
+
+def save_map(matches: Dict[str, Match], path: str = CLUB_MAP):
+    rows = sorted(matches.values(), key=lambda m: m.club)
+    pd.DataFrame(rows, columns=["Club", "EloClub", "Score", "Method", "EloTable"]) \
+        .to_csv(path, sep=";", index=False)
+
+def load_elo(path: str = ELO_CSV) -> pd.DataFrame:
+    return pd.read_csv(path, sep=";")
+
+def resolve_clubs(clubs: Iterable[str], elo_df: Optional[pd.DataFrame] = None,
+                  map_csv: Optional[str] = CLUB_MAP, rebuild: bool = False) -> Dict[str, Match]:
+    """Resolve, reusing and updating the persisted map (map_csv=None: in memory only)."""
+    elo_df = load_elo() if elo_df is None else elo_df
+    known = {} if rebuild or map_csv is None else load_map(map_csv)
+    matches = ClubResolver(elo_df["Club"]).resolve(clubs, known)
+    if map_csv is not None:
+        save_map({**known, **matches}, map_csv)
+    return matches
+
+def merge_elo(df: pd.DataFrame, elo_df: Optional[pd.DataFrame] = None,
+              map_csv: Optional[str] = CLUB_MAP, fill_league: bool = True) -> pd.DataFrame:
+    """
+    df with an Elo column appended, rows unchanged.  Unmatched clubs get
+    the median Elo of their League's matched clubs (fill_league, needs a
+    League column; the rating models cannot take NaN), else NaN.
+    """
+    elo_df = load_elo() if elo_df is None else elo_df
+    matches = resolve_clubs(df["Club"], elo_df, map_csv)
+    elo = elo_df.drop_duplicates("Club").set_index("Club")["Elo"]
+    out = df.copy()
+    out["Elo"] = df["Club"].map({c: m.elo_club for c, m in matches.items()}).map(elo)
+    if fill_league and "League" in out.columns:
+        clubs = out.drop_duplicates("Club")
+        out["Elo"] = out["Elo"].fillna(out["League"].map(clubs.groupby("League")["Elo"].median()))
+    return out
+
+def report(matches: Dict[str, Match], counts: Optional[pd.Series] = None):
+    """Print unmatched and low-confidence clubs (with player counts when given)."""
+    n = lambda c: f" ({counts[c]} players)" if counts is not None else ""
+    methods = Counter(m.method for m in matches.values())
+    print(f"{len(matches)} clubs: " + ", ".join(f"{v} {k}" for k, v in sorted(methods.items())))
+    for m in sorted(matches.values(), key=lambda m: m.score):
+        if m.method == "unmatched":
+            print(f"  ✗ {m.club}{n(m.club)}  best score {m.score:.0f}")
+        elif m.score < CONFIDENT:
+            print(f"  ? {m.club} → {m.elo_club}  score {m.score:.0f}{n(m.club)}")
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse, glob
+    pa = argparse.ArgumentParser()
+    pa.add_argument("--clean-dir", default="players_data_clean")
+    pa.add_argument("--elo", default=ELO_CSV)
+    pa.add_argument("--map", default=CLUB_MAP)
+    pa.add_argument("--rebuild", action="store_true", help="ignore the persisted map")
+    a = pa.parse_args()
+
+    clubs = pd.concat([pd.read_csv(p, usecols=["Club"]) for p in sorted(glob.glob(f"{a.clean_dir}/*.csv"))])["Club"]
+    t = time.perf_counter()
+    matches = resolve_clubs(clubs, load_elo(a.elo), a.map, a.rebuild)
+    print(f"{len(clubs)} rows, {clubs.nunique()} distinct clubs resolved in "
+          f"{1e3 * (time.perf_counter() - t):.1f} ms → {a.map}")
+    report(matches, clubs.value_counts())
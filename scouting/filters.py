@@ -0,0 +1,83 @@
+# filters.py  ─────────────────────────────────────────────
+"""
+FilterIndex(df)  —  precomputed index for the Full Player Table filters.
+
+Each filter column is factorised once into int32 codes, so a
+multiselect becomes a boolean lookup table indexed by the codes;
+Age is kept argsorted so a range is two searchsorted calls; Rating
+and Potential have presorted (descending, stable) permutations
+(re-weighted scores from the what-if controls are sorted per query).
+A query is a handful of vectorised mask ANDs and returns row
+positions, already in the requested order — the dataframe itself is
+only touched once, to take the rows that are displayed.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ["League", "Club", "Cluster Name", "Footed", "Nationality"]
+SORT_COLUMNS   = ["Rating", "Potential"]
+
+
+class FilterIndex:
+    def __init__(self, df: pd.DataFrame):
+        self.n = len(df)
+        self.codes: Dict[str, np.ndarray] = {}
+        self.values: Dict[str, list] = {}
+        self.lookup: Dict[str, Dict[object, int]] = {}
+        for col in FILTER_COLUMNS:
+            codes, uniques = pd.factorize(df[col])          # appearance order, like .unique()
+            self.codes[col] = codes.astype(np.int32)
+            self.values[col] = list(uniques)
+            self.lookup[col] = {v: i for i, v in enumerate(self.values[col])}
+
+        age = df["Age"].to_numpy(dtype=np.float64)
+        self.age_order = np.argsort(age, kind="stable")     # NaN last
+        self.age_sorted = age[self.age_order]
+        self.age_min, self.age_max = np.nanmin(age), np.nanmax(age)
+
+        self.order = {col: np.argsort(-df[col].to_numpy(dtype=np.float64), kind="stable")
+                      for col in SORT_COLUMNS}
+
+    def options(self, col: str) -> list:
+        return self.values[col]
+
+    def mask(self, selected: Dict[str, Sequence], age: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """Rows passing every non-empty selection and the inclusive age range."""
+        mask = np.ones(self.n, dtype=bool)
+        for col, chosen in selected.items():
+            if not chosen:
+                continue
+            lut = np.zeros(len(self.values[col]) + 1, dtype=bool)   # last slot: code -1 (NaN)
+            lut[[self.lookup[col][v] for v in chosen if v in self.lookup[col]]] = True
+            mask &= lut[self.codes[col]]
+        if age is not None:
+            lo = np.searchsorted(self.age_sorted, age[0], side="left")
+            hi = np.searchsorted(self.age_sorted, age[1], side="right")
+            in_range = np.zeros(self.n, dtype=bool)
+            in_range[self.age_order[lo:hi]] = True
+            mask &= in_range
+        return mask
+
+    def rows(self, mask: np.ndarray, sort_by: Optional[str] = None,
+             values: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Positions of the rows in `mask`, in frame order or best-first by
+        `sort_by`; `values` replaces that column (re-weighted scores), and
+        only the masked rows are then sorted.
+        """
+        if sort_by is None:
+            return np.flatnonzero(mask)
+        if values is not None:
+            rows = np.flatnonzero(mask)
+            return rows[np.argsort(-values[rows], kind="stable")]
+        perm = self.order[sort_by]
+        return perm[mask[perm]]
+
+
+def take(df: pd.DataFrame, rows: np.ndarray, columns: List[str]) -> pd.DataFrame:
+    """One positional take of the displayed rows and columns."""
+    return df.iloc[rows, df.columns.get_indexer(columns)]
@@ -0,0 +1,138 @@
+# loader.py  ─────────────────────────────────────────────
+"""
+load_position(pos, radar_features)  →  PositionArtifact
+
+Everything a position page derives from its players
+(dataframe, scaler, PCA, projected matrix, player index,
+similarity engine, neighbour index, filter index, radar bounds, the rating / potential score base for
+the what-if weights), built once
+per process with st.cache_resource.  The players come from the
+unified store's position view when it is fresh (see
+player_store), otherwise from the position CSV / its Parquet
+copy; either way only the page's columns are read.  The cache
+key includes the mtime and size of that source, of the position's
+neighbour index and of the rating database, so regenerating any
+of them rebuilds the artifact on the next rerun while widget
+changes reuse it.
+
+load_all_positions()  →  AllPositionsArtifact: the whole rating
+database in one similarity space (scouting.ann), for cross-league,
+all-position search; same caching, keyed on the database file.
+"""
+
+from __future__ import annotations
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+from scouting.ann import ANN_MIN_ROWS, IVFIndex, all_positions_engine, all_positions_rows
+from scouting.filters import FilterIndex
+from scouting.neighbours import INDEX_DIR, NeighbourIndex
+from scouting.player_store import position_view, view_is_fresh, view_path, view_pca
+from scouting.positions import POSITIONS, position_columns
+from scouting.scoring import DATABASE_CSV, ScoreBase, references
+from scouting.similarity import SimilarityEngine, fit_pca_space
+from scouting.store import read_table, source_path
+
+
+@dataclass(frozen=True)
+class PositionArtifact:
+    df: pd.DataFrame
+    scaler: StandardScaler
+    pca: PCA
+    df_pca: np.ndarray
+    cluster_labels: np.ndarray
+    player_index: Dict[str, int]
+    engine: SimilarityEngine
+    neighbours: Optional[NeighbourIndex]
+    filters: FilterIndex
+    scores: ScoreBase
+    lower_bounds: pd.Series
+    upper_bounds: pd.Series
+    range_vals: pd.Series
+
+
+def file_key(path) -> Tuple[int, int]:
+    """(mtime_ns, size) — cheap change detection for cache keys."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def source_key(pos: str) -> Tuple:
+    """File keys of what build_artifact(pos) reads: its rows, neighbour index and the rating database."""
+    rows = view_path(pos, "rows.npy") if view_is_fresh(pos) else source_path(POSITIONS[pos]["csv"])
+    files = [rows, *sorted(INDEX_DIR.glob(f"{pos}_*.npy")), source_path(DATABASE_CSV)]
+    return tuple((str(f), *file_key(f)) if os.path.exists(f) else (str(f),) for f in files)
+
+
+def database_references(df: pd.DataFrame) -> Tuple[float, float]:
+    """(max Minutes, median Elo) of the whole rating database; df's own if it is missing."""
+    try:
+        df = read_table(DATABASE_CSV, ["Minutes", "Elo"])
+    except FileNotFoundError:
+        pass
+    return references(df)
+
+
+def build_artifact(pos: str, radar_features: Optional[List[str]] = None) -> PositionArtifact:
+    cfg = POSITIONS[pos]
+    radar = list(radar_features or cfg["radar_features"])
+    columns = position_columns(pos) + radar
+    if view_is_fresh(pos):
+        df = position_view(pos, columns)
+        scaler, pca, df_pca = view_pca(pos)
+    else:
+        df = read_table(cfg["csv"], columns)
+        scaler, pca, df_pca = fit_pca_space(df, cfg["features"])
+    cluster_labels = df["Cluster"].values
+    player_index = {player: idx for idx, player in enumerate(df["Player"])}
+    engine = SimilarityEngine(df_pca, cluster_labels, player_index)
+
+    lower_bounds = df[radar].quantile(0.02)
+    upper_bounds = df[radar].quantile(0.98)
+
+    return PositionArtifact(
+        df=df, scaler=scaler, pca=pca, df_pca=df_pca,
+        cluster_labels=cluster_labels, player_index=player_index,
+        engine=engine, neighbours=NeighbourIndex.load(pos, df, engine),
+        filters=FilterIndex(df),
+        scores=ScoreBase.from_frame(df, *database_references(df)),
+        lower_bounds=lower_bounds, upper_bounds=upper_bounds,
+        range_vals=(upper_bounds - lower_bounds).replace(0, 1),
+    )
+
+
+@st.cache_resource(show_spinner="Loading players…")
+def _cached_artifact(pos: str, radar_features: Tuple[str, ...],
+                     source_key: Tuple) -> PositionArtifact:
+    return build_artifact(pos, list(radar_features))
+
+
+def load_position(pos: str, radar_features: List[str]) -> PositionArtifact:
+    return _cached_artifact(pos, tuple(radar_features), source_key(pos))
+
+
+# ——— all positions
+@dataclass(frozen=True)
+class AllPositionsArtifact:
+    df: pd.DataFrame                 # one row per 'Player (Club)', engine order
+    engine: SimilarityEngine
+    ann: Optional[IVFIndex]
+
+def build_all_positions() -> AllPositionsArtifact:
+    df = all_positions_rows(read_table(DATABASE_CSV)).reset_index(drop=True)
+    engine = all_positions_engine(df)
+    return AllPositionsArtifact(df=df, engine=engine,
+                                ann=IVFIndex(engine) if len(df) >= ANN_MIN_ROWS else None)
+
+@st.cache_resource(show_spinner="Loading all players…")
+def _cached_all_positions(source_key: Tuple[int, int]) -> AllPositionsArtifact:
+    return build_all_positions()
+
+def load_all_positions() -> AllPositionsArtifact:
+    return _cached_all_positions(file_key(source_path(DATABASE_CSV)))
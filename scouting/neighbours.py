@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# neighbours.py  ─────────────────────────────────────────────
+"""
+Precomputed top-K neighbour index, one file per position.
+
+    python -m scouting.neighbours [--k 100] [fb cb mid am fw]
+
+writes neighbours/<pos>_<key>.npy, an (n_players, K) array of
+    idx    int32    row of the neighbour in the position CSV
+    score  float32  boosted similarity (SimilarityEngine.query)
+with rows in `player_index` order.  <key> hashes what the scores
+are computed from (player index, cluster labels, normalised PCA
+matrix) and the boost, so regenerating the clusters or changing a
+feature list makes the old file stale.  The apps memory-map the matching file
+and fall back to live SimilarityEngine queries when there is none.
+"""
+
+from __future__ import annotations
+import hashlib, json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from scouting.positions import POSITIONS
+from scouting.similarity import SimilarityEngine, _rank
+
+# ——— config
+INDEX_DIR    = Path("neighbours")
+TOP_K        = 100
+BOOST        = 1.1
+BLOCK_ROWS   = 1024
+
+NEIGHBOUR_DTYPE = np.dtype([("idx", "<i4"), ("score", "<f4")])
+
+
+# ——— keys & paths
+def index_key(engine: SimilarityEngine, boost: float = BOOST) -> str:
+    h = hashlib.sha256(np.ascontiguousarray(engine.unit).tobytes())
+    h.update(engine.labels.astype(np.int64).tobytes())
+    h.update(json.dumps({"players": list(engine.player_index),
+                         "rows": engine.rows.tolist(), "boost": boost}).encode())
+    return h.hexdigest()[:16]
+
+def index_path(pos: str, key: str) -> Path:
+    return INDEX_DIR / f"{pos}_{key}.npy"
+
+
+# ——— build
+def build_index(pos: str, engine: SimilarityEngine, k: int = TOP_K, boost: float = BOOST) -> Path:
+    n = len(engine.names)
+    k = min(k, n - 1)
+    table = np.zeros((n, k), dtype=NEIGHBOUR_DTYPE)
+    for start in range(0, n, BLOCK_ROWS):
+        scores = engine.score_matrix(engine.names[start:start + BLOCK_ROWS], boost)
+        for r, row in enumerate(scores):
+            row[start + r] = -np.inf                      # never match the query player
+            order = _rank(row, k)
+            table[start + r]["idx"] = engine.rows[order]
+            table[start + r]["score"] = row[order]
+
+    INDEX_DIR.mkdir(exist_ok=True)
+    for old in INDEX_DIR.glob(f"{pos}_*.npy"):
+        old.unlink()
+    path = index_path(pos, index_key(engine, boost=boost))
+    np.save(path, table)
+    return path
+
+
+# ——— lookup
+class NeighbourIndex:
+    def __init__(self, table: np.ndarray, player_index: Dict[str, int],
+                 players: np.ndarray, boost: float = BOOST):
+        self.table = table
+        self.players = players
+        self.boost = boost
+        self._pos = {name: i for i, name in enumerate(player_index)}
+
+    @classmethod
+    def load(cls, pos: str, df: pd.DataFrame, engine: SimilarityEngine,
+             boost: float = BOOST) -> Optional["NeighbourIndex"]:
+        """Memory-map the index matching the current data, or None if stale/missing."""
+        player_index = engine.player_index
+        path = index_path(pos, index_key(engine, boost=boost))
+        if not path.exists():
+            return None
+        table = np.load(path, mmap_mode="r")
+        if table.dtype != NEIGHBOUR_DTYPE or len(table) != len(player_index):
+            return None
+        return cls(table, player_index, df["Player"].to_numpy(), boost)
+
+    def query(self, player_name: str, top_n: Optional[int],
+              boost: float = BOOST) -> Optional[List[Tuple[str, float]]]:
+        """Top-N neighbours, or None when the index cannot answer (N > K, other boost)."""
+        if top_n is None or top_n > self.table.shape[1] or boost != self.boost:
+            return None
+        hits = self.table[self._pos[player_name], :top_n]
+        return [(self.players[i], round(float(s), 2)) for i, s in zip(hits["idx"], hits["score"])]
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    pa = argparse.ArgumentParser()
+    pa.add_argument("positions", nargs="*", default=list(POSITIONS))
+    pa.add_argument("--k", type=int, default=TOP_K)
+    a = pa.parse_args()
+
+    from scouting.loader import build_artifact
+    for pos in a.positions:
+        art = build_artifact(pos)
+        print(f"→ {pos}: {build_index(pos, art.engine, k=a.k)}")
@@ -0,0 +1,218 @@
+# pages.py  ─────────────────────────────────────────────
+"""
+PAGES[pos].render()  —  one config-driven Streamlit page per position.
+
+Every position app is the same sub-pages (Similarity Search,
+Shortlist Similarity, Compare Players, Cluster Profiles, Full Player
+Table, All Positions Search) over a different entry of
+scouting.positions.POSITIONS.  A PositionPage
+only loads its artifact when rendered, and load_position() caches
+it per process, so switching positions in app_full.py reuses
+whatever was already loaded.
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+
+from scouting.filters import take
+from scouting.loader import PositionArtifact, load_all_positions, load_position
+from scouting.positions import POSITIONS, meta_cols
+from scouting.radar import cluster_radars, compare_radar
+from scouting.scoring import DEFAULT_WEIGHTS, Weights
+from scouting.shortlist import similar_players_batch
+
+
+# ——— position page
+class PositionPage:
+    SUBPAGES = ["📌 Similarity Search", "📋 Shortlist Similarity", "🆚 Compare Players", "🧬 Cluster Profiles", "📊 Full Player Table", "🌍 All Positions Search"]
+
+    def __init__(self, pos: str):
+        self.pos = pos
+        self.cfg = POSITIONS[pos]
+        self.label = self.cfg["label"]
+        self.features = self.cfg["features"]
+        self.radar_features = self.cfg["radar_features"]
+        self.table_features = self.cfg["table_extra"] + self.features
+
+    @property
+    def art(self) -> PositionArtifact:
+        return load_position(self.pos, self.radar_features)
+
+    # Similarity function
+    def compute_similarity(self, player_name: str, top_n: Optional[int] = None,
+                           boost: float = 1.1) -> List[Tuple[str, float]]:
+        art = self.art
+        hits = art.neighbours.query(player_name, top_n, boost) if art.neighbours else None
+        if hits is None:
+            hits = art.engine.query(player_name, top_n=top_n, boost=boost)
+        return hits
+
+    # Score function
+    def similarity_score(self, p1: str, p2: str, boost: float = 1.1) -> float:
+        return self.art.engine.score(p1, p2, boost=boost)
+
+    # === Streamlit App ===
+    def render(self):
+        st.title(self.cfg["title"])
+
+        page = st.sidebar.radio("Navigate", self.SUBPAGES)
+
+        if page == "📌 Similarity Search":
+            self.similarity_search()
+        elif page == "📋 Shortlist Similarity":
+            self.shortlist_similarity()
+        elif page == "🆚 Compare Players":
+            self.compare_players()
+        elif page == "🧬 Cluster Profiles":
+            self.cluster_profiles()
+        elif page == "📊 Full Player Table":
+            self.full_player_table()
+        elif page == "🌍 All Positions Search":
+            self.all_positions_search()
+
+    def similarity_search(self):
+        df = self.art.df
+        player = st.selectbox("Select Player", df["Player"].unique())
+        n = st.slider("Top N", 3, 30, 10)
+
+        sim_list = self.compute_similarity(player, top_n=n - 1)
+        sim_list = [(player, 100.0)] + sim_list  # Ajoute le joueur source en haut
+        df_sim = pd.DataFrame(sim_list, columns=["Player", "Similarity"])
+
+        top_players_df = df_sim.head(n)
+        top_players = top_players_df["Player"].tolist()
+
+        # Merge similarity scores into main DataFrame
+        detailed_df = df[df["Player"].isin(top_players)].copy()
+        detailed_df = detailed_df.merge(top_players_df, on="Player")
+        detailed_df = detailed_df.sort_values("Similarity", ascending=False)
+
+        st.subheader("🧠 Similar Players with Full Stats")
+        st.dataframe(detailed_df[["Player", "Similarity"] + meta_cols[1:] + ["Cluster Name"] + self.table_features].set_index("Player"))
+
+    def shortlist_similarity(self):
+        art = self.art
+        df = art.df
+        targets = st.multiselect("Shortlist / Squad", df["Player"].unique())
+        n = st.slider("Top N per player", 1, 30, 5)
+        league = st.multiselect("Candidate League", art.filters.options("League"))
+        max_age = st.slider("Max Age", int(art.filters.age_min), int(art.filters.age_max), int(art.filters.age_max))
+        min_minutes = st.number_input("Min Minutes", 0, int(df["Minutes"].max()), 0, step=100)
+
+        if targets:
+            # untouched bounds filter nothing (players without an Age stay in)
+            df_batch = similar_players_batch(art, targets, top_n=n, leagues=league,
+                                             max_age=max_age if max_age < int(art.filters.age_max) else None,
+                                             min_minutes=min_minutes or None)
+            st.dataframe(df_batch, hide_index=True)
+            st.download_button("⬇️ Export CSV", df_batch.to_csv(index=False).encode("utf-8"),
+                               file_name=f"similar_{self.pos}.csv", mime="text/csv")
+
+    def compare_players(self):
+        art = self.art
+        df = art.df
+        p1 = st.selectbox("Player 1", df["Player"].unique())
+        p2 = st.selectbox("Player 2", df["Player"].unique(), index=1)
+        if st.button("Compare"):
+            score = self.similarity_score(p1, p2)
+            st.subheader(f"Similarity Score: {abs(score):.2f}")
+            st.image(compare_radar(self.pos, df, p1, p2, self.radar_features,
+                                   art.lower_bounds, art.upper_bounds), use_container_width=True)
+
+    def cluster_profiles(self):
+        art = self.art
+        st.header("🧬 Cluster Spider Charts & Descriptions")
+        st.markdown("Visual & tactical breakdown of each attacking midfielder/wide profile.")
+
+        cols = st.columns(3)
+        charts = cluster_radars(self.pos, art.df, self.radar_features, self.cfg["cluster_names"],
+                                art.lower_bounds, art.upper_bounds)
+        for i, (_, img) in enumerate(charts):
+            cols[i % 3].image(img, use_container_width=True)
+        st.markdown("---")
+
+        for cname, cdesc in self.cfg["cluster_descriptions"].items():
+            st.markdown(f"""
+            <div style='margin-bottom: 2rem;'>
+                <h3 style='margin-bottom: 0.5rem; font-size:20px; color: #1E90FF;'>🔹 {cname}</h3>
+                <div style='font-size: 16px; line-height: 1.6; color: white;'>{cdesc}</div>
+            </div>
+            <hr style='margin-top: 2rem; margin-bottom: 2rem;'>
+            """, unsafe_allow_html=True)
+
+    def full_player_table(self):
+        art = self.art
+        fx = art.filters
+        league = st.multiselect("League", fx.options("League"))
+        age_slider = st.slider("Age Range", int(fx.age_min), int(fx.age_max), (18, 32))
+        club = st.multiselect("Club", fx.options("Club"))
+        cluster = st.multiselect("Cluster Name", fx.options("Cluster Name"))
+        foot = st.multiselect("Footed", fx.options("Footed"))
+        nat = st.multiselect("Nationality", fx.options("Nationality"))
+
+        mask = fx.mask({"League": league, "Club": club, "Cluster Name": cluster,
+                        "Footed": foot, "Nationality": nat}, age=age_slider)
+
+        # --- What-if weights: Rating / Potential recomputed from the cached score base ---
+        d = DEFAULT_WEIGHTS
+        with st.expander("⚖️ Rating & Potential weights"):
+            c1, c2, c3 = st.columns(3)
+            elo_weight = c1.slider("Elo weight", 0.0, 1.0, d.elo_weight, 0.05)
+            age_weight = c2.slider("Age weight", 0.0, 1.0, d.age_weight, 0.05)
+            low, high = c3.slider("Minutes thresholds", 0, 3500,
+                                  (int(d.low_minutes), int(d.high_minutes)), 100)
+        weights = Weights(low_minutes=low, high_minutes=high, elo_weight=elo_weight, age_weight=age_weight)
+        scores = None if weights == d else dict(zip(("Rating", "Potential"), art.scores.score(weights)))
+
+        # --- Sort Buttons ---
+        col1, col2 = st.columns(2)
+        with col1:
+            sort_by_rating = st.button("🔝 Sort by Rating")
+        with col2:
+            sort_by_potential = st.button("🚀 Sort by Potential")
+
+        sort_by = "Rating" if sort_by_rating else "Potential" if sort_by_potential else None
+        rows = fx.rows(mask, sort_by, scores[sort_by] if scores and sort_by else None)
+
+        # Display
+        table = take(art.df, rows, meta_cols + ["Cluster Name"] + self.table_features)
+        if scores:
+            table = table.assign(**{col: v[rows] for col, v in scores.items()})
+        st.dataframe(table.set_index("Player"))
+
+    def all_positions_search(self):
+        # no same-Position boost: positions are coarse, ×1.1 would cap most of them at 100
+        art = load_all_positions()
+        df, engine = art.df, art.engine
+        st.markdown("Similar players across every league and position.")
+        own = df.index[df["Player"].isin(self.art.df["Player"])]
+        player = st.selectbox("Select Player", engine.names, index=int(own[0]) if len(own) else 0)
+        n = st.slider("Top N", 3, 50, 10)
+        league = st.multiselect("Candidate League", sorted(df["League"].dropna().unique()))
+        position = st.multiselect("Candidate Position", sorted(df["Position"].dropna().unique()))
+
+        if league or position:
+            cand = pd.Series(True, index=df.index)
+            if league:
+                cand &= df["League"].isin(league)
+            if position:
+                cand &= df["Position"].isin(position)
+            hits = engine.batch_query([player], n, boost=1.0, candidates=cand.to_numpy())[player]
+        elif art.ann is not None:
+            hits = art.ann.query(player, n, boost=1.0)
+            st.caption(f"Approximate search (IVF index, {art.ann.nprobe} of {art.ann.n_lists} lists probed): "
+                       "pick a league or position for exact results.")
+        else:
+            hits = engine.query(player, top_n=n, boost=1.0)
+
+        rows = [engine.player_index[name] for name, _ in hits]
+        table = df.iloc[rows][["Player", "Position", "Club", "League", "Age", "Minutes", "Rating", "Potential"]]
+        st.dataframe(table.assign(Similarity=[score for _, score in hits]), hide_index=True)
+
+
+# === REGISTRY ===
+PAGES = {pos: PositionPage(pos) for pos in POSITIONS}
+PAGES_BY_LABEL = {page.label: page for page in PAGES.values()}
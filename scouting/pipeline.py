@@ -0,0 +1,402 @@
+#!/usr/bin/env python
+# pipeline.py  ─────────────────────────────────────────────
+"""
+players_data/ → app artifacts, as one command.
+
+    python -m scouting.pipeline [--force STAGE …] [--dry-run] [--workers 5]
+                                [--as-of 2025-06-30] [--min-agreement 0.9]
+    python -m scouting.pipeline --check-stability
+
+Stages, in dependency order (BUILD_DIR holds the intermediates):
+    clean           players_data/*.csv → players_data_clean/ (scrappers.Prp)
+    concat          every clean league, in LEAGUE_ORDER → build/combined.parquet
+    elo             + Elo of the resolved club (scouting.clubs) → build/elo.parquet
+    rate            + model Rating (scouting.ratings) → build/rated.parquet
+    potential       → players_rating_potential_database.csv (scouting.scoring),
+                    Age as of --as-of
+    cluster:<pos>   one per position, in parallel processes: the clustering
+                    notebooks' recipe — StandardScaler + PCA(95 %) + KMeans
+                    (seed 42) on all the position's rows,
+                    then most-played row per player for DEDUPE_PLAYERS →
+                    final_df_<pos>_with_clusters.csv
+    export          Parquet copies, the player store and neighbour indexes
+
+Each stage has a key: sha256 of its parameters, the source of the
+modules it runs and the content of its inputs (a cluster stage hashes
+only its position's rows).  A stage whose key and outputs are those of
+its last run is skipped, so a full refresh runs everything once and a
+change only redoes the stages downstream of it.  Keys live in
+BUILD_DIR/state.json with a (size, mtime) memo of file digests.
+
+The first clustering of a position is the notebooks' KMeans, whose
+single k-means++ start depends on row order, so the database is built
+in the notebooks' league order (LEAGUE_ORDER).  Once a
+final_df_<pos>_with_clusters.csv exists, KMeans instead starts from
+the centroids of its clusters (their players' means in the new PCA
+space) and the labels are renumbered to agree best with it (Hungarian
+matching on shared players), so an edit moves only players near a
+cluster boundary.  The committed CSVs are the notebooks' first
+clustering: rebuilt from the committed database their labels are kept
+(bar two am players moved by the row it gained), but the row sets
+follow the database, so rows missing from the CSVs are added.  A
+position whose agreement falls below --min-agreement is not written:
+POSITIONS' hand-written cluster names, descriptions and sizes would
+describe other groups of players.  Review them, then rerun with
+--min-agreement 0.  --check-stability re-clusters every position
+after a random one-cell edit, writes nothing and fails below
+MIN_AGREEMENT.
+"""
+
+from __future__ import annotations
+import glob, hashlib, inspect, json, os, time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from scouting.positions import POSITIONS
+
+# ——— config
+BUILD_DIR     = Path("build")
+STATE_JSON    = BUILD_DIR / "state.json"
+DATA_DIR      = "players_data"
+CLEAN_DIR     = "players_data_clean"
+DATABASE_CSV  = "modelling_notebooks/players_rating_potential_database.csv"
+ELO_CSV       = "elo_clubs/Elo_Club_VF.csv"
+CLUB_MAP      = "elo_clubs/club_map.csv"
+AS_OF         = "2025-06-30"    # Age reference date: end of the 2024/25 season
+KMEANS_SEED   = 42              # first clustering: scikit-learn's default n_init, as in the notebooks
+MIN_AGREEMENT = 0.9             # share of shared players keeping their cluster
+WORKERS       = len(POSITIONS)
+
+LEAGUE_ORDER = [                # concat order of the notebooks (their glob order); others follow, sorted
+    "SerieA", "Bundesliga", "PrimeiraLiga", "LaLiga", "BelgianPro",
+    "CampeonatoBrasileiro", "Ligue1", "Eredivisie", "EFLChampionship", "PremierLeague",
+]
+DEDUPE_PLAYERS = {"fb", "cb"}   # notebooks that keep only the most-played row per player
+MATCH_KEY      = ["Player", "Birthdate", "League", "Club"]    # rows compared with the previous clustering
+
+POSITION_VALUES = {             # POSITIONS key → value of the Position column
+    "fb":  "Fullbacks",
+    "cb":  "Center Backs",
+    "mid": "Midfielders",
+    "am":  "Att Mid / Wingers",
+    "fw":  "Forwards",
+}
+
+
+# ——— hashing
+class Digests:
+    """sha256 of files, memoised on (size, mtime_ns)."""
+
+    def __init__(self, memo: Optional[Dict[str, list]] = None):
+        self.memo = memo or {}
+
+    def file(self, path) -> str:
+        st = os.stat(path)
+        hit = self.memo.get(str(path))
+        if hit and hit[:2] == [st.st_size, st.st_mtime_ns]:
+            return hit[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 20), b""):
+                h.update(block)
+        self.memo[str(path)] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        return h.hexdigest()
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    h = hashlib.sha256(json.dumps(list(map(str, df.columns))).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+def code_digest(*objs) -> str:
+    return hashlib.sha256("".join(inspect.getsource(o) for o in objs).encode()).hexdigest()
+
+
+# ——— stages
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[], None]
+    inputs: Callable[[], List[str]]              # files whose content keys the stage
+    outputs: Callable[[], List[str]]
+    params: Dict = field(default_factory=dict)
+    code: tuple = ()                             # modules / functions whose source keys the stage
+    extra: Optional[Callable[[], str]] = None    # content digest not tied to whole files
+
+    def key(self, digests: Digests) -> str:
+        h = hashlib.sha256(json.dumps([self.name, self.params], sort_keys=True, default=str).encode())
+        h.update(code_digest(*self.code).encode() if self.code else b"")
+        for p in sorted(self.inputs()):
+            h.update(f"{p}:{digests.file(p)}".encode())
+        if self.extra is not None:
+            h.update(self.extra().encode())
+        return h.hexdigest()
+
+
+def _clean_csvs() -> List[str]:
+    """Clean league files in LEAGUE_ORDER, unknown leagues after them."""
+    from scrappers.Prp import league_from_filename
+    rank = {league: i for i, league in enumerate(LEAGUE_ORDER)}
+    return sorted(glob.glob(f"{CLEAN_DIR}/*.csv"),
+                  key=lambda p: (rank.get(league_from_filename(Path(p).name.replace("_clean", "")),
+                                          len(rank)), p))
+
+def _build(name: str) -> str:
+    return str(BUILD_DIR / name)
+
+def final_csv(pos: str) -> str:
+    return POSITIONS[pos]["csv"]
+
+
+def run_clean():
+    from scrappers import Prp
+    Prp.run(data_dir=Path(DATA_DIR), out_dir=Path(CLEAN_DIR))
+
+def run_concat():
+    df = pd.concat([pd.read_csv(p) for p in _clean_csvs()], ignore_index=True)
+    df.to_parquet(_build("combined.parquet"), index=False)
+
+def run_elo():
+    from scouting.clubs import load_elo, merge_elo
+    df = merge_elo(pd.read_parquet(_build("combined.parquet")), load_elo(ELO_CSV), CLUB_MAP)
+    df.to_parquet(_build("elo.parquet"), index=False)
+
+def run_rate():
+    from scouting.ratings import MODEL_PATHS, RatingCache, RatingService
+    df = pd.read_parquet(_build("elo.parquet"))
+    df = pd.concat([df[df["Position"] == pos] for pos in MODEL_PATHS], ignore_index=True)
+    service = RatingService(cache=RatingCache())
+    df["Rating"] = service.rate(df)
+    df.to_parquet(_build("rated.parquet"), index=False)
+
+def run_potential(as_of: str = AS_OF):
+    from scouting.scoring import build_database
+    build_database(pd.read_parquet(_build("rated.parquet")), today=pd.Timestamp(as_of)) \
+        .to_csv(DATABASE_CSV, index=False)
+
+
+def position_rows(db: pd.DataFrame, pos: str) -> pd.DataFrame:
+    """Every database row of the position, in database order — what KMeans is fitted on."""
+    return db[db["Position"] == POSITION_VALUES[pos]].copy()
+
+def previous_labels(df: pd.DataFrame, previous: pd.DataFrame) -> pd.Series:
+    """Cluster of each df row in `previous` (matched on MATCH_KEY), NaN where it is new."""
+    prev = previous.drop_duplicates(MATCH_KEY).set_index(MATCH_KEY)["Cluster"]
+    return pd.Series(pd.MultiIndex.from_frame(df[MATCH_KEY]).map(prev), index=df.index)
+
+def align_labels(labels: np.ndarray, prev: np.ndarray, k: int) -> np.ndarray:
+    """Renumber `labels` to best agree with `prev` (NaN = no previous label)."""
+    from scipy.optimize import linear_sum_assignment
+    known = ~np.isnan(prev)
+    overlap = np.zeros((k, k), dtype=np.int64)
+    np.add.at(overlap, (labels[known], prev[known].astype(np.int64) % k), 1)
+    new, old = linear_sum_assignment(-overlap)
+    return old[np.argsort(new)][labels]
+
+def warm_centers(X: np.ndarray, prev: np.ndarray, k: int) -> Optional[np.ndarray]:
+    """Mean of X over each previous cluster's players, None if one has none left."""
+    known = ~np.isnan(prev)
+    ids = prev[known].astype(np.int64) % k
+    counts = np.bincount(ids, minlength=k)
+    if not counts.all():
+        return None
+    sums = np.zeros((k, X.shape[1]))
+    np.add.at(sums, ids, X[known])
+    return sums / counts[:, None]
+
+def cluster_labels(df: pd.DataFrame, pos: str, previous: Optional[pd.DataFrame] = None):
+    """(labels, agreement, shared players) for one position's rows.
+
+    With a previous clustering, KMeans starts from its clusters' centroids
+    in the current PCA space, so a small data change moves only the players
+    near a boundary; without one it is the notebooks' recipe.
+    """
+    from sklearn.cluster import KMeans
+    from scouting.similarity import fit_pca_space
+
+    cfg = POSITIONS[pos]
+    k = len(cfg["cluster_names"])
+    _, _, X = fit_pca_space(df, cfg["features"])
+    if previous is None:
+        return KMeans(n_clusters=k, random_state=KMEANS_SEED).fit_predict(X), 1.0, 0
+
+    prev = previous_labels(df, previous).to_numpy(dtype=float)
+    centers = warm_centers(X, prev, k)
+    km = (KMeans(n_clusters=k, init=centers, n_init=1, tol=0, random_state=KMEANS_SEED) if centers is not None
+          else KMeans(n_clusters=k, random_state=KMEANS_SEED))
+    labels = align_labels(km.fit_predict(X), prev, k)
+    known = ~np.isnan(prev)
+    agreement = float((labels[known] == prev[known]).mean()) if known.any() else 1.0
+    return labels, agreement, int(known.sum())
+
+def cluster_position(pos: str, db_csv: str = DATABASE_CSV, min_agreement: float = MIN_AGREEMENT) -> str:
+    cfg = POSITIONS[pos]
+    df = position_rows(pd.read_csv(db_csv), pos)
+    out = final_csv(pos)
+    previous = pd.read_csv(out, usecols=MATCH_KEY + ["Cluster"]) if Path(out).exists() else None
+    labels, agreement, shared = cluster_labels(df, pos, previous)
+    if agreement < min_agreement:
+        raise RuntimeError(f"{pos}: only {agreement:.0%} of {shared} players keep their cluster "
+                           f"(< {min_agreement:.0%}); review POSITIONS['{pos}'] cluster names / "
+                           f"descriptions, then rerun with --min-agreement 0")
+    df["Cluster"] = labels
+    df["Cluster Name"] = df["Cluster"].map({c: v[0] for c, v in cfg["cluster_names"].items()})
+    if pos in DEDUPE_PLAYERS:                            # after predict, as the notebooks do
+        df = df.sort_values("Minutes", ascending=False).drop_duplicates(subset="Player")
+    df.to_csv(out, index=False)
+    return out
+
+def check_stability(db_csv: str = DATABASE_CSV, seed: int = KMEANS_SEED) -> Dict[str, float]:
+    """Agreement of each position's clustering after a one-cell edit of its rows.
+
+    Nothing is written; raises if a position falls below MIN_AGREEMENT.
+    """
+    rng = np.random.default_rng(seed)
+    db = pd.read_csv(db_csv)
+    result = {}
+    for pos, cfg in POSITIONS.items():
+        df = position_rows(db, pos)
+        previous = df[MATCH_KEY].assign(Cluster=cluster_labels(df, pos, None)[0])
+        row, col = rng.integers(len(df)), rng.choice(cfg["features"])
+        df.iloc[row, df.columns.get_loc(col)] += max(1.0, df[col].std())
+        result[pos] = cluster_labels(df, pos, previous)[1]
+        print(f"{pos:4s} {col} of row {row} edited: {result[pos]:.1%} keep their cluster")
+    bad = {p: a for p, a in result.items() if a < MIN_AGREEMENT}
+    if bad:
+        raise RuntimeError(f"unstable clustering after a one-cell edit: {bad}")
+    return result
+
+
+def run_export():
+    from scouting import store
+    from scouting.loader import build_artifact
+    from scouting.neighbours import build_index
+    from scouting.player_store import build_store
+
+    for csv_path in [final_csv(pos) for pos in POSITIONS] + [DATABASE_CSV] + _clean_csvs():
+        store.convert(csv_path)
+    build_store()
+    for pos in POSITIONS:
+        build_index(pos, build_artifact(pos).engine)
+
+
+def stages(as_of: str = AS_OF, min_agreement: float = MIN_AGREEMENT) -> List[Stage]:
+    from scouting import clubs, ratings, scoring
+    from scouting.player_store import PLAYERS_ARROW
+    from scrappers import Prp
+
+    def db_rows(pos: str) -> Callable[[], str]:
+        return lambda: frame_digest(position_rows(pd.read_csv(DATABASE_CSV), pos))
+
+    out = [
+        Stage("clean", run_clean, lambda: sorted(glob.glob(f"{DATA_DIR}/*.csv")), _clean_csvs,
+              Prp.settings(), (Prp,)),
+        Stage("concat", run_concat, _clean_csvs, lambda: [_build("combined.parquet")],
+              {"leagues": LEAGUE_ORDER}, (run_concat, _clean_csvs)),
+        Stage("elo", run_elo, lambda: [_build("combined.parquet"), ELO_CSV, CLUB_MAP],
+              lambda: [_build("elo.parquet")], code=(clubs,)),
+        Stage("rate", run_rate, lambda: [_build("elo.parquet"), *ratings.MODEL_PATHS.values()],
+              lambda: [_build("rated.parquet")], code=(run_rate, ratings)),
+        Stage("potential", partial(run_potential, as_of), lambda: [_build("rated.parquet")],
+              lambda: [DATABASE_CSV], {"as_of": as_of}, (run_potential, scoring)),
+    ]
+    for pos, cfg in POSITIONS.items():
+        out.append(Stage(f"cluster:{pos}", partial(cluster_position, pos, min_agreement=min_agreement),
+                         lambda: [], lambda pos=pos: [final_csv(pos)],
+                         {"features": cfg["features"], "k": len(cfg["cluster_names"]),
+                          "seed": KMEANS_SEED, "dedupe": pos in DEDUPE_PLAYERS},
+                         (cluster_position, cluster_labels, warm_centers, position_rows,
+                          previous_labels, align_labels), db_rows(pos)))
+    out.append(Stage("export", run_export,
+                     lambda: [final_csv(pos) for pos in POSITIONS] + [DATABASE_CSV],
+                     lambda: [str(PLAYERS_ARROW)], code=(run_export,)))
+    return out
+
+
+# ——— runner
+def run(force: List[str] = (), dry_run: bool = False, workers: int = WORKERS,
+        as_of: str = AS_OF, min_agreement: float = MIN_AGREEMENT) -> Dict[str, str]:
+    """Run every stage whose key changed; returns stage → 'ran' | 'skipped' | 'would run'."""
+    BUILD_DIR.mkdir(exist_ok=True)
+    state = json.loads(STATE_JSON.read_text()) if STATE_JSON.exists() else {}
+    digests = Digests(state.get("files"))
+    keys: Dict[str, str] = state.get("keys", {})
+    status: Dict[str, str] = {}
+
+    def fresh(stage: Stage) -> bool:
+        return (stage.name not in force and keys.get(stage.name) == stage.key(digests)
+                and all(Path(p).exists() for p in stage.outputs()))
+
+    def done(stage: Stage, seconds: float):
+        keys[stage.name] = stage.key(digests)            # after the run: stages may update inputs (club map)
+        status[stage.name] = "ran"
+        print(f"  ✓ {stage.name:<14} {seconds:7.2f}s")
+        STATE_JSON.write_text(json.dumps({"keys": keys, "files": digests.memo}, indent=1))
+
+    t0 = time.perf_counter()
+    all_stages = stages(as_of, min_agreement)
+    serial = [s for s in all_stages if not s.name.startswith("cluster:")]
+    clusters = [s for s in all_stages if s.name.startswith("cluster:")]
+
+    for stage in serial[:-1] + [None] + serial[-1:]:
+        batch = clusters if stage is None else [stage]
+        todo = [s for s in batch if not fresh(s)]
+        for s in batch:
+            if s not in todo:
+                status[s.name] = "skipped"
+                print(f"  = {s.name:<14} unchanged")
+        if dry_run:
+            for s in todo:
+                status[s.name] = "would run"
+                print(f"  → {s.name:<14} would run")
+            if todo:
+                break                                    # later keys depend on these outputs
+            continue
+        if stage is None and len(todo) > 1:
+            t = time.perf_counter()
+            with ProcessPoolExecutor(min(workers, len(todo))) as pool:
+                futures = [(s, pool.submit(s.run)) for s in todo]
+            errors = []
+            for s, fut in futures:                       # record the positions that did cluster
+                if fut.exception() is None:
+                    done(s, time.perf_counter() - t)
+                else:
+                    errors.append(fut.exception())
+                    print(f"  ✗ {s.name:<14} {fut.exception()}")
+            if errors:
+                raise errors[0]
+            continue
+        for s in todo:
+            t = time.perf_counter()
+            s.run()
+            done(s, time.perf_counter() - t)
+
+    counts = {k: sum(v == k for v in status.values()) for k in ("ran", "skipped", "would run")}
+    print(", ".join(f"{n} {k}" for k, n in counts.items() if n or k != "would run")
+          + f" in {time.perf_counter() - t0:.1f}s")
+    return status
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    pa = argparse.ArgumentParser()
+    pa.add_argument("--force", nargs="*", default=[], help="stages to rerun even if unchanged")
+    pa.add_argument("--dry-run", action="store_true", help="only report what would run")
+    pa.add_argument("--workers", type=int, default=WORKERS)
+    pa.add_argument("--as-of", default=AS_OF, help="reference date for Age (YYYY-MM-DD)")
+    pa.add_argument("--min-agreement", type=float, default=MIN_AGREEMENT,
+                    help="refuse a re-clustering keeping fewer players in their cluster")
+    pa.add_argument("--check-stability", action="store_true",
+                    help="only re-cluster each position after a one-cell edit and report agreement")
+    a = pa.parse_args()
+    if a.check_stability:
+        check_stability()
+        raise SystemExit
+    run(a.force, a.dry_run, a.workers, a.as_of, a.min_agreement)
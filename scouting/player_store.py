@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# player_store.py  ─────────────────────────────────────────────
+"""
+One canonical player table + small per-position sidecars.
+
+    python -m scouting.player_store      # build from the current CSVs
+
+store/players.arrow             every row of players_rating_potential_database,
+                                float32 stats (float64 PCA features) /
+                                categorical text, uncompressed Arrow IPC
+                                so it is memory-mapped, not parsed
+store/views/<pos>.rows.npy      int32 row ids of the position's players
+store/views/<pos>.cluster.npy   int32 KMeans labels, same order
+store/views/<pos>.pca.npy       float64 PCA coordinates, same order
+store/views/<pos>.joblib        the fitted (StandardScaler, PCA)
+
+Rows are laid out position by position, in the order of the
+final_df_<pos>_with_clusters.csv they came from, so a position's
+rows are one contiguous slice and position_view() is an Arrow slice
+of the shared mapped table rather than a copy of ~150 stat columns.
+Regenerating clusters only rewrites the sidecars (write_view).
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from scouting.positions import POSITIONS
+from scouting.similarity import fit_pca_space
+from scouting.store import STORE_DIR, to_columnar
+
+# ——— config
+PLAYERS_CSV   = "modelling_notebooks/players_rating_potential_database.csv"
+PLAYERS_ARROW = STORE_DIR / "players.arrow"
+VIEW_DIR      = STORE_DIR / "views"
+ROW_KEY       = ["Player", "Birthdate", "Club", "Minutes", "Position"]
+
+
+# ——— paths
+def view_path(pos: str, part: str) -> Path:
+    return VIEW_DIR / f"{pos}.{part}"
+
+def view_is_fresh(pos: str) -> bool:
+    """Sidecars exist and are at least as new as the position CSV and the database (those that exist)."""
+    rows = view_path(pos, "rows.npy")
+    if not (PLAYERS_ARROW.exists() and rows.exists()):
+        return False
+    built = rows.stat().st_mtime_ns
+    return all(not p.exists() or built >= p.stat().st_mtime_ns
+               for p in (Path(POSITIONS[pos]["csv"]), Path(PLAYERS_CSV)))
+
+
+# ——— build
+def write_view(pos: str, rows: np.ndarray, clusters: np.ndarray, df: pd.DataFrame):
+    """Sidecars for one position; `df` holds the rows' stats (for the PCA fit)."""
+    scaler, pca, df_pca = fit_pca_space(df, POSITIONS[pos]["features"])
+    VIEW_DIR.mkdir(parents=True, exist_ok=True)
+    np.save(view_path(pos, "cluster.npy"), np.asarray(clusters, dtype=np.int32))
+    np.save(view_path(pos, "pca.npy"), df_pca)
+    joblib.dump((scaler, pca), view_path(pos, "joblib"))
+    np.save(view_path(pos, "rows.npy"), np.asarray(rows, dtype=np.int32))   # last: marks the view fresh
+
+def build_store():
+    db = pd.read_csv(PLAYERS_CSV)
+    order, views = [], {}
+    start = 0
+    for pos, cfg in POSITIONS.items():
+        clus = pd.read_csv(cfg["csv"], usecols=ROW_KEY + ["Cluster"])
+        rows = clus[ROW_KEY].merge(db[ROW_KEY].reset_index(), on=ROW_KEY, how="left",
+                                   validate="one_to_one")["index"]      # a duplicate key would misalign the views
+        if rows.isna().any():
+            raise ValueError(f"{cfg['csv']}: {rows.isna().sum()} rows not found in {PLAYERS_CSV}")
+        order.append(rows.to_numpy(dtype=np.int64))
+        views[pos] = (np.arange(start, start + len(rows)), clus["Cluster"].to_numpy())
+        start += len(rows)
+
+    used = np.concatenate(order)
+    rest = np.setdiff1d(np.arange(len(db)), used)             # duplicates dropped by clustering
+    canonical = to_columnar(db.iloc[np.concatenate([used, rest])].reset_index(drop=True))
+
+    PLAYERS_ARROW.parent.mkdir(parents=True, exist_ok=True)
+    feather.write_feather(canonical, PLAYERS_ARROW, compression="uncompressed")
+    for pos, (rows, clusters) in views.items():
+        write_view(pos, rows, clusters, canonical.iloc[rows])
+
+
+# ——— read
+@lru_cache(maxsize=None)
+def _players(mtime_ns: int) -> pa.Table:
+    return pa.ipc.open_file(pa.memory_map(str(PLAYERS_ARROW))).read_all()
+
+def players_table() -> pa.Table:
+    return _players(PLAYERS_ARROW.stat().st_mtime_ns)
+
+def position_view(pos: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """The position's rows of the shared table, with Cluster / Cluster Name attached."""
+    rows = np.load(view_path(pos, "rows.npy"), mmap_mode="r")
+    start, n = int(rows[0]), len(rows)
+    if n and int(rows[-1]) != start + n - 1:
+        raise ValueError(f"{pos}: view rows are not contiguous, rebuild the store")
+
+    table = players_table().slice(start, n)                  # zero-copy
+    if columns is not None:
+        table = table.select([c for c in dict.fromkeys(columns) if c in table.column_names])
+
+    clusters = np.load(view_path(pos, "cluster.npy"))
+    names = {k: v[0] for k, v in POSITIONS[pos]["cluster_names"].items()}
+    table = table.append_column("Cluster", pa.array(clusters))
+    table = table.append_column("Cluster Name", pa.array(pd.Categorical(pd.Series(clusters).map(names))))
+    return table.to_pandas(split_blocks=True)
+
+def view_pca(pos: str) -> Tuple[object, object, np.ndarray]:
+    scaler, pca = joblib.load(view_path(pos, "joblib"))
+    return scaler, pca, np.load(view_path(pos, "pca.npy"), mmap_mode="r")
+
+
+# ——— CLI
+if __name__ == "__main__":
+    build_store()
+    print(f"→ {PLAYERS_ARROW}  ({PLAYERS_ARROW.stat().st_size >> 10} KB)")
+    for pos in POSITIONS:
+        print(f"   {pos}: {len(np.load(view_path(pos, 'rows.npy')))} rows")
@@ -0,0 +1,322 @@
+# positions.py  ─────────────────────────────────────────────
+"""
+Per-position configuration shared by the apps and the offline
+build steps: source CSV, the feature set the PCA space (and
+therefore the similarity search) is built on, radar features,
+cluster names/sizes and the tactical cluster descriptions.
+"""
+
+meta_cols = ["Player", "Birthdate", "Age", "League", "Club", "Footed", "Nationality", "Position", "Rating", "Potential", "Minutes"]
+
+# === FULLBACKS ===
+fullbacks_features = [
+    'Assists', 'Crosses', 'Crosses into Penalty Area',     # Chance creation from wide
+    'Progressive Carries', 'Progressive Carrying Distance',# Advancing play on the flanks
+    'Carries into Final Third',                            # Offensive contribution
+    'Touches (Att 3rd)',                                   # Time spent high up the pitch
+    'Pass Completion %', 'Pass Completion % (Long)',       # Passing security under pressure
+    'Live-ball Passes', 'Passes Attempted (Long)',         # Ability to vary distribution
+    'Progressive Passes', 'Progressive Passing Distance',  # Pushing team upfield
+    'Switches',                                            # Switching play across field
+    'Through Balls',                                       # Penetrative passes behind defense
+    'Blocks', 'Shots Blocked',                             # Defensive contributions
+    'Tackles (Def 3rd)', 'Tackles (Att 3rd)',              # Defensive actions at both ends
+    'Dribbles Challenged', 'SCA (Live-ball Pass)',         # Defensive duels and shot creation
+    'Fouls Committed', 'Fouls Drawn',                      # Defensive discipline and winning fouls
+    'Aerials Won',                                         # Aerial presence (defensive/offensive)
+    'Errors',                                              # Costly mistakes
+    'Ball Recoveries'                                      # Winning back possession
+]
+
+fb_radar_features = [                              
+    'npxG + xAG', 'Assists', 
+    'Crosses',                                              # Chance creation from wide
+    'Progressive Carrying Distance',                        # Advancing play on the flanks
+    'Carries into Final Third',                             # Offensive contribution
+    'Touches (Att 3rd)',                                    # Time spent high up the pitch
+    'Pass Completion %',                                    # Passing security under pressure
+    'Tackles (Def 3rd)',                                    # Defensive actions at both ends
+    'Dribbles Challenged', 'SCA (Live-ball Pass)',          # Defensive duels and shot creation
+    'Ball Recoveries'                                       # Winning back possession
+]
+
+fb_cluster_names = {0: ('Inverted Facilitators', 102),
+ 1: ('Dynamic Engines', 101),
+ 2: ('Offensive Catalysts', 57),
+ 3: ('Robust Wide Stoppers', 127),
+ 4: ('Two-Way Modernisers', 91)}
+
+fb_cluster_descriptions = {
+    "Inverted Facilitators": "This cluster aggregates players like Joško Gvardiol, Jules Koundé, Jurriën Timber, and Ben White—defenders traditionally raised as centre-backs but now operating as wide players, particularly in asymmetric back threes or fullback roles with conservative offensive mandates. Statistically, this group features the lowest involvement in progressive actions in the final third, as evidenced by modest averages in crosses into the penalty area (0.33), attacking third touches (17.18), and assists (0.06). However, they shine in high pass completion (82.1%) and defensive duels (1.26 tackles in the defensive third and 2.23 dribbles challenged), suggesting their primary function is ball retention, spatial compactness, and buildup stability.\n\nThese are not expansive fullbacks but rather secure facilitators who invert into midfield or back three structures to optimize circulation and balance. They are typically deployed in possession-dominant systems where the fullback is required to tuck inside—either to support the pivot (as in Guardiola’s 3-2-2-3) or reinforce rest defense principles.\n\nTactical Fit: Ideal for sides that play with fullback inversion principles—Manchester City, Arsenal, or Barcelona’s positional structures. Systems demanding high technical execution, numerical superiority in midfield, and proactive pressing value this profile highly.",
+
+    "Dynamic Engines": "Players like Alejandro Balde, Federico Dimarco, and Antonee Robinson headline this cluster, which displays high values in transitional activity and direct width exploitation. With over 4.35 crosses per 90 and almost two carries into the final third (1.93), this group operates with a pronounced verticality. Although their pass completion is lowest among all clusters (76.0%), this is a reflection of their high-risk, high-reward style—often required to serve as the primary source of width and progression on the flanks.\n\nThey maintain significant carrying output (2.9 progressive carries; 98m distance) and also show sharp attacking output via live-ball shot-creating actions (2.0 SCA), indicating their role as the attacking outlet in wide zones. Their defensive output is moderate, suggesting structural support behind them or systems that allow aggressive positioning high up the pitch.\n\nTactical Fit: Suited for high-octane systems leveraging wide overlaps and quick transitions. Think of Atalanta, Inter under Inzaghi, or Premier League sides playing transitional 4-3-3 shapes. Also well-suited to wingback roles in 3-4-2-1s or 3-5-2s where the player is expected to own the entire flank.",
+
+    "Offensive Catalysts": "Trent Alexander-Arnold, Achraf Hakimi, and Nuno Mendes define this cluster—a profile driven by elite offensive output and final-third orchestration. This group boasts the highest attacking third touches (24.3), most crosses into the penalty area (0.66), and the strongest passing creativity with 2.49 live-ball SCA. Their carrying distances (~120m) and touches in advanced zones point to their role as deep-lying chance creators or auxiliary playmakers from wide areas.\n\nInterestingly, they maintain decent balance in defensive metrics, with 1.06 defensive third tackles and 2.14 dribbles challenged—suggesting that while their primary value lies in progression and creation, they are not exempt from transitional recovery tasks. These are the fullbacks that transform wide spaces into launchpads for attack—often acting as a team’s second or third playmaker.\n\nTactical Fit: Best deployed in dominant teams with full-pitch occupation and possession control. Fits include Liverpool’s high-possession 4-3-3, PSG’s hybrid pressing system, or Bayern’s inverted transition schemes. Particularly effective in structures allowing for wide overloads and deep crossing profiles.",
+
+    "Robust Wide Stoppers": "Represented by players such as Denzel Dumfries, James Justin, and Vitaliy Mykolenko, this group thrives in high-duel, high-intensity environments. Their statistical profile is marked by modest ball progression (only 1.06 carries into the final third and 0.22 assists) but solid defensive output: 1.26 defensive third tackles and 2.22 dribbles challenged per match. They are more effective in ball-stopping than ball-carrying, with less emphasis on elaborate buildup or deep progression.\n\nTheir aerial win rate is also higher than average (above 1.1 per 90), suggesting a physical profile that contributes to second-ball recoveries and back-post defending. These fullbacks function best in medium blocks or reactive systems where solidity, recovery speed, and defensive aggression are prioritized over ball circulation.\n\nTactical Fit: Perfectly suited for Premier League mid-table sides or Serie A teams deploying deeper defensive lines. Tactically reliable in 4-4-2 mid blocks, 5-3-2 systems, or man-oriented pressing schemes that prioritize vertical compression and 1v1 defending.",
+
+    "Two-Way Modernisers": "This final group balances attacking and defensive duties with above-average contributions across most metrics without specializing to the extremes of creativity or suppression. Players like Lucas Digne, Daniel Muñoz, and Tyrick Mitchell populate this cluster, showcasing solid output in carrying (2.25 carries; 94.9m), crossing (3.3), and final-third involvement (~19 touches). Their pass completion sits at a respectable 79.4%, reflecting their involvement in both early-phase buildup and final-third circulation.\n\nDefensively, they remain consistent contributors, with 1.05 defensive third tackles and 2.14 dribbles challenged, and they rarely commit errors or fouls. These are dependable all-phase fullbacks that managers can trust to maintain tactical width, support midfielders, and protect wide defensive zones simultaneously.\n\nTactical Fit: These profiles are tactically flexible and fit a range of systems—from a 4-2-3-1 with overlapping responsibility to a balanced 4-3-3 or even wingback roles in more conservative 5-4-1 structures. They provide solutions for teams with less squad depth or that require multi-phase reliability from their fullbacks."
+}
+
+
+# === CENTER BACKS ===
+center_back_features = [
+    'Goals', 'Assists',                                # Set piece threat
+    'Pass Completion %', 'Pass Completion % (Long)',   # Build-up reliability
+    'Progressive Passes', 'Progressive Passing Distance', # Line-breaking passes
+    'Passes Attempted (Long)',                         # Direct balls out of defense
+    'Blocks', 'Shots Blocked',                         # Shot prevention
+    'Tackles (Def 3rd)', 'Tackles (Mid 3rd)',          # Defensive duels in own/mid half
+    'Tkl+Int',                                         # Ball-winning
+    'Aerials Won',                                     # Dominance in the air
+    'Ball Recoveries',                                 # Sweeping up behind line
+    'Fouls Committed', 'Yellow Cards', 'Red Cards',    # Discipline and aggression
+    'Touches (Def 3rd)',                               # Involvement in deep build-up
+    'GCA (Defensive Action)',                          # Direct defensive goal involvement
+    'SCA (Defensive Action)'                          # Direct defensive shot prevention
+]
+
+cb_radar_features = [                              
+    'npxG + xAG',
+    'Passes Attempted (Long)', 'Pass Completion % (Long)',   # Build-up reliability
+    'Progressive Passes', 'Progressive Passing Distance',                    # Line-breaking passes
+    'Blocks',                                          # Shot prevention
+    'Tkl+Int',                                         # Ball-winning
+    'Aerials Won',                                     # Dominance in the air
+    'Ball Recoveries',                                 # Sweeping up behind line
+    'Fouls Committed',                                 # Discipline and aggression
+    'Touches (Def 3rd)'                                 # Involvement in deep build-up
+    ]   
+
+cb_cluster_names = {0: ('Dominant Anchors', 83),
+ 1: ('Mobile Front-Foot Defenders', 20),
+ 2: ('Classical Defenders', 62),
+ 3: ('Balanced Ball-Players', 49),
+ 4: ('Elite Circulators', 74),
+ 5: ('Versatile Press Breakers', 28),
+ 6: ('No-Nonsense Guardians', 82),
+ 7: ('World-Class Hybrid Leaders', 51)}
+
+cb_cluster_descriptions = {
+    "Dominant Anchors": "This group consists of physically commanding center backs who impose themselves through aerial duels and penalty box presence. Players like Jannik Vestergaard and José María Giménez exemplify this category—combining above-average aerial wins (2.31), significant long pass involvement (9.55 per 90), and an assertive defensive presence with nearly 3 defensive actions per game (Tackles + Interceptions: 2.66). While their progressive carrying and passing volumes are relatively average, their centrality comes through in possession when launching longer distributions or covering deep zones. Their defensive third touches (37.1 per 90) confirm a role deeply embedded in low blocks. These are traditional stoppers who provide security over flair.\n\nTactical Fit: These players are tailored for deep defensive systems such as a compact 4-4-2 or a back-three with high central congestion. Their strengths lie in protecting the box and clearing second balls. Ideal in teams playing reactively or in leagues where direct football is dominant.",
+
+    "Mobile Front-Foot Defenders": "This cluster is headlined by players like Marquinhos and Ibrahima Konaté, combining mobile defending with forward-thinking instincts. Statistically, they balance strong progressive volume (3.88 progressive passes and ~339m progressive distance) with solid defensive output (2.67 tackles + interceptions). Their aerial success (2 per 90) is decent but not elite, hinting at profiles that favor recovery runs and anticipatory defense over physical dominance. They also possess one of the higher assist rates among clusters (0.0425), reinforcing the idea of defenders who step into midfield lines or break structure. Their foul rate is modest, and they exhibit intelligent timing with relatively low card incidence.\n\nTactical Fit: Suited for high defensive lines and systems that require proactive center backs—think Liverpool’s 4-3-3 or PSG’s hybrid back four. These defenders shine in possession-heavy teams needing speed in defensive transitions and positional flexibility.",
+
+    "Classical Defenders": "Cluster 2 gathers robust defenders who engage frequently but with conservative ball usage. With relatively low pass completion (77.5%) and long-ball reliance (~7.8 attempts per 90), these players like James Tarkowski and Gustavo Gómez are more reactive than proactive. Their defensive volume is high (3.15 tackles + interceptions), and aerial duels per 90 are near elite (2.99), indicating their strength in traditional duel-heavy settings. Touches in the defensive third are the lowest across all clusters (27.4), showing they operate in systems where the center back is rarely a ball progression outlet. They are among the more fouled-prone defenders (1.15 fouls per 90) and receive the most yellow cards, reflecting their rugged style.\n\nTactical Fit: Perfect for mid- or low-block defenses, especially in teams fighting relegation or operating with man-marking principles. A solid fit in back-fours where the center back is asked to win first balls and not initiate play.",
+
+    "Balanced Ball-Players": "This group represents center backs who bring a mix of technical security and defensive contribution. Featuring profiles like Lisandro Martínez and Willian Pacho, they maintain high pass accuracy (85.7%), mid-range progressive output (3.7 passes and ~299m distance), and a balanced aerial contribution (1.79 won per 90). Defensively, their volume is high (3.47 tackles + interceptions), and their touches indicate a steady involvement in buildup. Their foul count is stable, and their recovery actions suggest good reading of the game. These are modern center backs, capable of engaging but also guiding buildup through secure short and medium-range passing.\n\nTactical Fit: A natural fit in positional play structures such as 3-2-5 or 4-2-3-1 formations with emphasis on controlled buildup. These players are trusted to play through pressure, step into midfield, or split wide when needed.",
+
+    "Elite Circulators": "This cluster contains the most secure passers of all, boasting the highest pass completion (87.8%) and long ball accuracy (61.6%). Names like Rúben Dias and Benjamin Pavard dominate here. With moderate progressive passing numbers and high defensive reliability (Tkl+Int: 2.14), they represent elite “stabilizers” in possession-centric teams. They don’t register high defensive actions because they operate in structures that dominate territory. Their recoveries (3.5) and touches (30.1) are evidence of their constant involvement in buildup and spatial control.\n\nTactical Fit: Ideal for teams that monopolize the ball, such as Manchester City or Inter Milan. They thrive in systems where defensive actions are preventative, and the main role of the center back is to orchestrate passing chains and maintain structural discipline.",
+
+    "Versatile Press Breakers": "Players in this cluster (e.g., Militão, Fabian Schär, Salisu) are defined by their press resistance and verticality. They show the highest progressive pass volume (4.26 per 90) and a healthy long passing rate, yet with slightly less polish in pass accuracy (84.7%). Their defensive involvement remains solid (3.01 tackles + interceptions), and their touches profile them as key figures in transition setups. They're not pure destroyers nor metronomes, but hybrid center backs who often carry or pass through pressure. Their yellow card incidence is among the highest, indicating an aggressive engagement profile.\n\nTactical Fit: Best used in high-risk, high-reward setups such as pressing 3-4-3 or counter-pressing 4-2-3-1. These players can initiate attacks under pressure and recover aggressively when possession is lost.",
+
+    "No-Nonsense Guardians": "This archetype is rooted in simplicity and assertiveness. Players like Wout Faes and Conor Coady form a block of old-school defenders. Their long-ball usage is moderately high (~7.2 per 90), but their progressive volume is the lowest in the dataset (2.21 passes, 282m). However, they excel in raw defensive stats: strong aerial presence (2.63 won per 90), decent recoveries, and above-average shot blocking. They foul less than Cluster 2, and their card count is among the most contained, reflecting experienced timing over sheer aggression.\n\nTactical Fit: Suited for transitional Premier League sides or Championship-level systems emphasizing physical duels and set-piece security. Typically deployed in compact 4-4-2s or flat 5-back systems.",
+
+    "World-Class Hybrid Leaders": "This is the elite tier, featuring names like Virgil van Dijk, William Saliba, and Alessandro Bastoni. They combine best-in-class pass completion (90.5%), elite long pass accuracy (69.3%), and unrivaled defensive composure. Progressive metrics are top-tier (5.67 passes and 470m per 90), suggesting they are engines of buildup and diagonal progression. Their aerials and recoveries are robust, fouls are low, and defensive third touches are high (35+), portraying intelligent positioning and anticipation. They blend physical, technical, and cognitive traits seamlessly.\n\nTactical Fit: Built for elite positional play systems—whether it’s Guardiola’s City, Arteta’s Arsenal, or Inzaghi’s Inter. They are often the cornerstone of their team’s first phase and a key tool for control, capable of anchoring both high and mid blocks with equal assurance."
+}
+
+
+# === MIDFIELDERS ===
+midfielders_features = [
+    'Assists', 'npxG + xAG',                          # Playmaking and shot creation
+    'Progressive Carries', 'Progressive Carrying Distance', # Ball progression through midfield
+    'Touches (Att 3rd)', 'Touches (Def 3rd)',         # Influence in both halves
+    'Pass Completion %', 'Live-ball Passes',          # Ball security
+    'Progressive Passes', 'Progressive Passing Distance', # Advancing team forward
+    'Passes Attempted (Long)', 'Pass Completion % (Long)',# Range of passing
+    'Passes into Final Third', 'Switches',            # Penetrative and expansive passing
+    'Through Balls',                                  # Breaking lines
+    'SCA (Live-ball Pass)', 'SCA (Take-On)',          # Shot creation
+    'SCA (Defensive Action)',                         # Disrupting opponents before shots
+    'GCA (Live-ball Pass)', 'GCA (Defensive Action)', # Goal creation and last-ditch defending
+    'Tackles (Mid 3rd)',                              # Defensive work rate in midfield
+    'Tkl+Int',                                        # Ball-winning combined metric
+    'Blocks',                                         # Blocking passes/shots
+    'Ball Recoveries',                                # Regaining possession
+    'Fouls Committed', 'Fouls Drawn',                 # Physical/technical battle
+    'Aerials Won'                                     # Midfield duels                                     
+]
+
+mid_radar_features = [
+    'Goals', 'Assists', 'npxG + xAG',                          # Playmaking and shot creation
+    'Progressive Carries',                            # Ball progression through midfield
+    'Touches (Att 3rd)',                              # Influence in both halves
+    'Pass Completion %',                              # Ball security
+    'Progressive Passes',                             # Advancing team forward
+    'SCA (Live-ball Pass)',
+    'Tkl+Int',                                        # Ball-winning combined metric
+    'Ball Recoveries',                                # Regaining possession
+    'Fouls Committed'             # Physical/technical battle
+]
+
+mid_cluster_names = {0: ('Advanced Playmakers', 86),
+ 1: ('Tempo Dictators', 36),
+ 2: ('Vertical Connectors', 114),
+ 3: ('Supportive Engines', 48),
+ 4: ('All-Round Carriers', 115),
+ 5: ('Ball-Winning Specialists', 97),
+ 6: ('Hybrid Workhorses', 117)}
+
+mid_cluster_descriptions = {
+    "Advanced Playmakers": "This cluster groups players who combine creativity, progression, and goal involvement from advanced midfield positions. Profiles like Jude Bellingham, Martin Ødegaard, James Maddison, İlkay Gündoğan, and Bruno Guimarães define the archetype. These midfielders register the highest average non-penalty xG + xAG (0.33) and assists (0.18) across all clusters. They thrive in pockets between midfield and defense, operating as high-impact operators in the final third with progressive carries (2.56) and substantial carrying distance (~91m), while also sustaining over 21 touches in the attacking third per match.\n\nHowever, their defensive involvement remains moderate with only 2.18 tackles + interceptions, revealing a role structurally protected by deeper midfielders. These are your possession catalysts, dictating attacking rhythm through sharp positioning, tight-space awareness, and a vertical passing instinct (live-ball SCA: 2.34).\n\nTactical Fit: This profile flourishes in systems demanding final-third craft and structured rotations, notably in a 4-3-3 with false nine dynamics or a 3-2-5 with interior overloads. Think of them as your David Silva/Gündoğan types—fundamental to orchestrated final-third progression through combination play.",
+
+    "Tempo Dictators": "This cluster is composed of elite all-phase midfielders like Luka Modrić, Frenkie de Jong, Pedri, Nicolò Barella, and Joshua Kimmich—architects who influence possession, tempo, and transitions. Statistically, they are the most complete: boasting the highest pass completion (86.2%), progressive passes (9.19), and live-ball passes (75.8). They carry the ball over long distances (~133m per 90, highest in dataset), indicating a blend of press resistance and dynamism.\n\nDefensively, they contribute robustly with 2.59 tackles + interceptions, high recoveries (5.63), and above-average presence in both thirds. Their value lies in sustaining control through the middle third while enabling verticality under pressure. They have strong shot-creating contributions (2.64) despite lower direct assist or scoring figures, underlining their indirect creative influence.\n\nTactical Fit: These midfielders are essential in possession-oriented structures (4-3-3, 3-2-4-1) demanding technical leadership and progression from deeper zones. They act as relay hubs, often the metronomes behind more creative or explosive partners. Think Busquets, Kroos, or Xavi in modernized versions.",
+
+    "Vertical Connectors": "Midfielders in this cluster bridge defense and attack through purposeful movement and quick circulation, exemplified by players like Valverde, Gravenberch, Thomas Partey, and Zieliński. While their final-third output is modest (0.18 xG+xAG and 0.10 assists), they provide steady progression (1.31 carries, 6.4 progressive passes) and engage effectively in the defensive phase (2.93 tackles + interceptions, among highest).\n\nInterestingly, these profiles also register high touches in both defensive and attacking thirds, suggesting a box-to-box presence. They’re not primary creators, but rather glue players—cleaning transitions, sustaining width, and enabling stars around them to thrive.\n\nTactical Fit: Best suited for hybrid roles in double pivots or shuttling 8s in systems like a 4-2-3-1 or 3-1-4-2. Their athletic and technical balance allows them to perform high-tempo roles with defensive reliability and supporting structure.",
+
+    "Supportive Engines": "Players like Moisés Caicedo, Alexis Mac Allister, and Conor Gallagher belong here—midfielders with high defensive output and moderate progression metrics, tasked with supporting transitions and covering tactical imbalances. They exhibit 1.13 progressive carries and 3.4 progressive passes, slightly below average in terms of direct attacking involvement.\n\nWhat sets them apart is their defensive robustness: 4.05 tackles + interceptions, 5.48 recoveries, and excellent block numbers. These are players who thrive when tasked with defensive responsibilities and structural control, acting as stabilizers within dynamic or aggressive systems.\n\nTactical Fit: Ideal in high-pressing or mid-block setups, particularly in roles requiring intense coverage (4-2-3-1 destroyer, 3-4-3 wing-shadows). Their function is as the lungs and legs—not headline makers, but indispensable for controlling transitions and plugging gaps.",
+
+    "All-Round Carriers": "Featuring players like Mikel Merino, Frattesi, and McTominay, this cluster excels at ball-winning and transitional threat. Though their xG+xAG (0.21) is moderate, they contribute across the pitch with high carrying (1.08), solid physical output (4.14 recoveries, 2.77 tackles + interceptions), and the highest aerials won (1.28)—indicating duel strength and presence.\n\nThese midfielders are aggressive in their carries, tackle well in the mid-third, and are useful in both offensive and defensive transitions. They rank highest for fouls committed (1.50), which aligns with the profile of physically assertive midfielders disrupting rhythm and winning territory.\n\nTactical Fit: Perfect for systems needing high-volume carriers and box-to-box runners. Fits include 3-5-2 or 4-3-3 pressing shapes where second balls and duels dictate control. These are players who grind, carry, and compete—less refined, but tactically essential.",
+
+    "Ball-Winning Specialists": "This group features Eduardo Camavinga, Wilfred Ndidi, Idrissa Gueye, and Florentino Luís—pure defensive specialists. They produce the highest defensive actions across the board, with 4.05 tackles + interceptions, 5.48 recoveries, and 1.68 fouls committed. Their attacking impact is minimal (0.19 xG+xAG), reflecting a role centered on screening, disrupting, and recycling.\n\nWhile their progression is modest (3.4 progressive passes, low final-third touches), they anchor midfield structures with elite ball-winning and positional discipline. They aren’t tasked with risk—rather, they clean the platform for others to shine.\n\nTactical Fit: Best used as single pivots in elite systems (e.g., 4-3-3 with high fullbacks) or double pivots for defensive coverage (4-2-3-1). These are modern-day Makeleles: low flair, high impact. The system breathes because they hold its spine.",
+
+    "Hybrid Workhorses": "The final cluster consists of players like Zambo Anguissa, Kamara, and Robert Andrich—all-around profiles with balanced output across defense and progression. Statistically, they fall in the median of most metrics: 2.77 tackles + interceptions, 4.14 recoveries, 3.4 progressive passes, and ~75% pass completion.\n\nThese players are versatile and system-agnostic. While they don’t lead in any one category, they score solidly across all. Think of them as tactical Swiss knives—adaptable, reliable, but not elite specialists. This explains why they appear across a range of teams in rotational or stabilizing roles.\n\nTactical Fit: Valuable in squads needing tactical flexibility. Can slot into various systems (4-4-2 diamond, 3-4-3 hybrid press, or 4-3-3 box) depending on context. They offer coaching staff the ability to adjust shape and intensity without sacrificing structural coherence."
+}
+
+
+# === ATTACKING MIDS & WINGERS ===
+am_features = [
+    'Goals', 'Assists', 'npxG + xAG', 'Shots on Target', 'Goals/Shot', 'Average Shot Distance',
+    'Progressive Carries', 'Progressive Carrying Distance',
+    'Carries into Final Third', 'Carries into Penalty Area',
+    'Successful Take-Ons', 'Successful Take-On %', 'Touches (Att 3rd)', 'Touches (Att Pen)',
+    'Pass Completion %', 'Live-ball Passes', 'Progressive Passes', 'Progressive Passing Distance',
+    'Passes into Final Third', 'Passes into Penalty Area', 'Crosses', 'Crosses into Penalty Area',
+    'Through Balls', 'Switches', 'SCA (Live-ball Pass)', 'SCA (Take-On)', 'SCA (Shot)',
+    'GCA (Live-ball Pass)', 'GCA (Take-On)', 'GCA (Shot)', 'Miscontrols', 'Dispossessed', 'Fouls Drawn'
+]
+
+am_radar_features = [
+    "Goals", "Assists", "npxG + xAG", "Progressive Carries",
+    "Carries into Final Third", "Carries into Penalty Area",
+    "SCA (Live-ball Pass)", "SCA (Take-On)",
+    'Passes into Final Third', 'Passes into Penalty Area', 'Successful Take-Ons'
+]
+
+am_cluster_names = {
+    0: ("Hybrid Orchestrators", 121),
+    1: ("Direct Dribbling Threats", 164),
+    2: ("Secondary Attackers", 171),
+    3: ("Elite Technicians", 46),
+    4: ("World-Class Wingers", 75)
+}
+
+am_cluster_descriptions = {
+    "Hybrid Orchestrators": "These are players who thrive between the lines, acting as intelligent connectors between midfield and attack. Despite modest goal (0.19) and assist (0.19) outputs, their value lies in maintaining rhythm and exploiting micro-spaces. Their average shot distance (19.6m) suggests low central box occupation—opting instead for late arrivals or second-ball strikes.\n\nThey average 2.29 progressive carries and 78m in carrying distance, indicating a preference for subtle, tempo-driven advances rather than explosive dribbles. High \"live-ball pass SCA\" (2.57) and modest take-on creation reflect a reliance on structured possession.\n\nTactical Fit:\nIdeal for a 3-2-4-1 or 4-3-3 where positional rotations are essential. Think of them as the “Iniesta or Silva\" roles: not flamboyant, but crucial for synchronized ball movement.",
+    "Direct Dribbling Threats": "This cluster contains wide players with strong vertical thrust and final-third ambition. While goal output (0.23) is average, their shots on target per game (0.82) and progressive carrying distance (99m) showcase relentless ball progression.\n\nCrucially, they rank highest in take-on chance creation (0.36) and miscontrols (2.65), a statistical mark of risk-taking wingers who seek isolation duels. Carries into the final third (2.15) and switch plays are frequent, making them ideal for destabilizing defensive blocks.\n\nTactical Fit:\nFlourish in 4-2-3-1 or 4-3-3 setups that value wide penetration. Their role resembles Leroy Sané or Raheem Sterling: wing scorers with freedom to drive inside.",
+    "Secondary Attackers": "This group shows subdued final-third productivity (0.18 goals, 0.11 assists) but brings tactical discipline, vertical ball progression and defensive presence. They register 1.94 progressive carries (modest) and lower creative stats but compensate with intelligent movement and support play.\n\nFinal third carries (1.23) and low take-on contribution highlight a direct, no-nonsense profile. This is your pressing ten or inside midfielder who balances risk and retention.\n\nTactical Fit:\nPerfect as interior midfielders in 4-4-2 diamond or 3-4-2-1—trusted to shuttle, press, and deliver basic progression.",
+    "Elite Technicians": "This cluster blends elite-level output (0.30 goals, 0.27 assists) with orchestration. They average 0.82 shots on target, 3.10 progressive carries, and are the top cluster for total creative actions: Live-ball SCA: 3.54, Live-ball GCA: 0.42.\n\nThey're high-volume, high-impact creators who don’t merely support attacks—they initiate and end them. Their average shot distance is longest (20.05m), indicating confident shooters from range.\n\nTactical Fit:\nThese players are tactical nuclei in 3-2-2-3 or 4-2-3-1, where all final-third orchestration runs through them.",
+    "World-Class Wingers": "This cluster houses elite wingers and attacking midfielders with superior output across the board: Goals: 0.36, Assists: 0.26, Shots on target: 1.02, npxG+xAG: 0.56, Take-on SCA: 0.53 (highest).\n\nThey’re both creators and finishers—true reference points. With the highest progressive carries (5.08) and 135m carrying distance, they dominate wide zones or cut-inside lanes. They’re also the most frequently fouled, and least dispossessed.\n\nTactical Fit:\nIn a 3-2-5 or 2-3-5, these are your wide apexes. They pin full-backs, create gravity zones, and score double digits consistently. They don’t just fit into systems—they define them."
+}
+
+
+# === FORWARDS ===
+fw_features = [
+    'Goals', 'Assists', 'npxG + xAG',                 # Scoring and expected involvement
+    'Shots on Target', 'Goals/Shot',                  # Efficiency and quality of finishing
+    'Average Shot Distance',                          # Shot selection
+    'Touches (Att Pen)', 'Touches (Att 3rd)',         # Involvement in danger areas
+    'Progressive Carries',                            # Beating defenders and directness
+    'Carries into Penalty Area',                      # Penetration
+    'Pass Completion %', 'Live-ball Passes',          # Linking play
+    'SCA (Shot)', 'SCA (Take-On)', 'SCA (Live-ball Pass)', # All shot creation channels
+    'GCA (Shot)', 'GCA (Take-On)', 'GCA (Live-ball Pass)', # All goal creation channels
+    'Through Balls', 'Crosses',                       # Direct creativity
+    'Offsides',                                       # Movement behind defense
+    'Fouls Drawn',                                    # Provoking fouls, winning set pieces
+    'Aerials Won',                                    # Headers, target man play
+    'Miscontrols', 'Dispossessed'                     # Ball retention under pressure
+]
+
+fw_radar_features = [
+    'Goals', 'npxG + xAG',                                          # Scoring and expected involvement
+    'Goals/Shot', 'Average Shot Distance',                          # Shot selection
+    'Touches (Att Pen)', 'Touches (Att 3rd)',                       # Involvement in danger areas
+    'Carries into Penalty Area',                                    # Penetration
+    'GCA (Shot)', 'SCA (Take-On)', 'SCA (Live-ball Pass)',          # All goal creation channels
+    'Aerials Won',                                                  # Headers, target man play
+]
+
+fw_cluster_names = {0: ('Aerial Target Men', 68),
+ 1: ('Hybrid Line Leaders', 24),
+ 2: ('Creative Withdrawn Forwards', 33),
+ 3: ('Traditional Finishers', 33),
+ 4: ('Physical Disruptors', 80),
+ 5: ('Dynamic Strike-Runners', 82)
+ }
+
+fw_cluster_descriptions = {
+    "Aerial Target Men": "This group is best described as \"Aerial Target Men\"—forwards who act as the vertical reference point in positional attacks. With players like Rodrigo Muniz, Ludovic Ajorque, Paul Onuachu, and Vedat Muriqi, this archetype thrives on physical dominance, aerial duels, and high-contact duels in the box. The group posts a modest 0.30 goals and 0.09 assists per 90, but compensates with extremely high aerial duel wins (4.80 per 90) and a Goals/Shot ratio (0.12) indicative of their poaching quality. Their average shot distance is the lowest of all clusters (12.93m), confirming their close-range role, typically after holding off defenders or getting on the end of crosses. With relatively low progressive carry numbers (0.83) and attacking third touches (14.3), these players aren't tasked with creation or combination play but are finishers through and through. Tactical Fit: These strikers are optimal in low-block or mid-block systems where build-up bypasses midfield via long balls or where sustained wide attacks create consistent crossing scenarios. A team lacking physicality in the final third can utilize them to secure territory and absorb pressure. Best fit in 4-2-3-1 or 3-5-2 systems alongside a more mobile second striker or attacking midfielder.",
+
+    "Hybrid Line Leaders": "Cluster 1 presents a profile of \"Hybrid Line Leaders\", epitomized by Harry Kane, Kylian Mbappé, Julián Álvarez, and Viktor Gyökeres. These forwards combine scoring (0.54 goals/90) and creative output (0.27 assists/90) at a top-tier level, with a healthy xG+xAG of 0.66. They also lead all clusters in shots on target (1.33/90) while retaining strong Goals/Shot efficiency (0.13), suggesting shot selection isn't sacrificed for volume. These players operate across the entire attacking front—high in attacking third touches (23.1) and progressive carries (2.90), but equally capable in off-ball movement and transitions. Their high GCA (Goal-Creating Actions) from take-ons (0.10) and live-ball passes (0.39) implies the ability to beat players and create chances dynamically. Tactical Fit: These are universal forwards, adaptable across pressing, possession, and transitional systems. Whether leading the line solo in a 4-3-3 or pairing with a poacher in a 4-4-2 diamond, they can drop between lines to combine or threaten in behind. Ideal for systems requiring fluid interchanges and multifunctional attacking play, such as Manchester City, Arsenal, or Leipzig-style positional play.",
+
+    "Creative Withdrawn Forwards": "This profile features \"Creative Withdrawn Forwards\", with prototypes such as Antoine Griezmann, Paulo Dybala, and Albert Guðmundsson. These players post lower goal outputs (0.23 goals/90) but excel in deeper link-up roles, as shown by touches in the attacking third (19.2), progressive carries (2.09), and live-ball chance creation (0.16 GCA/90). Their higher average shot distance (18.3m) underlines their tendency to shoot from the edge of the box rather than poaching in the area. They also contribute modestly to through balls and crosses, playing in between the lines rather than making penetrating runs. Tactical Fit: Best suited as false nines or second strikers in asymmetric frontlines. They excel in ball-dominant systems that rely on half-space occupation and intelligent movement. Ideal for a 4-4-2 diamond (at the tip), 3-4-2-1 setups, or as wide creators in narrow 4-2-3-1 formations. These forwards are not primary scorers but enhance collective attacking patterns through subtlety and intelligence.",
+
+    "Traditional Finishers": "Cluster 3 gathers the \"Traditional Finishers\", a cohort of strikers with elite goal-scoring instincts and limited involvement in creation. Featuring Erling Haaland, Robert Lewandowski, Gonçalo Ramos, and Serhou Guirassy, these players top the group in goal output (0.74 goals/90) and non-penalty xG + xAG (0.76), with a robust 1.51 shots on target/90. They are low in carry volume (0.98 progressive carries) and rarely assist (0.07), reflecting a laser focus on end-product. They operate predominantly inside the box (average shot distance: 13.6m), thriving off final pass service rather than ball progression. Tactical Fit: These players demand high-volume chance creation systems and are most valuable when surrounded by playmakers. Ideal as the central pivot in a 4-2-3-1 or a front pairing in 3-5-2 with a more mobile second forward. They require tactical frameworks with width, cutbacks, and overloads to supply their finishing prowess.",
+
+    "Physical Disruptors": "This group, characterized as \"Physical Disruptors\", includes Jamie Vardy, Álvaro Morata, Joshua Zirkzee, and Evanilson. Statistically, they present moderate goal output (0.30) and modest assist values (0.07), but are disruptive through high involvement in aerials, fouls drawn (1.77), and off-ball movements (offside calls at 0.66 per 90). They average the highest crosses attempted (2.74) among forwards, indicating frequent wide positioning or interchanging roles. Their miscontrol and dispossession numbers are also high, underlining a raw, combative nature rather than finesse. Tactical Fit: These forwards excel in high-tempo pressing systems where aggression, movement, and chaos are assets. Suitable for counter-pressing or transitional teams such as Leipzig or Brighton. They can play as wide forwards in 4-3-3, or mobile center-forwards in 4-2-3-1 systems where the emphasis is on disrupting defensive shapes and attacking space.",
+
+    "Dynamic Strike-Runners": "Finally, we have the \"Dynamic Strike-Runners\", a modern breed headlined by Lautaro Martínez, Darwin Núñez, Marcus Thuram, and Ollie Watkins. These players are high-volume movers with excellent balance across goals (0.54), assists (0.15), and progressive actions (1.67 carries/90). They combine penalty-box instincts with the ability to stretch defenses. Posting strong shots on target (1.24) and touches in the attacking third (17.5), they embody the complete modern forward—able to lead transitions, engage defenders physically, and threaten in behind or on the ball. Tactical Fit: Best deployed in vertical, transition-heavy systems or hybrid possession models requiring pace and work-rate. Their capacity to press, run channels, and finish makes them ideal in 4-4-2 as split forwards or in narrow 4-3-3 setups. They can stretch backlines and attack space, serving as both scorers and pressure triggers."
+}
+
+
+# === POSITIONS ===
+POSITIONS = {
+    "fb": {
+        "label": "Fullbacks",
+        "title": "🎯 Full Backs",
+        "csv": "final_df_fb_with_clusters.csv",
+        "features": fullbacks_features,
+        "radar_features": fb_radar_features,
+        "cluster_names": fb_cluster_names,
+        "cluster_descriptions": fb_cluster_descriptions,
+        "table_extra": ["Goals"],
+    },
+    "cb": {
+        "label": "Center Backs",
+        "title": "🎯 Center Backs",
+        "csv": "final_df_cb_with_clusters.csv",
+        "features": center_back_features,
+        "radar_features": cb_radar_features,
+        "cluster_names": cb_cluster_names,
+        "cluster_descriptions": cb_cluster_descriptions,
+        "table_extra": [],
+    },
+    "mid": {
+        "label": "Midfielders",
+        "title": "🎯 Midfielders",
+        "csv": "final_df_mid_with_clusters.csv",
+        "features": midfielders_features,
+        "radar_features": mid_radar_features,
+        "cluster_names": mid_cluster_names,
+        "cluster_descriptions": mid_cluster_descriptions,
+        "table_extra": ["Goals"],
+    },
+    "am": {
+        "label": "Attacking Mids & Wingers",
+        "title": "🎯 Attacking Midfielders & Wingers",
+        "csv": "final_df_am_with_clusters.csv",
+        "features": am_features,
+        "radar_features": am_radar_features,
+        "cluster_names": am_cluster_names,
+        "cluster_descriptions": am_cluster_descriptions,
+        "table_extra": [],
+    },
+    "fw": {
+        "label": "Forwards",
+        "title": "🎯 Forwards",
+        "csv": "final_df_fw_with_clusters.csv",
+        "features": fw_features,
+        "radar_features": fw_radar_features,
+        "cluster_names": fw_cluster_names,
+        "cluster_descriptions": fw_cluster_descriptions,
+        "table_extra": [],
+    },
+}
+
+
+def position_columns(pos: str) -> list:
+    """Every column a position page reads: meta, clusters, table and radar features."""
+    cfg = POSITIONS[pos]
+    cols = meta_cols + ["Elo", "Cluster", "Cluster Name"] + cfg["table_extra"] + cfg["features"] + cfg["radar_features"]
+    return list(dict.fromkeys(cols))
@@ -0,0 +1,198 @@
+# radar.py  ─────────────────────────────────────────────
+"""
+Radar charts for the position pages, rendered once and cached.
+
+compare_radar(...) / cluster_radars(...) return rendered images
+(PNG bytes from Matplotlib, or an SVG string from the lightweight
+renderer below) out of a process-wide LRU keyed by position,
+player/cluster ids, features, the plotted values and the bounds —
+so a key can never point at a stale chart, and revisiting Cluster
+Profiles or re-comparing two players costs a dict lookup.
+
+Figures are built as bare matplotlib.figure.Figure objects (never
+registered with pyplot) and dropped right after savefig, so long
+sessions don't accumulate open figures.
+"""
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Callable, Hashable, List, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+# ——— config
+RADAR_RENDERER   = "matplotlib"     # or "svg": pure-string renderer, no Matplotlib
+RADAR_CACHE_SIZE = 256              # rendered charts kept per process
+RADAR_DPI        = 200              # what st.pyplot used
+
+Image = Union[bytes, str]           # PNG bytes or SVG markup
+
+
+# ——— LRU of rendered images
+class RenderCache:
+    """Shared by every Streamlit session (threads): the LRU is only touched under a lock."""
+
+    def __init__(self, maxsize: int = RADAR_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Image]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get_or_render(self, key: Hashable, render: Callable[[], Image]) -> Image:
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+        img = render()                                   # outside the lock: renders run concurrently
+        with self._lock:
+            self._data[key] = img
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return img
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+RADAR_CACHE = RenderCache()
+
+
+def _key_values(values) -> Tuple[float, ...]:
+    return tuple(float(v) for v in np.asarray(values, dtype=np.float64))
+
+def _scale(raw, lb, ub) -> np.ndarray:
+    range_vals = (ub - lb).replace(0, 1)
+    return ((raw - lb) / range_vals).clip(0, 1).to_numpy(dtype=np.float64)
+
+
+# ——— Matplotlib renderer
+def _png(fig: Figure) -> bytes:
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=RADAR_DPI, bbox_inches="tight")
+    fig.clear()
+    return buf.getvalue()
+
+def _mpl_compare(p1, p2, p1_raw, p2_raw, p1_scaled, p2_scaled, features) -> bytes:
+    angles = np.linspace(0, 2 * np.pi, len(features), endpoint=False).tolist() + [0]
+    p1_scaled, p2_scaled = np.append(p1_scaled, p1_scaled[0]), np.append(p2_scaled, p2_scaled[0])
+    p1_raw, p2_raw = np.append(p1_raw, p1_raw[0]), np.append(p2_raw, p2_raw[0])
+
+    fig = Figure(figsize=(6, 6))
+    ax = fig.add_subplot(projection="polar")
+    ax.plot(angles, p1_scaled, color="green", linewidth=2, label=p1)
+    ax.fill(angles, p1_scaled, color="green", alpha=0.25)
+    ax.plot(angles, p2_scaled, color="red", linewidth=2, label=p2)
+    ax.fill(angles, p2_scaled, color="red", alpha=0.25)
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(features, fontsize=8)
+    ax.set_yticks(np.linspace(0, 1, 10))
+    ax.set_yticklabels([])
+    for angle, val1, val2, scale1, scale2 in zip(angles[:-1], p1_raw[:-1], p2_raw[:-1], p1_scaled[:-1], p2_scaled[:-1]):
+        ax.text(angle, scale1 * 0.9, f"{val1:.2f}", ha='center', va='center', fontsize=7, color='green')
+        ax.text(angle, scale2 * 0.8, f"{val2:.2f}", ha='center', va='center', fontsize=7, color='red')
+    ax.legend(loc="upper right", bbox_to_anchor=(1.2, 1.1), fontsize=8)
+    return _png(fig)
+
+def _mpl_cluster(stats, raw_stats, features, title) -> bytes:
+    angles = np.linspace(0, 2 * np.pi, len(features), endpoint=False).tolist() + [0]
+    stats = np.concatenate((stats, [stats[0]]))
+    raw_stats = np.concatenate((raw_stats, [raw_stats[0]]))
+
+    fig = Figure(figsize=(7, 7))
+    ax = fig.add_subplot(projection="polar")
+    ax.plot(angles, stats, linewidth=2)
+    ax.fill(angles, stats, alpha=0.25)
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(features, fontsize=8)
+    ax.set_yticks(np.linspace(0, 1, 10))
+    ax.set_yticklabels([])
+    for angle, scaled_val, raw_val in zip(angles[:-1], stats[:-1], raw_stats[:-1]):
+        ax.text(angle, scaled_val * 0.8, f"{raw_val:.2f}", ha='center', va='center', fontsize=6)
+    ax.set_title(title, fontsize=11, y=1.1)
+    return _png(fig)
+
+
+# ——— lightweight SVG renderer
+_SVG_SIZE, _SVG_R = 560, 190
+
+def _svg_xy(angle: float, r: float) -> Tuple[float, float]:
+    c = _SVG_SIZE / 2
+    return c + r * _SVG_R * np.cos(angle), c - r * _SVG_R * np.sin(angle)
+
+def _svg_radar(series: Sequence[Tuple[str, str, np.ndarray, np.ndarray, float]],
+               features: List[str], title: str = "") -> str:
+    """series: (label, colour, scaled, raw, text radius factor) per polygon."""
+    angles = np.linspace(0, 2 * np.pi, len(features), endpoint=False)
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {_SVG_SIZE} {_SVG_SIZE}" '
+           f'font-family="sans-serif" style="background:white">']
+    if title:
+        out.append(f'<text x="{_SVG_SIZE / 2}" y="22" font-size="15" text-anchor="middle">{escape(title)}</text>')
+    for r in np.linspace(0, 1, 10)[1:]:
+        pts = " ".join(f"{x:.1f},{y:.1f}" for x, y in (_svg_xy(a, r) for a in angles))
+        out.append(f'<polygon points="{pts}" fill="none" stroke="#ddd"/>')
+    for a, feat in zip(angles, features):
+        x, y = _svg_xy(a, 1)
+        out.append(f'<line x1="{_SVG_SIZE / 2}" y1="{_SVG_SIZE / 2}" x2="{x:.1f}" y2="{y:.1f}" stroke="#ddd"/>')
+        lx, ly = _svg_xy(a, 1.12)
+        anchor = "start" if np.cos(a) > 0.1 else "end" if np.cos(a) < -0.1 else "middle"
+        out.append(f'<text x="{lx:.1f}" y="{ly:.1f}" font-size="11" text-anchor="{anchor}">{escape(feat)}</text>')
+    for i, (label, colour, scaled, raw, text_r) in enumerate(series):
+        pts = " ".join(f"{x:.1f},{y:.1f}" for x, y in (_svg_xy(a, s) for a, s in zip(angles, scaled)))
+        out.append(f'<polygon points="{pts}" fill="{colour}" fill-opacity="0.25" stroke="{colour}" stroke-width="2"/>')
+        for a, s, v in zip(angles, scaled, raw):
+            x, y = _svg_xy(a, s * text_r)
+            out.append(f'<text x="{x:.1f}" y="{y:.1f}" font-size="9" fill="{colour}" '
+                       f'text-anchor="middle" dominant-baseline="middle">{v:.2f}</text>')
+        if label:
+            out.append(f'<text x="{_SVG_SIZE - 10}" y="{40 + 16 * i}" font-size="12" fill="{colour}" '
+                       f'text-anchor="end">■ {escape(label)}</text>')
+    out.append("</svg>")
+    return "".join(out)
+
+
+# ——— public
+def compare_radar(pos: str, df: pd.DataFrame, p1: str, p2: str,
+                  features: List[str], lb: pd.Series, ub: pd.Series) -> Image:
+    p1_raw = df[df["Player"] == p1][features].values[0]
+    p2_raw = df[df["Player"] == p2][features].values[0]
+    key = ("compare", RADAR_RENDERER, pos, p1, p2, tuple(features),
+           _key_values(p1_raw), _key_values(p2_raw), _key_values(lb), _key_values(ub))
+
+    def render() -> Image:
+        p1_scaled, p2_scaled = _scale(p1_raw, lb, ub), _scale(p2_raw, lb, ub)
+        if RADAR_RENDERER == "svg":
+            return _svg_radar([(p1, "green", p1_scaled, p1_raw, 0.9),
+                               (p2, "red", p2_scaled, p2_raw, 0.8)], features)
+        return _mpl_compare(p1, p2, p1_raw, p2_raw, p1_scaled, p2_scaled, features)
+
+    return RADAR_CACHE.get_or_render(key, render)
+
+def cluster_radars(pos: str, df: pd.DataFrame, features: List[str], cluster_names: dict,
+                   lb: pd.Series, ub: pd.Series) -> List[Tuple[int, Image]]:
+    raw_means = df.groupby("Cluster")[features].mean()
+    scaled_means = ((raw_means - lb) / (ub - lb).replace(0, 1)).clip(0, 1)
+
+    charts = []
+    for cluster_id in raw_means.index:
+        stats = scaled_means.loc[cluster_id].values
+        raw_stats = raw_means.loc[cluster_id].values
+        name, size = cluster_names[cluster_id]
+        title = f"{name} (n={size})"
+        key = ("cluster", RADAR_RENDERER, pos, int(cluster_id), title, tuple(features),
+               _key_values(raw_stats), _key_values(lb), _key_values(ub))
+
+        def render(stats=stats, raw_stats=raw_stats, title=title) -> Image:
+            if RADAR_RENDERER == "svg":
+                return _svg_radar([("", "#1f77b4", stats, raw_stats, 0.8)], features, title)
+            return _mpl_cluster(stats, raw_stats, features, title)
+
+        charts.append((cluster_id, RADAR_CACHE.get_or_render(key, render)))
+    return charts
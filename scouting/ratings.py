@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# ratings.py  ─────────────────────────────────────────────
+"""
+Batch rating inference with the models/best_model_*.joblib pipelines.
+
+    python -m scouting.ratings [--out ratings.csv] [--workers 4] [--no-cache]
+
+rates every players_data_clean row (after the Elo merge) and prints
+rows/s per position.  The models were pickled with scikit-learn
+MODEL_SKLEARN (requirements.txt pins it); loading them under another
+version raises a RuntimeError saying so.  From Python:
+
+    service = RatingService()
+    df["Rating"] = service.rate(df)          # df needs Position + model features
+
+A model is loaded the first time it has rows to predict (the 2.5 MB
+AM forest only when there are uncached AM rows); its feature_names_in_
+are kept in MODEL_SCHEMA under the model file's digest, so a fully
+cached run never unpickles anything.  The features are checked
+against the frame before predicting: missing or
+non-numeric feature columns raise, rows with NaN features get a NaN
+rating.  Rows are predicted in (position, batch) tasks on a thread
+pool.  RatingCache keeps one rating per (model file digest, row hash of
+the model's features), so re-rating the database after a scrape only
+runs the models on new or changed rows.
+"""
+
+from __future__ import annotations
+import hashlib, json, threading, time, warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from scouting.store import STORE_DIR
+
+# ——— config
+MODEL_PATHS = {
+    "Center Backs":      "models/best_model_cb.joblib",
+    "Att Mid / Wingers": "models/best_model_am.joblib",
+    "Forwards":          "models/best_model_fw.joblib",
+    "Fullbacks":         "models/best_model_fb.joblib",
+    "Midfielders":       "models/best_model_mid.joblib",
+}
+RATING_CACHE  = STORE_DIR / "ratings_cache.parquet"
+MODEL_SCHEMA  = STORE_DIR / "model_features.json"
+BATCH_ROWS    = 4096
+WORKERS       = 4
+MODEL_SKLEARN = "1.5.2"         # scikit-learn the models were pickled with
+
+
+# ——— models
+def load_model(path: str):
+    """joblib.load, failing loudly when the installed scikit-learn is not the models' one."""
+    import sklearn
+    from sklearn.exceptions import InconsistentVersionWarning
+    hint = f"the models need scikit-learn=={MODEL_SKLEARN} (pip install -r requirements.txt)"
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", InconsistentVersionWarning)
+            return joblib.load(path)
+    except InconsistentVersionWarning as w:
+        raise RuntimeError(f"{path} was pickled with scikit-learn {w.original_sklearn_version}, "
+                           f"{sklearn.__version__} is installed: {hint}") from None
+    except (AttributeError, ImportError) as e:
+        raise RuntimeError(f"{path} cannot be unpickled with scikit-learn {sklearn.__version__} "
+                           f"({e}): {hint}") from e
+
+
+class RatingModels:
+    """Position label → fitted pipeline, loaded on first use."""
+
+    def __init__(self, paths: Dict[str, str] = MODEL_PATHS, schema: Optional[Path] = MODEL_SCHEMA):
+        self.paths = dict(paths)
+        self.schema = schema
+        self._models: Dict[str, object] = {}
+        self._tags: Dict[str, str] = {}
+        self._features: Dict[str, List[str]] = (
+            json.loads(Path(schema).read_text()) if schema is not None and Path(schema).exists() else {})
+        self._lock = threading.Lock()
+        self.load_s = 0.0
+
+    def model(self, position: str):
+        with self._lock:
+            if position not in self._models:
+                t = time.perf_counter()
+                self._models[position] = load_model(self.paths[position])
+                self.load_s += time.perf_counter() - t
+            return self._models[position]
+
+    def features(self, position: str) -> List[str]:
+        tag = self.tag(position)
+        if tag not in self._features:
+            self._features[tag] = list(self.model(position).feature_names_in_)
+            if self.schema is not None:
+                Path(self.schema).parent.mkdir(parents=True, exist_ok=True)
+                Path(self.schema).write_text(json.dumps(self._features, indent=1))
+        return self._features[tag]
+
+    def tag(self, position: str) -> str:
+        """Digest of the model file: cached ratings are only reused for the same model."""
+        if position not in self._tags:
+            self._tags[position] = hashlib.sha256(Path(self.paths[position]).read_bytes()).hexdigest()[:16]
+        return self._tags[position]
+
+
+def validate(df: pd.DataFrame, features: List[str], position: str) -> np.ndarray:
+    """Raise on missing / non-numeric feature columns; return the mask of rows without NaN features."""
+    missing = [c for c in features if c not in df.columns]
+    if missing:
+        raise ValueError(f"{position}: missing feature columns {missing}")
+    bad = [c for c in features if not pd.api.types.is_numeric_dtype(df[c])]
+    if bad:
+        raise ValueError(f"{position}: non-numeric feature columns {bad}")
+    return df[features].notna().all(axis=1).to_numpy()
+
+
+# ——— cache
+class RatingCache:
+    """(model tag, feature-row hash) → rating, persisted as Parquet."""
+
+    def __init__(self, path: Optional[Path] = RATING_CACHE):
+        self.path = path
+        self.dirty = False
+        self._lock = threading.Lock()
+        self._map: Dict[tuple, float] = {}
+        if path is not None and Path(path).exists():
+            t = pd.read_parquet(path)
+            self._map = dict(zip(zip(t["model"].tolist(), t["hash"].tolist()), t["Rating"].tolist()))
+
+    def lookup(self, tag: str, hashes: np.ndarray) -> np.ndarray:
+        return np.array([self._map.get((tag, h), np.nan) for h in hashes.tolist()], dtype=float)
+
+    def add(self, tag: str, hashes: np.ndarray, ratings: np.ndarray):
+        with self._lock:
+            self._map.update(zip(zip([tag] * len(hashes), hashes.tolist()), ratings.tolist()))
+            self.dirty = True
+
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        t = pd.DataFrame(list(self._map), columns=["model", "hash"]).astype({"hash": np.uint64})
+        t["Rating"] = list(self._map.values())
+        t.to_parquet(self.path, index=False)
+        self.dirty = False
+
+
+# ——— service
+class RatingService:
+    def __init__(self, models: Optional[RatingModels] = None, cache: Optional[RatingCache] = None,
+                 workers: int = WORKERS, batch_rows: int = BATCH_ROWS):
+        self.models = models or RatingModels()
+        self.cache = cache
+        self.workers, self.batch_rows = workers, batch_rows
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def rate(self, df: pd.DataFrame) -> pd.Series:
+        """Rating for every row of df (NaN for unknown positions / NaN features), same index."""
+        out = np.full(len(df), np.nan)
+        pos = df["Position"].to_numpy()
+        jobs = []                                    # (rows in df, position, X, hashes)
+        for position in self.models.paths:
+            rows = np.flatnonzero(pos == position)
+            if not len(rows):
+                continue
+            features = self.models.features(position)
+            sub = df.iloc[rows]
+            ok = validate(sub, features, position)
+            rows, X = rows[ok], sub.loc[ok, features]
+            s = self.stats.setdefault(position, {"rows": 0, "invalid": 0, "cached": 0,
+                                                 "predicted": 0, "predict_s": 0.0})
+            s["rows"] += len(ok)
+            s["invalid"] += int((~ok).sum())
+
+            if self.cache is not None:
+                hashes = pd.util.hash_pandas_object(X, index=False).to_numpy()
+                hit = self.cache.lookup(self.models.tag(position), hashes)
+                known = ~np.isnan(hit)
+                out[rows[known]] = hit[known]
+                s["cached"] += int(known.sum())
+                rows, X, hashes = rows[~known], X[~known], hashes[~known]
+            else:
+                hashes = None
+            for i in range(0, len(rows), self.batch_rows):
+                sl = slice(i, i + self.batch_rows)
+                jobs.append((rows[sl], position, X.iloc[sl], None if hashes is None else hashes[sl]))
+
+        def run(job):
+            rows, position, X, hashes = job
+            t = time.perf_counter()
+            y = self.models.model(position).predict(X)
+            out[rows] = y
+            with self._lock:
+                self.stats[position]["predicted"] += len(rows)
+                self.stats[position]["predict_s"] += time.perf_counter() - t
+            if self.cache is not None:
+                self.cache.add(self.models.tag(position), hashes, y)
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            list(pool.map(run, jobs))
+        if self.cache is not None:
+            self.cache.save()
+        return pd.Series(out, index=df.index, name="Rating")
+
+    def print_stats(self, elapsed: float):
+        print(f"  {'position':<20}{'rows':>7}{'cached':>8}{'predicted':>10}{'invalid':>8}{'rows/s':>11}")
+        for position, s in self.stats.items():
+            rps = s["predicted"] / s["predict_s"] if s["predict_s"] else float("nan")
+            print(f"  {position:<20}{s['rows']:>7}{s['cached']:>8}{s['predicted']:>10}{s['invalid']:>8}{rps:>11,.0f}")
+        n = sum(s["rows"] for s in self.stats.values())
+        print(f"  {n} rows in {elapsed:.3f}s → {n / elapsed:,.0f} rows/s end to end "
+              f"(model loading {self.models.load_s:.2f}s)")
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse, glob
+    from scouting.clubs import merge_elo
+
+    pa = argparse.ArgumentParser()
+    pa.add_argument("--clean-dir", default="players_data_clean")
+    pa.add_argument("--out", help="write the rated rows here")
+    pa.add_argument("--workers", type=int, default=WORKERS)
+    pa.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+    pa.add_argument("--no-cache", action="store_true", help="predict every row")
+    a = pa.parse_args()
+
+    df = merge_elo(pd.concat([pd.read_csv(p) for p in sorted(glob.glob(f"{a.clean_dir}/*.csv"))],
+                             ignore_index=True))
+    service = RatingService(cache=None if a.no_cache else RatingCache(),
+                            workers=a.workers, batch_rows=a.batch_rows)
+    t = time.perf_counter()
+    df["Rating"] = service.rate(df)
+    service.print_stats(time.perf_counter() - t)
+    if a.out:
+        df.to_csv(a.out, index=False)
+        print(f"→ {a.out}")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# scoring.py  ─────────────────────────────────────────────
+"""
+Minutes-adjusted rating and potential, vectorised over whole columns.
+
+    Rating    = model rating × minutes_factor(Minutes)
+                  Minutes < low_minutes    (Minutes / low_minutes) ** low_exponent
+                  Minutes > high_minutes   1 + high_boost · (Minutes − high_minutes)
+                                                         / (max Minutes − high_minutes)
+    EloBoost  = (Elo − median Elo) / median Elo          (0 without an Elo)
+    AgeMod    = min(age_pivot / Age, age_cap) ** age_weight
+    Potential = max(Rating · (1 + elo_weight · EloBoost) · AgeMod, Rating)
+
+Weights live in a Weights dataclass (defaults = the values the
+database was built with), so the app can re-weight on the fly:
+base_rating() undoes the minutes factor of a stored Rating, a
+ScoreBase keeps it with Minutes / Elo / Age as float arrays, and
+ScoreBase.score(weights) re-applies any Weights in one pass.  The
+max Minutes and median Elo are always the whole database's.
+
+    python -m scouting.scoring ratings.csv [--out players_rating_potential_database.csv]
+
+turns a frame with the raw model Rating (scouting.ratings --out)
+into the rating / potential database.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ——— config
+DATABASE_CSV = "modelling_notebooks/players_rating_potential_database.csv"
+
+
+@dataclass(frozen=True)
+class Weights:
+    low_minutes: float = 1000       # below: rating shrunk
+    high_minutes: float = 2000      # above: small boost up to the busiest player
+    low_exponent: float = 0.25
+    high_boost: float = 0.03
+    elo_weight: float = 0.2         # how strongly Elo affects potential
+    age_weight: float = 0.4         # boost for younger players
+    age_pivot: float = 24.0
+    age_cap: float = 1.5
+
+DEFAULT_WEIGHTS = Weights()
+
+
+# ——— kernels (arrays in, arrays out; NaN-safe)
+def minutes_factor(minutes, max_minutes: float, w: Weights = DEFAULT_WEIGHTS) -> np.ndarray:
+    m = np.asarray(minutes, dtype=float)
+    span = max(max_minutes - w.high_minutes, 1e-9)
+    with np.errstate(invalid="ignore"):
+        f = np.where(m < w.low_minutes, (np.clip(m, 0, None) / w.low_minutes) ** w.low_exponent,
+            np.where(m > w.high_minutes, 1 + w.high_boost * (m - w.high_minutes) / span, 1.0))
+    return np.where(np.isnan(m), 1.0, f)                 # missing minutes: rating unchanged
+
+def elo_boost(elo, reference: float) -> np.ndarray:
+    return np.nan_to_num((np.asarray(elo, dtype=float) - reference) / reference, nan=0.0)
+
+def age_modifier(age, w: Weights = DEFAULT_WEIGHTS) -> np.ndarray:
+    with np.errstate(divide="ignore"):
+        return np.minimum(w.age_pivot / np.asarray(age, dtype=float), w.age_cap) ** w.age_weight
+
+def potential(rating, elo, age, reference: float, w: Weights = DEFAULT_WEIGHTS) -> np.ndarray:
+    rating = np.asarray(rating, dtype=float)
+    p = rating * (1 + elo_boost(elo, reference) * w.elo_weight) * age_modifier(age, w)
+    return np.fmax(p, rating)                            # never below the current rating
+
+
+# ——— frames
+def age_from_birthdate(birthdate: pd.Series, today: Optional[pd.Timestamp] = None) -> pd.Series:
+    today = pd.Timestamp.today() if today is None else today
+    return ((today - pd.to_datetime(birthdate, errors="coerce")).dt.days / 365.25).round(0)
+
+def references(df: pd.DataFrame) -> Tuple[float, float]:
+    """(max Minutes, median Elo) of the whole database — the scale the formulas are relative to."""
+    return float(df["Minutes"].max()), float(df["Elo"].median())
+
+def base_rating(df: pd.DataFrame, max_minutes: Optional[float] = None,
+                w: Weights = DEFAULT_WEIGHTS) -> np.ndarray:
+    """Model rating behind a stored (minutes-adjusted) Rating column."""
+    max_minutes = references(df)[0] if max_minutes is None else max_minutes
+    return df["Rating"].to_numpy(dtype=float) / minutes_factor(df["Minutes"], max_minutes, w)
+
+def score(base: np.ndarray, df: pd.DataFrame, w: Weights = DEFAULT_WEIGHTS,
+          max_minutes: Optional[float] = None, reference_elo: Optional[float] = None
+          ) -> Tuple[np.ndarray, np.ndarray]:
+    """(Rating, Potential) for model ratings `base` and df's Minutes / Elo / Age."""
+    mx, ref = references(df)
+    return ScoreBase(np.asarray(base, dtype=float), df["Minutes"].to_numpy(dtype=float),
+                     df["Elo"].to_numpy(dtype=float), df["Age"].to_numpy(dtype=float),
+                     mx if max_minutes is None else max_minutes,
+                     ref if reference_elo is None else reference_elo).score(w)
+
+
+@dataclass(frozen=True)
+class ScoreBase:
+    """The inputs score() needs, as float arrays: re-weighting is then pure arithmetic."""
+    base: np.ndarray
+    minutes: np.ndarray
+    elo: np.ndarray
+    age: np.ndarray
+    max_minutes: float
+    reference_elo: float
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, max_minutes: float, reference_elo: float,
+                   w: Weights = DEFAULT_WEIGHTS) -> "ScoreBase":
+        """From a frame whose Rating was adjusted with `w` (see base_rating)."""
+        return cls(base_rating(df, max_minutes, w), df["Minutes"].to_numpy(dtype=float),
+                   df["Elo"].to_numpy(dtype=float), df["Age"].to_numpy(dtype=float),
+                   max_minutes, reference_elo)
+
+    def score(self, w: Weights = DEFAULT_WEIGHTS) -> Tuple[np.ndarray, np.ndarray]:
+        rating = self.base * minutes_factor(self.minutes, self.max_minutes, w)
+        return rating, potential(rating, self.elo, self.age, self.reference_elo, w)
+
+
+def build_database(rated: pd.DataFrame, w: Weights = DEFAULT_WEIGHTS,
+                   today: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """Rows with the raw model Rating → …, Elo, Age, Rating (adjusted), Potential."""
+    df = rated.copy()
+    df["Birthdate"] = pd.to_datetime(df["Birthdate"], errors="coerce")
+    df["Age"] = age_from_birthdate(df["Birthdate"], today)
+    base = df.pop("Rating").to_numpy(dtype=float)
+    df["Rating"], df["Potential"] = score(base, df, w)
+    return df
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse, dataclasses
+    pa = argparse.ArgumentParser()
+    pa.add_argument("rated", help="CSV with the raw model Rating (python -m scouting.ratings --out …)")
+    pa.add_argument("--out", default=DATABASE_CSV)
+    for f in dataclasses.fields(Weights):
+        pa.add_argument(f"--{f.name.replace('_', '-')}", type=float, default=f.default)
+    a = pa.parse_args()
+
+    w = Weights(**{f.name: getattr(a, f.name) for f in dataclasses.fields(Weights)})
+    db = build_database(pd.read_csv(a.rated), w)
+    db.to_csv(a.out, index=False)
+    print(f"→ {a.out}  ({len(db)} players, {(db['Potential'] > db['Rating']).sum()} with potential above rating)")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# shortlist.py  ─────────────────────────────────────────────
+"""
+similar_players_batch(art, targets, top_n=10, …)  →  long DataFrame
+
+Replacement planning for a whole squad / shortlist in one pass:
+the top-N similar players of every target come out of a single
+score_matrix() product instead of one Similarity Search per player.
+
+    python -m scouting.shortlist cb shortlist.csv --top 10 \\
+        --league PremierLeague --max-age 26 --min-minutes 1500 --out similar.csv
+
+shortlist.csv needs a 'Player' column.
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from scouting.loader import PositionArtifact
+from scouting.positions import meta_cols
+
+
+def candidate_mask(art: PositionArtifact, leagues: Optional[Sequence[str]] = None,
+                   max_age: Optional[float] = None,
+                   min_minutes: Optional[float] = None) -> np.ndarray:
+    """Boolean mask over player_index order for the optional filters."""
+    cand = art.df.iloc[art.engine.rows]
+    mask = np.ones(len(cand), dtype=bool)
+    if leagues:
+        mask &= cand["League"].isin(leagues).to_numpy()
+    if max_age is not None:
+        mask &= (cand["Age"] <= max_age).to_numpy()
+    if min_minutes is not None:
+        mask &= (cand["Minutes"] >= min_minutes).to_numpy()
+    return mask
+
+def similar_players_batch(art: PositionArtifact, targets: List[str], top_n: int = 10,
+                          leagues: Optional[Sequence[str]] = None,
+                          max_age: Optional[float] = None,
+                          min_minutes: Optional[float] = None,
+                          boost: float = 1.1) -> pd.DataFrame:
+    """
+    One row per (Target, Rank) with the match's Similarity and meta columns.
+    Raises KeyError listing targets that are not in this position.
+    """
+    missing = [t for t in targets if t not in art.player_index]
+    if missing:
+        raise KeyError(f"not in this position: {', '.join(missing)}")
+    targets = list(dict.fromkeys(targets))
+    if not targets:
+        return pd.DataFrame(columns=["Target", "Rank", "Player", "Similarity"])
+
+    mask = candidate_mask(art, leagues, max_age, min_minutes)
+    hits = art.engine.batch_query(targets, top_n, boost=boost, candidates=mask)
+
+    out = pd.DataFrame(
+        [(t, rank, name, score) for t in targets for rank, (name, score) in enumerate(hits[t], 1)],
+        columns=["Target", "Rank", "Player", "Similarity"],
+    )
+    meta = art.df.iloc[[art.player_index[p] for p in out["Player"]]][meta_cols[1:] + ["Cluster Name"]]
+    return pd.concat([out, meta.reset_index(drop=True)], axis=1)
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    from scouting.loader import build_artifact
+
+    pa = argparse.ArgumentParser()
+    pa.add_argument("position")
+    pa.add_argument("shortlist", help="CSV with a 'Player' column")
+    pa.add_argument("--top", type=int, default=10)
+    pa.add_argument("--league", action="append")
+    pa.add_argument("--max-age", type=float)
+    pa.add_argument("--min-minutes", type=float)
+    pa.add_argument("--out", default="similar_players.csv")
+    a = pa.parse_args()
+
+    art = build_artifact(a.position)
+    targets = pd.read_csv(a.shortlist)["Player"].dropna().tolist()
+    unknown = [t for t in targets if t not in art.player_index]
+    for t in unknown:
+        print(f"  ✗ {t} not found in {a.position}")
+    df = similar_players_batch(art, [t for t in targets if t not in unknown], a.top,
+                               a.league, a.max_age, a.min_minutes)
+    df.to_csv(a.out, index=False)
+    print(f"✓ {len(df)} rows for {df['Target'].nunique()} targets → {a.out}")
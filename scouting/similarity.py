@@ -0,0 +1,119 @@
+# similarity.py  ─────────────────────────────────────────────
+"""
+SimilarityEngine(df_pca, cluster_labels, player_index)
+
+Boosted-cosine similarity over the PCA space of one position.
+The PCA matrix is L2-normalised once, so a query is one
+matrix-vector product plus a vectorised cluster boost.
+
+Scores follow the apps' original definition:
+    cosine × 100, × boost when both players share a Cluster,
+    capped at 100, rounded to 2 decimals,
+and rankings break ties in `player_index` order, exactly like
+`sorted(..., key=lambda x: -x[1])` did over the per-player loop.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+PCA_VARIANCE = 0.95
+
+
+def fit_pca_space(df, features: List[str]) -> Tuple[StandardScaler, PCA, np.ndarray]:
+    """StandardScaler + PCA(95 % variance) over `features` — the space similarity lives in."""
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(df[features].to_numpy(dtype=np.float64))
+    pca = PCA(n_components=PCA_VARIANCE)
+    return scaler, pca, pca.fit_transform(X_scaled)
+
+
+def _unit_rows(X: np.ndarray) -> np.ndarray:
+    X = np.asarray(X, dtype=np.float64)
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0                  # zero vector → similarity 0, like sklearn
+    return X / norms
+
+
+def _boosted(sim: np.ndarray, same_cluster: np.ndarray, boost: float) -> np.ndarray:
+    sim = sim * 100
+    sim = np.where(same_cluster, sim * boost, sim)
+    return np.round(np.minimum(sim, 100), 2)
+
+
+def _rank(scores: np.ndarray, top_n: Optional[int]) -> np.ndarray:
+    """
+    Positions of `scores` sorted descending, ties by position.
+    With top_n, only the top_n best (argpartition, then exact sort).
+    """
+    n = len(scores)
+    if top_n is not None and top_n < n:
+        if top_n <= 0:
+            return np.empty(0, dtype=np.intp)
+        kth = np.partition(scores, n - top_n)[n - top_n]
+        cand = np.flatnonzero(scores >= kth)          # keeps every tie at the cut
+        order = cand[np.lexsort((cand, -scores[cand]))]
+        return order[:top_n]
+    pos = np.arange(n)
+    return np.lexsort((pos, -scores))
+
+
+class SimilarityEngine:
+    def __init__(self, df_pca, cluster_labels, player_index: Dict[str, int]):
+        self.player_index = player_index
+        self.names = np.array(list(player_index), dtype=object)
+        self.rows = np.fromiter(player_index.values(), dtype=np.intp, count=len(player_index))
+        self.unit = _unit_rows(df_pca)
+        self.labels = np.asarray(cluster_labels)
+        self._pos = {name: i for i, name in enumerate(player_index)}
+
+    # ——— single query
+    def scores(self, player_name: str, boost: float = 1.1) -> np.ndarray:
+        """Boosted score of `player_name` against every entry of player_index."""
+        base = self.player_index[player_name]
+        sim = self.unit[self.rows] @ self.unit[base]
+        return _boosted(sim, self.labels[self.rows] == self.labels[base], boost)
+
+    def score_matrix(self, player_names, boost: float = 1.1) -> np.ndarray:
+        """Boosted scores, one row per name in `player_names`, columns as in scores()."""
+        base = np.array([self.player_index[p] for p in player_names], dtype=np.intp)
+        sim = self.unit[base] @ self.unit[self.rows].T
+        same = self.labels[base][:, None] == self.labels[self.rows][None, :]
+        return _boosted(sim, same, boost)
+
+    def query(self, player_name: str, top_n: Optional[int] = None,
+              boost: float = 1.1) -> List[Tuple[str, float]]:
+        """
+        [(name, score), …] for every other player, best first.
+        Same output as the old per-player loop, truncated to top_n.
+        """
+        scores = self.scores(player_name, boost)
+        scores[self._pos[player_name]] = -np.inf       # never match the query player
+        n_others = len(scores) - 1
+        order = _rank(scores, n_others if top_n is None else min(top_n, n_others))
+        return [(self.names[i], float(scores[i])) for i in order]
+
+    def batch_query(self, player_names: List[str], top_n: int, boost: float = 1.1,
+                    candidates: Optional[np.ndarray] = None) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        query() for many players with one matrix-matrix product.
+        `candidates` is an optional boolean mask over player_index order
+        restricting who may be returned.
+        """
+        scores = self.score_matrix(player_names, boost)
+        if candidates is not None:
+            scores[:, ~np.asarray(candidates, dtype=bool)] = -np.inf
+        out = {}
+        for name, row in zip(player_names, scores):
+            row[self._pos[name]] = -np.inf
+            order = _rank(row, min(top_n, int(np.isfinite(row).sum())))
+            out[name] = [(self.names[i], float(row[i])) for i in order]
+        return out
+
+    def score(self, p1: str, p2: str, boost: float = 1.1) -> float:
+        i1, i2 = self.player_index[p1], self.player_index[p2]
+        sim = np.dot(self.unit[i1], self.unit[i2])
+        return float(_boosted(np.array([sim]), np.array([self.labels[i1] == self.labels[i2]]), boost)[0])
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# store.py  ─────────────────────────────────────────────
+"""
+Columnar copies of the player CSVs.
+
+    python -m scouting.store            # convert every known CSV
+
+writes store/<csv stem>.parquet with float32 stat columns and
+categorical League/Club/Nationality/Footed/Position/Cluster Name.
+The features the PCA spaces are fitted on stay float64, so
+similarity scores are those of the CSVs.
+read_table(csv, columns=…) reads only the requested columns from
+the Parquet copy when it is at least as new as the CSV, and falls
+back to parsing the CSV (same dtypes) otherwise.
+"""
+
+from __future__ import annotations
+import glob
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from scouting.positions import POSITIONS
+
+# ——— config
+STORE_DIR    = Path("store")
+CATEGORICAL  = ["League", "Club", "Nationality", "Footed", "Position", "Cluster Name"]
+PCA_FEATURES = {f for cfg in POSITIONS.values() for f in cfg["features"]}   # kept float64
+SOURCES      = (
+    sorted(glob.glob("final_df_*_with_clusters.csv"))
+    + ["modelling_notebooks/players_rating_potential_database.csv"]
+    + sorted(glob.glob("players_data_clean/*.csv"))
+)
+
+
+# ——— dtypes
+def to_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    """float64 → float32 (bar PCA_FEATURES), low-cardinality text → category."""
+    floats = df.select_dtypes(include="float64").columns.difference(list(PCA_FEATURES))
+    df = df.astype({c: np.float32 for c in floats})
+    for c in CATEGORICAL:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    return df
+
+
+# ——— paths
+def store_path(csv_path: str) -> Path:
+    return STORE_DIR / (Path(csv_path).stem + ".parquet")
+
+def source_path(csv_path: str) -> Path:
+    """The file read_table() will actually read for `csv_path`."""
+    pq = store_path(csv_path)
+    if pq.exists() and pq.stat().st_mtime_ns >= Path(csv_path).stat().st_mtime_ns:
+        return pq
+    return Path(csv_path)
+
+
+# ——— convert / read
+def convert(csv_path: str) -> Path:
+    out = store_path(csv_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    to_columnar(pd.read_csv(csv_path)).to_parquet(out, index=False)
+    return out
+
+def read_table(csv_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))            # drop repeats, keep order
+    src = source_path(csv_path)
+    if src.suffix == ".parquet":
+        return pd.read_parquet(src, columns=columns)
+    return to_columnar(pd.read_csv(src, usecols=columns)[columns] if columns else pd.read_csv(src))
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import sys
+    for csv_path in sys.argv[1:] or SOURCES:
+        out = convert(csv_path)
+        print(f"→ {csv_path}  →  {out}  ({Path(csv_path).stat().st_size >> 10} KB → {out.stat().st_size >> 10} KB)")
@@ -11,20 +11,29 @@ every player listed on SoFIFA in
 
 Handles Cloudflare (via cloudscraper) and skips the “+1” boost badge by
 pulling the rating from <em title="..">.
+
+Listing pages are fetched in parallel: the last page is found first
+(exponential probe + binary search over offsets, ~2·log2(pages)
+requests), then every page goes through a bounded pool behind the
+shared sofifa token bucket (scrappers.engine.HOST_POLICIES), and rows
+are yielded in page order.
 """
 
-import csv, random, time
+import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, Tuple, List
+from typing import Dict, Iterator, Tuple, List
 
 import cloudscraper
 from bs4 import BeautifulSoup
 
+from scrappers.engine import Limiter
+
 # ───────────── constants
 BASE          = "https://sofifa.com"
 LEAGUE_IDS    = [13, 14]        # PL, Championship
 ROWS_PER_PAGE = 60
-WAIT_MIN, WAIT_MAX = 1.2, 1.8
+WORKERS       = 4               # listing pages in flight (also capped by the host policy)
 SAVE_DIR      = Path("fc25_dump")
 OUT_CSV       = SAVE_DIR / "PL_CH_f24.csv"
 
@@ -38,57 +47,83 @@ SESSION.headers.update({
     "Referer": "https://google.com",
     "Connection": "keep-alive",
 })
+LIMITER = Limiter()
 
 # ───────────── helpers
 def fetch(url: str, retries: int = 3) -> str:
     for attempt in range(retries):
-        r = SESSION.get(url, timeout=30)
+        with LIMITER.slot(url):
+            r = SESSION.get(url, timeout=30)
         if r.status_code in (403, 429):
             t = 5 + attempt * 5
-            print(f"  {r.status_code} on {url} → sleep {t}s")
-            time.sleep(t); continue
+            print(f"  {r.status_code} on {url} → backing off {t}s")
+            LIMITER.host(url)[1].pause(t)                 # every worker backs off, not just this one
+            continue                                       # the paused bucket does the waiting
         r.raise_for_status(); return r.text
     raise RuntimeError(f"failed after {retries} tries → {url}")
 
 
-def league_rows(lg_ids: List[int]) -> Iterator[Tuple[str, str, str, int]]:
+def parse_listing(html: str) -> List[Tuple[str, str, str, int]]:
+    """(player_url, full_name, club_name, overall) for every row of one listing page."""
+    soup = BeautifulSoup(html, "lxml")
+    out = []
+    for tr in soup.select("table tbody tr"):
+        a_player = tr.select_one('a[href^="/player/"]')
+        if not a_player:
+            continue
+        full_name = a_player["data-tippy-content"]
+        player_url = BASE + a_player["href"]
+
+        # --- Overall -------------------------------------------
+        ovr_td = tr.select_one('td[data-col="oa"]')
+        em     = ovr_td.select_one("em")
+        try:
+            overall = int(em.get("title") or em.text.strip())
+        except ValueError:
+            continue                                  # malformed row
+
+        # --- Club name -----------------------------------------
+        club_tag = tr.select_one('a[href^="/team/"]')
+        club_name = club_tag.get_text(strip=True) if club_tag else ""
+
+        out.append((player_url, full_name, club_name, overall))
+    return out
+
+
+def _page_rows(query: str, page: int, seen: Dict[int, list]) -> list:
+    if page not in seen:
+        seen[page] = parse_listing(fetch(f"{BASE}/players?type=all&{query}&offset={page * ROWS_PER_PAGE}"))
+    return seen[page]
+
+def count_pages(query: str, seen: Dict[int, list]) -> int:
+    """Number of non-empty listing pages; probed pages are kept in `seen`."""
+    if not _page_rows(query, 0, seen):
+        return 0
+    lo, hi = 0, 1                                     # lo non-empty, hi unknown
+    while _page_rows(query, hi, seen):
+        lo, hi = hi, hi * 2
+    while hi - lo > 1:                                # lo non-empty, hi empty
+        mid = (lo + hi) // 2
+        if _page_rows(query, mid, seen):
+            lo = mid
+        else:
+            hi = mid
+    return lo + 1
+
+
+def league_rows(lg_ids: List[int], workers: int = WORKERS) -> Iterator[Tuple[str, str, str, int]]:
     """
     Yield (player_url, full_name, club_name, overall)
-    for all leagues in lg_ids.
+    for all leagues in lg_ids, in listing order.
     """
     query = "&".join([f"lg%5B%5D={i}" for i in lg_ids])
-    offset = 0
-
-    while True:
-        url  = f"{BASE}/players?type=all&{query}&offset={offset}"
-        soup = BeautifulSoup(fetch(url), "lxml")
-        rows = soup.select("table tbody tr")
-        if not rows:
-            break
-
-        for tr in rows:
-            a_player = tr.select_one('a[href^="/player/"]')
-            if not a_player:
-                continue
-            full_name = a_player["data-tippy-content"]
-            player_url = BASE + a_player["href"]
-
-            # --- Overall -------------------------------------------
-            ovr_td = tr.select_one('td[data-col="oa"]')
-            em     = ovr_td.select_one("em")
-            try:
-                overall = int(em.get("title") or em.text.strip())
-            except ValueError:
-                continue                                  # malformed row
-
-            # --- Club name -----------------------------------------
-            club_tag = tr.select_one('a[href^="/team/"]')
-            club_name = club_tag.get_text(strip=True) if club_tag else ""
-
-            yield player_url, full_name, club_name, overall
+    seen: Dict[int, list] = {}
+    n_pages = count_pages(query, seen)
+    print(f"  {n_pages} listing pages ({len(seen)} fetched to find the end)")
 
-        offset += ROWS_PER_PAGE
-        time.sleep(random.uniform(WAIT_MIN, WAIT_MAX))
+    with ThreadPoolExecutor(workers) as pool:
+        for rows in pool.map(lambda p: _page_rows(query, p, seen), range(n_pages)):
+            yield from rows
 
 
 
@@ -97,7 +132,7 @@ def main():
     SAVE_DIR.mkdir(exist_ok=True)
     with OUT_CSV.open("w", newline="", encoding="utf-8") as fh:
         w = csv.writer(fh)
-        w.writerow(["player_url", "full_name", "overall", "club_name"])
+        w.writerow(["player_url", "full_name", "club_name", "overall"])
 
         for i, row in enumerate(league_rows(LEAGUE_IDS), 1):
             w.writerow(row)
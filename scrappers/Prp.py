@@ -1,12 +1,39 @@
-import pandas as pd
+"""
+Clean the scraped league CSVs for the rating / clustering notebooks.
+
+    players_data/<League>_2024_25.csv  →  players_data_clean/<League>_2024_25_clean.csv
+
+League column inserted 3rd, rows with any NaN dropped, < MIN_MINUTES
+dropped, duplicate column labels removed.
+
+    python -m scrappers.Prp [League …] [--workers 4] [--chunksize 5000] [--force]
+
+or from Python:  run(leagues=["LaLiga"]).  Leagues are cleaned in
+parallel processes; each file is streamed in chunks with explicit
+dtypes (meta columns str, Minutes Int64, stats float64), so memory
+stays flat however large a league file gets.  A manifest in OUT_DIR
+records each input's size / mtime / sha256 and the settings it was
+cleaned with; unchanged leagues are skipped.  Timings are printed per
+league and stage (read, clean, write).
+"""
+
+from __future__ import annotations
+import hashlib, json, os, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-import re
+from typing import Dict, List, Optional
+
+import pandas as pd
 
 # ------------------------------------------------------------------
 DATA_DIR      = Path("players_data")          # where your CSVs live
 OUT_DIR       = Path("players_data_clean")    # cleaned files here
 MIN_MINUTES   = 500                           # cut-off
 NA_DROP_HOW   = "any"                         # drop rows with *any* NaN
+CHUNKSIZE     = 5_000                         # rows per streamed chunk
+WORKERS       = 4                             # leagues cleaned at once
+MANIFEST      = ".manifest.json"              # in OUT_DIR
+META_STR      = ["Player", "Birthdate", "Club", "Footed", "Nationality", "Position"]
 # ------------------------------------------------------------------
 
 def league_from_filename(fname: str) -> str:
@@ -31,15 +58,13 @@ def drop_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     return df.loc[:, ~df.columns.duplicated()]
 
-# ---------------------- main loop ---------------------------------
-OUT_DIR.mkdir(exist_ok=True)
-for csv_path in DATA_DIR.glob("*.csv"):
-    print(f"→ processing {csv_path.name}")
-
-    df = pd.read_csv(csv_path)
+def dtypes_for(csv_path: Path) -> Dict[str, object]:
+    """Explicit dtypes from the header: meta → str, Minutes → Int64, the rest float64."""
+    cols = pd.read_csv(csv_path, nrows=0).columns
+    return {c: str if c in META_STR else "Int64" if c == "Minutes" else "float64" for c in cols}
 
+def clean_chunk(df: pd.DataFrame, league: str) -> pd.DataFrame:
     # 1️⃣  add League column in 3rd position
-    league = league_from_filename(csv_path.name)
     df = insert_third(df, "League", league)
 
     # 2️⃣  row filtering
@@ -48,9 +73,132 @@ for csv_path in DATA_DIR.glob("*.csv"):
         df = df[df["Minutes"] >= MIN_MINUTES]
 
     # 3️⃣  deduplicate column names
-    df = drop_duplicate_columns(df)
+    return drop_duplicate_columns(df)
+
+
+# ---------------------- one league --------------------------------
+def clean_file(csv_path: Path, out_dir: Path = OUT_DIR, chunksize: int = CHUNKSIZE) -> Dict:
+    """Stream csv_path through clean_chunk into out_dir; returns rows, cols and stage seconds."""
+    league = league_from_filename(csv_path.name)
+    out_path = out_dir / csv_path.name.replace(".csv", "_clean.csv")
+    tmp = out_path.with_suffix(f".{os.getpid()}.tmp")
+    timings = {"read": 0.0, "clean": 0.0, "write": 0.0}
+    rows, cols = 0, 0
+
+    t = time.perf_counter()
+    try:
+        reader = pd.read_csv(csv_path, dtype=dtypes_for(csv_path), chunksize=chunksize)
+        with reader, open(tmp, "w", newline="", encoding="utf-8") as fh:
+            for chunk in reader:                    # t → t1: parsing this chunk
+                t1 = time.perf_counter()
+                timings["read"] += t1 - t
+
+                chunk = clean_chunk(chunk, league)
+                t2 = time.perf_counter()
+                timings["clean"] += t2 - t1
+
+                chunk.to_csv(fh, index=False, header=cols == 0)
+                rows, cols = rows + len(chunk), chunk.shape[1]
+                t = time.perf_counter()
+                timings["write"] += t - t2
+        os.replace(tmp, out_path)                    # never leave half a file behind
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return {"league": league, "file": csv_path.name, "out": out_path.name,
+            "rows": rows, "cols": cols, **timings}
+
+
+# ---------------------- manifest ----------------------------------
+def sha256_of(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def settings() -> Dict:
+    return {"min_minutes": MIN_MINUTES, "na_drop_how": NA_DROP_HOW}
+
+def load_manifest(out_dir: Path) -> Dict[str, Dict]:
+    p = out_dir / MANIFEST
+    return json.loads(p.read_text()) if p.exists() else {}
+
+def save_manifest(out_dir: Path, manifest: Dict[str, Dict]):
+    p = out_dir / MANIFEST
+    tmp = p.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(tmp, p)
+
+def unchanged(csv_path: Path, entry: Optional[Dict], out_dir: Path) -> bool:
+    """Same settings, output present, and same size/mtime (or, failing that, same sha256)."""
+    if not entry or entry.get("settings") != settings() or not (out_dir / entry["out"]).exists():
+        return False
+    st = csv_path.stat()
+    if (st.st_size, st.st_mtime_ns) == (entry["size"], entry["mtime_ns"]):
+        return True
+    if st.st_size == entry["size"] and sha256_of(csv_path) == entry["sha256"]:
+        entry["mtime_ns"] = st.st_mtime_ns          # touched, not changed
+        return True
+    return False
+
+
+# ---------------------- pipeline ----------------------------------
+def run(leagues: Optional[List[str]] = None, data_dir: Path = DATA_DIR, out_dir: Path = OUT_DIR,
+        workers: int = WORKERS, chunksize: int = CHUNKSIZE, force: bool = False) -> List[Dict]:
+    """Clean every (or the given) league CSV that changed since the last run."""
+    out_dir.mkdir(exist_ok=True)
+    manifest = load_manifest(out_dir)
+    csvs = [p for p in sorted(data_dir.glob("*.csv"))
+            if not leagues or league_from_filename(p.name) in leagues]
+
+    todo = [p for p in csvs if force or not unchanged(p, manifest.get(p.name), out_dir)]
+    for p in csvs:
+        if p not in todo:
+            print(f"  = {p.name}  unchanged, skipped")
+
+    t0 = time.perf_counter()
+    results, errors = [], []
+    try:
+        if todo:
+            with ProcessPoolExecutor(min(workers, len(todo))) as pool:
+                futures = {pool.submit(clean_file, p, out_dir, chunksize): p for p in todo}
+                for fut in as_completed(futures):   # record each league as soon as it is done
+                    p = futures[fut]
+                    try:
+                        r = fut.result()
+                    except Exception as e:
+                        errors.append(e)
+                        print(f"✗ {p.name}  failed: {e}")
+                        continue
+                    st = p.stat()
+                    manifest[p.name] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                                        "sha256": sha256_of(p), "settings": settings(), "out": r["out"]}
+                    results.append(r)
+                    print(f"→ {r['file']}  saved → {r['out']}  ({r['rows']} rows, {r['cols']} cols)  "
+                          f"read {r['read']:.2f}s  clean {r['clean']:.2f}s  write {r['write']:.2f}s")
+    finally:
+        save_manifest(out_dir, manifest)            # keep the leagues that did finish
+    if errors:
+        raise errors[0]
+
+    if results:
+        total = {k: sum(r[k] for r in results) for k in ("read", "clean", "write")}
+        print(f"{len(results)} cleaned, {len(csvs) - len(todo)} skipped in "
+              f"{time.perf_counter() - t0:.2f}s wall  "
+              f"(read {total['read']:.2f}s  clean {total['clean']:.2f}s  write {total['write']:.2f}s summed)")
+    return results
+
 
-    # write back
-    out_path = OUT_DIR / csv_path.name.replace(".csv", "_clean.csv")
-    df.to_csv(out_path, index=False)
-    print(f"   saved → {out_path.name}  ({len(df)} rows, {df.shape[1]} cols)")
+# ---------------------- CLI ---------------------------------------
+if __name__ == "__main__":
+    import argparse
+    pa = argparse.ArgumentParser()
+    pa.add_argument("leagues", nargs="*")
+    pa.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    pa.add_argument("--out-dir", type=Path, default=OUT_DIR)
+    pa.add_argument("--workers", type=int, default=WORKERS)
+    pa.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    pa.add_argument("--force", action="store_true", help="clean even unchanged leagues")
+    a = pa.parse_args()
+    run(a.leagues, a.data_dir, a.out_dir, a.workers, a.chunksize, a.force)
@@ -1,30 +1,52 @@
 #!/usr/bin/env python
 """
-Read url_players_belgian_league_2025.csv (col “player_url”),
+Read one league's url_players_*.csv (col “player_url”),
 convert each *profile* URL to its scouting-report URL, and scrape
-players with ≥10 s between request starts.
+players through ScrapeEngine: fbref requests start WAIT_SECONDS apart
+(token bucket), parsing overlaps the waits.  Pages are kept in the
+HTML cache, so a re-run or `python -m scrappers.html_cache reparse`
+never downloads them again.
+
+    python -m scrappers.SafeScrapper [LIST_CSV OUT_CSV] [--delta]
+
+--delta (weekly in-season refresh): fetch the league's Standard Stats
+page once (LEAGUE_LISTINGS), and re-scrape only players that are new
+or whose listed minutes differ from those stored at their last scrape;
+their scouting reports are revalidated past the cache TTL.  Players
+scraped before listed minutes were recorded count as changed, so the
+first delta run of a league re-scrapes it once.
+
+For every league at once see scrappers/jobs.py.
 """
 
-import csv, time, shelve, pathlib
-from datetime import datetime
-from urllib.parse import urlparse, urlunparse
+import time
+from pathlib import Path
 
 import pandas as pd
-from tenacity import retry, wait_fixed, stop_after_attempt, retry_if_exception_type
-import requests
 
-from scrappers.fbref_scraper import scrape_player
+from scrappers.engine import HOST_POLICIES, HostPolicy, Limiter, ScrapeEngine
+from scrappers.fbref_scraper import fetch_page, parse_league_minutes, parse_player
+from scrappers.html_cache import HtmlCache
+from scrappers.results_db import RESULTS_DB, ScrapeStore
 
 # ——— config
 LIST_CSV          = "url_players_netherlands_league_2025.csv"
 OUT_CSV           = "Eredivisie_2024_25.csv"
-CHECKPOINT_DB     = "scrape_checkpoint.db"
 WAIT_SECONDS      = 6.1
 SCOUT_CONST       = "12586"        # same for all players / season
 
-HEADERS = {"User-Agent":
-   "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-   "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
+LEAGUE_LISTINGS = {               # league → fbref Standard Stats page (minutes per player)
+    "BelgianPro":           "https://fbref.com/en/comps/37/stats/Belgian-Pro-League-Stats",
+    "CampeonatoBrasileiro": "https://fbref.com/en/comps/24/stats/Serie-A-Stats",
+    "PremierLeague":        "https://fbref.com/en/comps/9/stats/Premier-League-Stats",
+    "EFLChampionship":      "https://fbref.com/en/comps/10/stats/Championship-Stats",
+    "Ligue1":               "https://fbref.com/en/comps/13/stats/Ligue-1-Stats",
+    "Bundesliga":           "https://fbref.com/en/comps/20/stats/Bundesliga-Stats",
+    "SerieA":               "https://fbref.com/en/comps/11/stats/Serie-A-Stats",
+    "Eredivisie":           "https://fbref.com/en/comps/23/stats/Eredivisie-Stats",
+    "PrimeiraLiga":         "https://fbref.com/en/comps/32/stats/Primeira-Liga-Stats",
+    "LaLiga":               "https://fbref.com/en/comps/12/stats/La-Liga-Stats",
+}
 
 # ——— helpers
 def profile_to_scout(url: str) -> str:
@@ -36,69 +58,83 @@ def profile_to_scout(url: str) -> str:
     pid, slug = parts[-2], parts[-1]
     return f"https://fbref.com/en/players/{pid}/scout/{SCOUT_CONST}/{slug}-Scouting-Report"
 
-def load_profiles() -> list[str]:
-    df = pd.read_csv(LIST_CSV)
+def load_profiles(list_csv: str = LIST_CSV) -> list[str]:
+    df = pd.read_csv(list_csv)
     if "player_url" not in df.columns:
         raise ValueError("CSV must have 'player_url' column")
     return df["player_url"].dropna().tolist()
 
-def already_done(db) -> set[str]:
-    if not pathlib.Path(db).exists():
-        return set()
-    with shelve.open(db) as s:
-        return set(s.keys())
-
-def mark_done(db, url):
-    with shelve.open(db) as s:
-        s[url] = datetime.utcnow().isoformat(timespec="seconds")
-
-# ——— strict-rate wrapper around scrape_player
-class TooManyRequests(Exception): ...
-
-@retry(wait=wait_fixed(10), stop=stop_after_attempt(4),
-       retry=retry_if_exception_type(TooManyRequests), reraise=True)
-def safe_scrape(url):
-    try:
-        return scrape_player(url)
-    except requests.HTTPError as e:
-        if e.response.status_code == 429:
-            raise TooManyRequests from e
-        raise
+def league_of(out_csv: str) -> str:
+    """'Eredivisie_2024_25.csv' → 'Eredivisie' (the key in the results DB)."""
+    return Path(out_csv).stem.rsplit("_", 2)[0]
+
+# ——— strict-rate engine around fetch + parse (429 → pause fbref, retry)
+def make_limiter() -> Limiter:
+    return Limiter({**HOST_POLICIES, "fbref.com": HostPolicy(rate=1 / WAIT_SECONDS)})
+
+def make_engine(limiter: Limiter = None, revalidate: bool = False) -> ScrapeEngine:
+    """revalidate=True skips fresh cache hits: every page is (conditionally) re-fetched."""
+    cache = HtmlCache()
+    return ScrapeEngine(cache.fetcher(fetch_page), parse_player, limiter or make_limiter(),
+                        cache=None if revalidate else cache)
+
+# ——— delta mode
+def listed_minutes(league: str, limiter: Limiter) -> dict:
+    """Profile URL → minutes from the league's Standard Stats page (one request)."""
+    url = LEAGUE_LISTINGS[league]
+    with limiter.slot(url):
+        return parse_league_minutes(fetch_page(url).text)
+
+def changed(profiles: list, listed: dict, stored: dict) -> list:
+    """Profiles never scraped, or whose listed minutes moved since their last scrape."""
+    return [u for u in profiles if u not in stored or (u in listed and listed[u] != stored[u])]
 
 # ——— main loop
-def main():
-    profiles = load_profiles()
-    done = already_done(CHECKPOINT_DB)
-    todo = [u for u in profiles if u not in done]
-    print(f"{len(todo)} of {len(profiles)} remaining")
-
-    csv_exists = pathlib.Path(OUT_CSV).exists()
-    with open(OUT_CSV, "a", newline="", encoding="utf-8") as fh:
-        writer = None
-        last_start = 0.0
-
-        for i, purl in enumerate(todo, 1):
-            # hard wait
-            dt = time.perf_counter() - last_start
-            if dt < WAIT_SECONDS:
-                time.sleep(WAIT_SECONDS - dt)
-            last_start = time.perf_counter()
-
-            scout_url = profile_to_scout(purl)
-            try:
-                df = safe_scrape(scout_url)
-                if writer is None:
-                    writer = csv.DictWriter(fh, fieldnames=df.columns)
-                    if not csv_exists:
-                        writer.writeheader()
-                writer.writerow(df.iloc[0].to_dict())
-                fh.flush()
-                mark_done(CHECKPOINT_DB, purl)
-                print(f"[{i}/{len(todo)}] ✓ {df.at[0,'Player']}")
-            except Exception as e:
-                print(f"[{i}/{len(todo)}] ✗ {purl}\n  {e}")
-
-    print("Done, rows in", OUT_CSV)
+def main(list_csv: str = LIST_CSV, out_csv: str = OUT_CSV, db: str = RESULTS_DB, delta: bool = False):
+    league = league_of(out_csv)
+    limiter = make_limiter()
+    with ScrapeStore(db) as store:
+        profiles = load_profiles(list_csv)
+        if delta:
+            listed = listed_minutes(league, limiter)
+            todo = changed(profiles, listed, store.listed_minutes(league))
+            print(f"{len(todo)} of {len(profiles)} new or with changed minutes")
+        else:
+            listed = {}
+            done = store.done(league)
+            todo = [u for u in profiles if u not in done]
+            print(f"{len(todo)} of {len(profiles)} remaining")
+
+        scout_urls = {profile_to_scout(u): u for u in todo}
+        engine = make_engine(limiter, revalidate=delta)
+        t0 = time.perf_counter()
+        added = n = 0
+
+        try:
+            for i, (scout_url, res) in enumerate(engine.run(scout_urls), 1):
+                purl = scout_urls[scout_url]
+                if isinstance(res, Exception):
+                    print(f"[{i}/{len(todo)}] ✗ {purl}\n  {res}")
+                    continue
+                store.add(league, purl, res.iloc[0].to_dict(), listed.get(purl))
+                added += 1
+                print(f"[{i}/{len(todo)}] ✓ {res.at[0,'Player']}")
+        finally:
+            store.commit()
+            if added:                                    # merged into out_csv, never replaces it
+                n = store.export(league, out_csv)
+
+    s = engine.stats
+    print(f"{s['parsed']} players in {time.perf_counter() - t0:.0f}s "
+          f"({s['retries']} retries, {s['failed']} failed)")
+    print(f"Done, {n} rows in {out_csv}" if added else f"Nothing new, {out_csv} left as is")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    pa = argparse.ArgumentParser()
+    pa.add_argument("list_csv", nargs="?", default=LIST_CSV)
+    pa.add_argument("out_csv", nargs="?", default=OUT_CSV)
+    pa.add_argument("--db", default=RESULTS_DB)
+    pa.add_argument("--delta", action="store_true", help="re-scrape only new players / changed minutes")
+    a = pa.parse_args()
+    main(a.list_csv, a.out_csv, a.db, a.delta)
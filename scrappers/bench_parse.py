@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# bench_parse.py  ─────────────────────────────────────────────
+"""
+Per-page parse time of the fbref scouting-report parsers, over pages
+already in the HTML cache (see html_cache.py):
+
+    python -m scrappers.bench_parse [--pages 200] [--repeat 3]
+
+Times parse_player_bs4 (BeautifulSoup + read_html, the original
+path) against parse_player (lean lxml) on the same pages and checks
+both return the same row.
+"""
+
+from __future__ import annotations
+import statistics, time
+from pathlib import Path
+from typing import Callable, List
+
+import pandas as pd
+
+from scrappers.fbref_scraper import parse_player, parse_player_bs4
+from scrappers.html_cache import CACHE_DIR, read_blob
+
+
+def _time(fn: Callable[[str], pd.DataFrame], pages: List[str], repeat: int) -> List[float]:
+    per_page = []
+    for html in pages:
+        best = float("inf")
+        for _ in range(repeat):
+            t = time.perf_counter()
+            fn(html)
+            best = min(best, time.perf_counter() - t)
+        per_page.append(best * 1e3)
+    return per_page
+
+def bench(pages: List[str], repeat: int = 3):
+    mismatched = 0
+    for html in pages:
+        try:
+            pd.testing.assert_frame_equal(parse_player(html), parse_player_bs4(html))
+        except (AssertionError, ValueError):
+            mismatched += 1
+    print(f"{len(pages)} pages, {mismatched} where the two parsers disagree")
+
+    results = {fn.__name__: _time(fn, pages, repeat) for fn in (parse_player_bs4, parse_player)}
+    for name, ms in results.items():
+        print(f"  {name:<18} median {statistics.median(ms):7.2f} ms   "
+              f"mean {statistics.mean(ms):7.2f} ms   max {max(ms):7.2f} ms")
+    before, after = (statistics.median(ms) for ms in results.values())
+    print(f"  speed-up ×{before / after:.1f}")
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    pa = argparse.ArgumentParser()
+    pa.add_argument("--cache", type=Path, default=CACHE_DIR)
+    pa.add_argument("--pages", type=int, default=200)
+    pa.add_argument("--repeat", type=int, default=3)
+    a = pa.parse_args()
+
+    blobs = sorted((a.cache / "objects").glob("*/*.html.gz"))[:a.pages]
+    if not blobs:
+        raise SystemExit(f"no cached pages under {a.cache}")
+    bench([read_blob(p) for p in blobs], a.repeat)
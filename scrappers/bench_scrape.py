@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# bench_scrape.py  ─────────────────────────────────────────────
+"""
+Offline throughput benchmark of the scrapers against StubServer.
+
+    python -m scrappers.bench_scrape --pages 200 --rate 20 \\
+        --latency 0.05 0.15 --p429 0.02 [--scenario sequential engine safescrapper eafc]
+
+Scenarios (all at the same --rate requests/s towards the stub)
+    sequential    the original loop: hard wait, scrape_player, retry on 429
+    engine        ScrapeEngine (token bucket, fetch / parse stages)
+    safescrapper  SafeScrapper.main end to end (cache, results DB, CSV export)
+    eafc          EAFC25_Scrapper.league_rows over the sofifa listing
+                  (needs cloudscraper installed; "pages" counts player rows)
+
+Reported per scenario: pages/s, parse ms/page, 429s served and the
+back-off time they cost, and peak memory (tracemalloc peak of Python
+allocations, plus the process max RSS).
+"""
+
+from __future__ import annotations
+import contextlib, io, os, resource, tempfile, time, tracemalloc
+from typing import Callable, Dict, List
+
+import pandas as pd
+import requests
+
+from scrappers import fbref_scraper
+from scrappers.engine import HostPolicy, Limiter, ScrapeEngine
+from scrappers.fbref_scraper import _download, fetch_page, parse_player
+from scrappers.SafeScrapper import load_profiles, profile_to_scout
+from scrappers.stub_server import StubServer
+
+URL_LIST = "players_url/url_players_england_league_2025.csv"
+
+
+def _profiles(n: int) -> List[str]:
+    return load_profiles(URL_LIST)[:n]
+
+
+# ——— scenarios: each returns (pages, parse_s, backoff_s)
+def sequential(profiles: List[str], rate: float, backoff: float = 1.0):
+    parse_s = backoff_s = 0.0
+    last = 0.0
+    for url in map(profile_to_scout, profiles):
+        for _ in range(4):
+            dt = time.perf_counter() - last
+            if dt < 1 / rate:
+                time.sleep(1 / rate - dt)
+            last = time.perf_counter()
+            try:
+                html = fetch_page(url).text
+            except requests.HTTPError as e:
+                if e.response.status_code != 429:
+                    raise
+                time.sleep(backoff)
+                backoff_s += backoff
+                continue
+            t = time.perf_counter()
+            parse_player(html)
+            parse_s += time.perf_counter() - t
+            break
+    return len(profiles), parse_s, backoff_s
+
+def engine(profiles: List[str], rate: float, workers: int = 4):
+    eng = ScrapeEngine(_download, parse_player,
+                       Limiter({"fbref.com": HostPolicy(rate=rate, max_in_flight=workers, backoff=1.0)}),
+                       fetch_workers=workers)
+    pages = sum(not isinstance(r, Exception) for _, r in eng.run(map(profile_to_scout, profiles)))
+    return pages, eng.stats["parse_s"], eng.stats["backoff_s"]
+
+def safescrapper(profiles: List[str], rate: float):
+    from scrappers import SafeScrapper
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        pd.DataFrame({"player_url": profiles}).to_csv(f"{tmp}/list.csv", index=False)
+        os.chdir(tmp)
+        wait, SafeScrapper.WAIT_SECONDS = SafeScrapper.WAIT_SECONDS, 1 / rate
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                SafeScrapper.main("list.csv", "Bench_2024_25.csv", "results.sqlite")
+            pages = len(pd.read_csv("Bench_2024_25.csv"))
+        finally:
+            SafeScrapper.WAIT_SECONDS = wait
+            os.chdir(cwd)
+    return pages, float("nan"), float("nan")
+
+def eafc(stub: StubServer, rate: float):
+    from scrappers import EAFC25_Scrapper as E
+    E.SESSION = stub.session()
+    E.LIMITER = Limiter({"sofifa.com": HostPolicy(rate=rate, max_in_flight=4)})
+    pages = sum(1 for _ in E.league_rows(E.LEAGUE_IDS))
+    return pages, float("nan"), float("nan")
+
+
+# ——— harness
+def measure(name: str, run: Callable[[], tuple], stub: StubServer) -> Dict[str, object]:
+    before = dict(stub.counts)
+    tracemalloc.start()
+    t = time.perf_counter()
+    pages, parse_s, backoff_s = run()
+    elapsed = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "scenario": name, "pages": pages, "seconds": round(elapsed, 2),
+        "pages/s": round(pages / elapsed, 2),
+        "parse ms/page": round(1e3 * parse_s / max(pages, 1), 2),
+        "429s": stub.counts["429"] - before["429"],
+        "backoff s": round(backoff_s, 2),
+        "connections": stub.counts["connections"] - before["connections"],
+        "peak MB": round(peak / 2**20, 1),
+        "max RSS MB": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+def main(pages: int, rate: float, latency, p429: float, p403: float, cf_delay: float,
+         scenarios: List[str], workers: int):
+    profiles = _profiles(pages)
+    rows = []
+    with StubServer(latency=tuple(latency), p429=p429, p403=p403, cf_delay=cf_delay) as stub:
+        fbref_scraper.set_session(stub.session())
+        try:
+            runs = {
+                "sequential":   lambda: sequential(profiles, rate),
+                "engine":       lambda: engine(profiles, rate, workers),
+                "safescrapper": lambda: safescrapper(profiles, rate),
+                "eafc":         lambda: eafc(stub, rate),
+            }
+            for name in scenarios:
+                try:
+                    rows.append(measure(name, runs[name], stub))
+                except ImportError as e:
+                    print(f"  {name}: skipped ({e})")
+        finally:
+            fbref_scraper.set_session(None)
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    pa = argparse.ArgumentParser()
+    pa.add_argument("--pages", type=int, default=100)
+    pa.add_argument("--rate", type=float, default=20.0, help="requests/s allowed towards the stub")
+    pa.add_argument("--latency", type=float, nargs=2, default=[0.05, 0.15])
+    pa.add_argument("--p429", type=float, default=0.02)
+    pa.add_argument("--p403", type=float, default=0.0)
+    pa.add_argument("--cf-delay", type=float, default=0.0)
+    pa.add_argument("--workers", type=int, default=4)
+    pa.add_argument("--scenario", nargs="+", default=["sequential", "engine", "safescrapper", "eafc"])
+    a = pa.parse_args()
+    main(a.pages, a.rate, a.latency, a.p429, a.p403, a.cf_delay, a.scenario, a.workers)
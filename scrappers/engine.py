@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# engine.py  ─────────────────────────────────────────────
+"""
+ScrapeEngine(fetch, parse, limiter)  →  run(urls) yields (url, row | error)
+
+Concurrent, rate-limited scraping in two stages:
+
+  fetch   thread pool, I/O bound.  Every request first takes a slot
+          from its host's Limiter entry: a TokenBucket (requests/s +
+          burst) and a cap on requests in flight, so the site sees
+          exactly the allowed rate and never more.  A 429 pauses the
+          whole host (Retry-After, else the policy's back-off) and
+          the request is retried through the bucket.
+  parse   second pool, CPU bound; pages are parsed while the fetch
+          stage is waiting for its next token.
+
+With a cache (scrappers.html_cache.HtmlCache) pages younger than its
+TTL are served from disk without taking a slot; pair it with
+fetch=cache.fetcher(...) so downloads are revalidated and stored.
+Results come back as parses finish.  One Limiter can be shared by
+several engines / jobs so all of them respect the same host budget.
+"""
+
+from __future__ import annotations
+import queue, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+
+# ——— per-host politeness
+@dataclass(frozen=True)
+class HostPolicy:
+    rate: float                 # requests per second
+    burst: int = 1              # tokens that may accumulate while idle
+    max_in_flight: int = 2      # concurrent requests to the host
+    backoff: float = 10.0       # seconds to pause the host after a 429
+    max_retries: int = 3
+
+HOST_POLICIES: Dict[str, HostPolicy] = {
+    "fbref.com":  HostPolicy(rate=1 / 6.1),
+    "sofifa.com": HostPolicy(rate=1.0, burst=4, max_in_flight=4, backoff=5.0),
+}
+DEFAULT_POLICY = HostPolicy(rate=1.0)
+
+
+class TokenBucket:
+    """Thread-safe; callers reserve a token and sleep outside the lock (FIFO-ish)."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate, self.burst = rate, burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Push every pending and future reservation back by `seconds`."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+class Limiter:
+    def __init__(self, policies: Dict[str, HostPolicy] = HOST_POLICIES):
+        self.policies = policies
+        self._hosts: Dict[str, Tuple[HostPolicy, TokenBucket, threading.Semaphore]] = {}
+        self._lock = threading.Lock()
+
+    def host(self, url: str) -> Tuple[HostPolicy, TokenBucket, threading.Semaphore]:
+        host = urlparse(url).hostname or ""
+        host = host[4:] if host.startswith("www.") else host
+        with self._lock:
+            if host not in self._hosts:
+                p = self.policies.get(host, DEFAULT_POLICY)
+                self._hosts[host] = (p, TokenBucket(p.rate, p.burst), threading.Semaphore(p.max_in_flight))
+            return self._hosts[host]
+
+    @contextmanager
+    def slot(self, url: str):
+        _, bucket, in_flight = self.host(url)
+        with in_flight:
+            bucket.acquire()
+            yield
+
+
+# ——— engine
+class ScrapeEngine:
+    def __init__(self, fetch: Callable[[str], str], parse: Callable[[str], object],
+                 limiter: Limiter | None = None, fetch_workers: int = 4, parse_workers: int = 2,
+                 cache=None):
+        self.fetch, self.parse = fetch, parse
+        self.limiter = limiter or Limiter()
+        self.cache = cache
+        self.fetch_workers, self.parse_workers = fetch_workers, parse_workers
+        self.stats = {"fetched": 0, "cached": 0, "parsed": 0, "failed": 0, "retries": 0,
+                      "fetch_s": 0.0, "parse_s": 0.0, "backoff_s": 0.0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, **inc):
+        with self._stats_lock:
+            for k, v in inc.items():
+                self.stats[k] += v
+
+    def _fetch(self, url: str) -> str:
+        if self.cache is not None:
+            html = self.cache.get(url)
+            if html is not None:
+                self._count(cached=1)
+                return html
+        policy, bucket, _ = self.limiter.host(url)
+        for attempt in range(policy.max_retries + 1):
+            try:
+                with self.limiter.slot(url):
+                    t = time.perf_counter()
+                    html = self.fetch(url)
+                self._count(fetched=1, fetch_s=time.perf_counter() - t)
+                return html
+            except requests.HTTPError as e:
+                resp = e.response
+                if resp is None or resp.status_code != 429 or attempt == policy.max_retries:
+                    raise
+                retry_after = resp.headers.get("Retry-After", "")
+                pause = float(retry_after) if retry_after.isdigit() else policy.backoff
+                bucket.pause(pause)
+                self._count(retries=1, backoff_s=pause)
+
+    def run(self, urls: Iterable[str]) -> Iterator[Tuple[str, object]]:
+        """Yield (url, parsed) or (url, exception) for every url, as parses finish."""
+        results: "queue.Queue[Tuple[str, object]]" = queue.Queue()
+
+        def parse(url: str, html: str):
+            t = time.perf_counter()
+            try:
+                out = self.parse(html)
+                self._count(parsed=1, parse_s=time.perf_counter() - t)
+            except Exception as e:
+                self._count(failed=1)
+                out = e
+            results.put((url, out))
+
+        fpool = ThreadPoolExecutor(self.fetch_workers, "fetch")
+        ppool = ThreadPoolExecutor(self.parse_workers, "parse")
+
+        def fetch(url: str):
+            try:
+                html = self._fetch(url)
+            except Exception as e:
+                self._count(failed=1)
+                results.put((url, e))
+                return
+            ppool.submit(parse, url, html)
+
+        try:
+            n = 0
+            for url in urls:
+                fpool.submit(fetch, url)
+                n += 1
+            for _ in range(n):
+                yield results.get()
+        finally:                                   # also when the caller stops early
+            fpool.shutdown(cancel_futures=True)
+            ppool.shutdown()
@@ -2,13 +2,23 @@
 # fbref_scraper.py  ─────────────────────────────────────────────
 """
 scrape_player(url, *, to_csv=None)  →  tidy 1×N DataFrame
+parse_player(html)                  →  same, from an already fetched page
+parse_league_minutes(html)          →  {profile url: minutes} from a league's
+                                       Standard Stats page (delta scraping)
 
 Columns (first six):
     Player, Birthdate, Club, Footed, Nationality, Position, Minutes, …
+
+parse_player is the lean path: one lxml parse of the page (the
+commented-out scout_full_* table is cut out of the raw HTML and
+parsed on its own), targeted XPath for #meta / footer / switcher,
+and per-90 cells converted straight to float.  parse_player_bs4 is
+the original BeautifulSoup + read_html path, kept as the reference
+for scrappers/bench_parse.py.
 """
 
 from __future__ import annotations
-import re, warnings
+import re, threading, warnings
 from io import StringIO
 from pathlib import Path
 from typing import Dict, Optional
@@ -17,6 +27,8 @@ import pandas as pd
 import sys
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import html as lxml_html
 
 # ————————————————— HTTP
 HEADERS = {
@@ -24,13 +36,51 @@ HEADERS = {
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/124.0 Safari/537.36"
-    )
+    ),
+    "Accept-Encoding": "gzip, deflate",      # decoded transparently by requests
 }
+POOL_SIZE = 8                                # ≥ ScrapeEngine fetch workers
+BASE      = "https://fbref.com"
 
-def _download(url: str) -> str:
-    r = requests.get(url, headers=HEADERS, timeout=20)
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def make_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """Keep-alive session; one pooled connection per concurrent request."""
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(HEADERS)
+    return s
+
+def get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = make_session()
+        return _session
+
+def set_session(session: Optional[requests.Session]):
+    """Swap the shared session (e.g. one pointed at a stub server); None resets it."""
+    global _session
+    with _session_lock:
+        _session = session
+
+def fetch_page(url: str, *, etag: Optional[str] = None, last_modified: Optional[str] = None,
+               session: Optional[requests.Session] = None) -> requests.Response:
+    """GET through the shared session; with validators a 304 may come back (no body)."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    r = (session or get_session()).get(url, headers=headers, timeout=20)
     r.raise_for_status()
-    return r.text
+    return r
+
+def _download(url: str) -> str:
+    return fetch_page(url).text
 
 def _strip_comments(html: str) -> str:
     return html.replace("<!--", "").replace("-->", "")
@@ -56,9 +106,9 @@ def _first(it):
     return None
 
 def _collect_meta(soup: BeautifulSoup):
+    minutes = None
     meta = soup.find(id="meta")
     txt  = meta.get_text(" ", strip=True).replace("\xa0", " ") if meta else ""
-    full = soup.get_text(" ", strip=True).replace("\xa0", " ")
 
     birth = soup.select_one("span#necro-birth[data-birth]")
     birthdate = birth["data-birth"] if birth else None
@@ -116,11 +166,7 @@ def _collect_meta(soup: BeautifulSoup):
 
 
 # ————————————————— pivot helper
-def _pivot_per90(df: pd.DataFrame, *,
-                 player: str, birthdate: Optional[str], club: Optional[str],
-                 footed: Optional[str], nat: Optional[str],
-                 pos: Optional[str], mins: Optional[int]) -> pd.DataFrame:
-
+def _pivot_per90(df: pd.DataFrame, **meta) -> pd.DataFrame:
     vals: Dict[str, float] = {}
     for s in [c for c in df.columns
               if c.lower().endswith("_statistic") or c.lower() == "statistic"]:
@@ -131,7 +177,12 @@ def _pivot_per90(df: pd.DataFrame, *,
             v = pd.to_numeric(str(per90).replace("%", ""), errors="coerce")
             if pd.notna(v):
                 vals.setdefault(stat, float(v))
+    return _wide(vals, **meta)
 
+def _wide(vals: Dict[str, float], *,
+          player: str, birthdate: Optional[str], club: Optional[str],
+          footed: Optional[str], nat: Optional[str],
+          pos: Optional[str], mins: Optional[int]) -> pd.DataFrame:
     wide = pd.DataFrame([vals])
     wide.insert(0, "Minutes", mins)
     wide.insert(0, "Position", pos)
@@ -143,17 +194,134 @@ def _pivot_per90(df: pd.DataFrame, *,
     return wide
 
 
+# ————————————————— lean lxml path
+_SCOUT_TABLE = re.compile(r'<table\b[^>]*\bid="scout_full_[^"]*".*?</table>', re.S)
+_MINUTES     = re.compile(r"([\d,]+)\s+minutes", re.I)
+_TAGS        = re.compile(r"<[^>]+>")
+
+def _has_class(*names: str) -> str:
+    return " and ".join(f'contains(concat(" ", normalize-space(@class), " "), " {n} ")' for n in names)
+
+_SWITCHER = (f'//div[{_has_class("filter", "switcher")}]'
+             f'//*[{_has_class("current")}]//a[{_has_class("sr_preset")}]')
+
+def _text(el, sep: str = " ") -> str:
+    """BeautifulSoup's get_text(sep, strip=True)."""
+    return sep.join(t.strip() for t in el.itertext() if t.strip())
+
+def _per90_values(table_html: str) -> Dict[str, float]:
+    table = lxml_html.fragment_fromstring(table_html)
+    vals: Dict[str, float] = {}
+    for tr in table.iterfind(".//tbody/tr"):
+        stat = per90 = None
+        for cell in tr:
+            key = cell.get("data-stat")
+            if key == "statistic":
+                stat = _text(cell, "")
+            elif key == "per90":
+                per90 = _text(cell, "")
+        if not stat or not per90:
+            continue
+        try:
+            v = float(per90.replace("%", "").replace(",", ""))
+        except ValueError:
+            continue                                    # section header rows, blanks
+        vals.setdefault(stat, v)
+    return vals
+
+def _meta_lxml(doc, html: str):
+    meta = doc.get_element_by_id("meta", None)
+    txt  = _text(meta).replace("\xa0", " ") if meta is not None else ""
+
+    birth = doc.xpath('//span[@id="necro-birth"]/@data-birth')
+    birthdate = birth[0] if birth else None
+
+    def link(prefix: str, pattern: str) -> Optional[str]:
+        if meta is not None:
+            a = meta.xpath(f'.//a[starts-with(@href, "{prefix}")]')
+            if a and _text(a[0], ""):
+                return _text(a[0], "")
+        m = re.search(pattern, txt)
+        return m.group(1).strip() if m else None
+
+    club = link("/en/squads/", r"Club:\s*([A-Za-z0-9 .'-]+)")
+    nat  = link("/en/country/", r"Nationality:\s*([A-Za-z ]+)")
+
+    m = re.search(r"Footed:\s*([A-Za-z]+)", txt, re.I)
+    footed = m.group(1).title() if m else None
+
+    minutes = None
+    strong = doc.xpath('//div[starts-with(@id, "tfooter_scout_summary_")]//strong')
+    m = _MINUTES.search(_text(strong[0]).replace("\xa0", " ")) if strong else None
+    if m is None:                                       # fallback – first "NN minutes" on the page
+        m = _MINUTES.search(_TAGS.sub(" ", _strip_comments(html)).replace("&nbsp;", " "))
+    if m:
+        minutes = int(m.group(1).replace(",", ""))
+
+    pos = None
+    sw = doc.xpath(_SWITCHER)
+    if sw:
+        m = re.search(r"vs\.\s*(.+)", _text(sw[0], ""))
+        if m:
+            pos = m.group(1).strip()
+    if pos is None:
+        m = re.search(r"Position[s]?:\s*(.+?)(?:\||$)", txt)
+        if m:
+            pos = m.group(1).strip()
+
+    return birthdate, club, footed, nat, minutes, pos
+
+
+# ————————————————— league listing (comps/<id>/stats/…)
+_STANDARD_TABLE = re.compile(r'<table\b[^>]*\bid="stats_standard[^"]*".*?</table>', re.S)
+
+def parse_league_minutes(html: str) -> Dict[str, Optional[int]]:
+    """Profile URL → league minutes for every row of the Standard Stats table."""
+    m = _STANDARD_TABLE.search(html)
+    if not m:
+        raise ValueError("No table with id starting “stats_standard” found.")
+    out: Dict[str, Optional[int]] = {}
+    for tr in lxml_html.fragment_fromstring(m.group(0)).iterfind(".//tbody/tr"):
+        link = tr.xpath('./*[@data-stat="player"]//a/@href')
+        mins = tr.xpath('./*[@data-stat="minutes"]')
+        if not link:
+            continue                                    # header rows
+        txt = _text(mins[0], "").replace(",", "") if mins else ""
+        url = BASE + link[0]
+        if txt.isdigit():                               # one row per club after a mid-season move
+            out[url] = (out.get(url) or 0) + int(txt)
+        else:
+            out.setdefault(url, None)
+    return out
+
+
 # ————————————————— public
-def scrape_player(url: str, *, to_csv: str | None = None) -> pd.DataFrame:
-    html = _download(url)
+def parse_player(html: str) -> pd.DataFrame:
+    m = _SCOUT_TABLE.search(html)
+    if not m:
+        raise ValueError("No table with id starting “scout_full_” found.")
+    vals = _per90_values(m.group(0))
+
+    doc = lxml_html.document_fromstring(html)
+    birth, club, foot, nat, mins, pos = _meta_lxml(doc, html)
+    h1 = doc.find(".//h1")
+    player = _text(h1, "") if h1 is not None else None
+
+    return _wide(vals, player=player, birthdate=birth, club=club,
+                 footed=foot, nat=nat, pos=pos, mins=mins)
+
+def parse_player_bs4(html: str) -> pd.DataFrame:
     soup = BeautifulSoup(_strip_comments(html), "lxml")
 
     df_full = _get_scout_full_table(soup)
     birth, club, foot, nat, mins, pos = _collect_meta(soup)
     player  = soup.find("h1").get_text(strip=True)
 
-    row = _pivot_per90(df_full, player=player, birthdate=birth, club=club,
-                       footed=foot, nat=nat, pos=pos, mins=mins)
+    return _pivot_per90(df_full, player=player, birthdate=birth, club=club,
+                        footed=foot, nat=nat, pos=pos, mins=mins)
+
+def scrape_player(url: str, *, to_csv: str | None = None) -> pd.DataFrame:
+    row = parse_player(_download(url))
 
     if to_csv:
         Path(to_csv).parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# html_cache.py  ─────────────────────────────────────────────
+"""
+HtmlCache  —  on-disk cache of fetched pages, and offline re-parsing.
+
+html_cache/objects/<ab>/<sha256>.html.gz   gzip'd page, content-addressed
+                                           (identical pages stored once)
+html_cache/index.sqlite                    (url, fetched date) → digest, size,
+                                           ETag / Last-Modified
+
+get(url) returns the newest copy younger than TTL_DAYS; put(url, html)
+records today's fetch.  evict() drops entries past the TTL, then the
+oldest fetches until the blobs fit in MAX_BYTES, then orphan blobs.
+ScrapeEngine(cache=...) answers from the cache before taking a
+rate-limiter slot, so cached pages cost no request at all;
+cache.fetcher(fetch_page) is the fetch for everything else: it
+revalidates expired copies with If-None-Match / If-Modified-Since
+(a 304 re-uses the stored body) and stores what it downloads.
+
+    python -m scrappers.html_cache reparse [League …] [--workers 8]
+    python -m scrappers.html_cache evict | stats
+
+`reparse` re-parses the newest cached copy of every scouting report,
+expired or not, across processes (after a change to the parser, no
+page is downloaded again), stores the rows in the ScrapeStore and
+merges them into players_data/<League>_2024_25.csv like a scrape
+would: players whose page is not cached keep their current row.
+"""
+
+from __future__ import annotations
+import gzip, hashlib, os, sqlite3, threading, time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# ——— config
+CACHE_DIR  = Path("html_cache")
+TTL_DAYS   = 30
+MAX_BYTES  = 2 << 30              # 2 GiB of compressed pages
+GZIP_LEVEL = 6
+
+
+class HtmlCache:
+    def __init__(self, root: Path = CACHE_DIR, ttl_days: int = TTL_DAYS, max_bytes: int = MAX_BYTES):
+        self.root, self.ttl_days, self.max_bytes = Path(root), ttl_days, max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.root / "index.sqlite", check_same_thread=False)
+        self._db.execute("""CREATE TABLE IF NOT EXISTS pages (
+                              url TEXT, fetched TEXT, digest TEXT, size INTEGER,
+                              etag TEXT, last_modified TEXT,
+                              PRIMARY KEY (url, fetched))""")
+        cols = {c[1] for c in self._db.execute("PRAGMA table_info(pages)")}
+        for col in ("etag", "last_modified"):               # indexes from before validators
+            if col not in cols:
+                self._db.execute(f"ALTER TABLE pages ADD COLUMN {col} TEXT")
+        self._db.commit()
+        self.revalidated = 0
+
+    # ——— blobs
+    def blob_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.html.gz"
+
+    def _cutoff(self) -> str:
+        return (date.today() - timedelta(days=self.ttl_days)).isoformat()
+
+    # ——— lookup / store
+    def path(self, url: str, ttl: bool = True) -> Optional[Path]:
+        """Blob of the newest fetch of `url` within the TTL (any age if not ttl), if any."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest FROM pages WHERE url = ? AND fetched >= ? ORDER BY fetched DESC LIMIT 1",
+                (url, self._cutoff() if ttl else "")).fetchone()
+        if row is None:
+            return None
+        p = self.blob_path(row[0])
+        return p if p.exists() else None
+
+    def get(self, url: str) -> Optional[str]:
+        p = self.path(url)
+        return read_blob(p) if p else None
+
+    def validators(self, url: str) -> Tuple[Optional[str], Optional[str], Optional[Path]]:
+        """(ETag, Last-Modified, blob) of the newest copy of `url`, expired or not."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, digest FROM pages WHERE url = ? ORDER BY fetched DESC LIMIT 1",
+                (url,)).fetchone()
+        if row is None or not self.blob_path(row[2]).exists():
+            return None, None, None
+        return row[0], row[1], self.blob_path(row[2])
+
+    def fetcher(self, fetch_page: Callable[..., object]) -> Callable[[str], str]:
+        """Conditional, caching fetch(url) → html around fetch_page(url, etag=, last_modified=)."""
+        def fetch(url: str) -> str:
+            etag, last_modified, path = self.validators(url)
+            r = fetch_page(url, etag=etag, last_modified=last_modified)
+            if r.status_code == 304 and path is not None:
+                html = read_blob(path)
+                self.revalidated += 1
+            else:
+                html = r.text
+            self.put(url, html, r.headers.get("ETag", etag), r.headers.get("Last-Modified", last_modified))
+            return html
+        return fetch
+
+    def put(self, url: str, html: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        p = self.blob_path(digest)
+        if not p.exists():
+            p.parent.mkdir(parents=True, exist_ok=True)
+            tmp = p.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(gzip.compress(data, GZIP_LEVEL))
+            os.replace(tmp, p)                               # atomic: readers never see half a blob
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                             (url, date.today().isoformat(), digest, p.stat().st_size, etag, last_modified))
+            self._db.commit()
+
+    # ——— housekeeping
+    def evict(self) -> int:
+        """TTL, then size budget (oldest fetches first), then orphan blobs. Returns blobs removed."""
+        with self._lock:
+            db = self._db
+            db.execute("DELETE FROM pages WHERE fetched < ?", (self._cutoff(),))
+            seen, total = set(), 0
+            for rowid, digest, size in db.execute(
+                    "SELECT rowid, digest, size FROM pages ORDER BY fetched DESC").fetchall():
+                if digest in seen:
+                    continue
+                if total + size > self.max_bytes:
+                    db.execute("DELETE FROM pages WHERE rowid = ?", (rowid,))
+                    continue
+                seen.add(digest)
+                total += size
+            db.commit()
+            live = {d for (d,) in db.execute("SELECT DISTINCT digest FROM pages")}
+
+        removed = 0
+        for p in (self.root / "objects").glob("*/*.html.gz"):
+            if p.name[:-len(".html.gz")] not in live:
+                p.unlink()
+                removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pages, urls = self._db.execute("SELECT COUNT(*), COUNT(DISTINCT url) FROM pages").fetchone()
+        blobs = list((self.root / "objects").glob("*/*.html.gz"))
+        return {"fetches": pages, "urls": urls, "blobs": len(blobs),
+                "bytes": sum(p.stat().st_size for p in blobs)}
+
+
+def read_blob(path: Path) -> str:
+    return gzip.decompress(Path(path).read_bytes()).decode("utf-8")
+
+
+# ——— offline reparse
+def _parse_blob(path: str) -> Optional[dict]:
+    from scrappers.fbref_scraper import parse_player           # imported in the worker process
+    try:
+        return parse_player(read_blob(path)).iloc[0].to_dict()
+    except Exception as e:
+        return {"__error__": f"{path}: {e}"}
+
+def reparse(leagues: Optional[List[str]] = None, workers: Optional[int] = None,
+            cache: Optional[HtmlCache] = None, out_dir: Optional[Path] = None, db: Optional[str] = None):
+    from concurrent.futures import ProcessPoolExecutor
+    from scrappers.jobs import OUT_DIR, discover_jobs
+    from scrappers.results_db import RESULTS_DB, ScrapeStore
+    from scrappers.SafeScrapper import load_profiles, profile_to_scout
+
+    cache = cache or HtmlCache()
+    with ProcessPoolExecutor(workers) as pool, ScrapeStore(db or RESULTS_DB) as store:
+        for job in discover_jobs(out_dir=out_dir or OUT_DIR, leagues=leagues):
+            t = time.perf_counter()
+            profiles = list(dict.fromkeys(load_profiles(str(job.list_csv))))
+            cached = {u: str(p) for u in profiles if (p := cache.path(profile_to_scout(u), ttl=False)) is not None}
+            rows = dict(zip(cached, pool.map(_parse_blob, cached.values(), chunksize=16)))
+            errors = [r["__error__"] for r in rows.values() if "__error__" in r]
+            listed = store.listed_minutes(job.league)            # keep delta mode's reference
+            ok = 0
+            for url, row in rows.items():
+                if "__error__" not in row:
+                    store.add(job.league, url, row, listed.get(url))
+                    ok += 1
+            store.commit()
+            n = store.export(job.league, job.out_csv) if ok else 0
+            print(f"→ {job.out_csv}: {ok} rows from cache, "
+                  f"{len(profiles) - len(cached)} not cached (rows kept as they were), "
+                  f"{len(errors)} parse errors, {n} rows written ({time.perf_counter() - t:.1f}s)")
+            for e in errors[:5]:
+                print(f"   ✗ {e}")
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    pa = argparse.ArgumentParser()
+    pa.add_argument("command", choices=["reparse", "evict", "stats"])
+    pa.add_argument("leagues", nargs="*")
+    pa.add_argument("--workers", type=int)
+    pa.add_argument("--out-dir", type=Path)
+    pa.add_argument("--db", help="results store (default scrape_results.sqlite)")
+    a = pa.parse_args()
+
+    if a.command == "reparse":
+        reparse(a.leagues or None, a.workers, out_dir=a.out_dir, db=a.db)
+    elif a.command == "evict":
+        print(f"removed {HtmlCache().evict()} blobs")
+    else:
+        print(HtmlCache().stats())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# jobs.py  ─────────────────────────────────────────────
+"""
+Scrape every league in one resumable run.
+
+    python -m scrappers.jobs                      # all players_url/*.csv
+    python -m scrappers.jobs Eredivisie LaLiga    # a subset
+
+Each players_url/url_players_<x>_league_2025.csv becomes a Job
+writing players_data/<League>_2024_25.csv.  All jobs feed a single
+ScrapeEngine, so one token bucket governs fbref for the whole run
+(the rate does not multiply with the number of leagues).  Rows go
+to the ScrapeStore (results_db.py), whose players table is also the
+per-(league, url) checkpoint, so an interrupted run picks up where
+it stopped; leagues that got new rows are merged into their CSVs
+when the run ends (or is interrupted) — see ScrapeStore.export.  Progress lines carry
+the league; every PROGRESS_EVERY players, and at the end, a table
+of per-league counts and throughput is printed.
+"""
+
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from scrappers.results_db import RESULTS_DB, ScrapeStore
+from scrappers.SafeScrapper import load_profiles, make_engine, profile_to_scout
+
+# ——— config
+URL_DIR         = Path("players_url")
+OUT_DIR         = Path("players_data")
+SEASON          = "2024_25"
+PROGRESS_EVERY  = 25
+
+LEAGUES = {                               # url list → league name used downstream
+    "url_players_belgian_league_2025.csv":        "BelgianPro",
+    "url_players_brazil_league_2025.csv":         "CampeonatoBrasileiro",
+    "url_players_england_league_2025.csv":        "PremierLeague",
+    "url_players_england_second_league_2025.csv": "EFLChampionship",
+    "url_players_france_league_2025.csv":         "Ligue1",
+    "url_players_germany_league_2025.csv":        "Bundesliga",
+    "url_players_italia_league_2025.csv":         "SerieA",
+    "url_players_netherlands_league_2025.csv":    "Eredivisie",
+    "url_players_portugal_league_2025.csv":       "PrimeiraLiga",
+    "url_players_spain_league_2025.csv":          "LaLiga",
+}
+
+
+@dataclass
+class Job:
+    league: str
+    list_csv: Path
+    out_csv: Path
+    total: int = 0
+    skipped: int = 0                      # done in a previous run
+    scraped: int = 0
+    failed: int = 0
+    first: Optional[float] = None
+    last: Optional[float] = None
+
+    @property
+    def remaining(self) -> int:
+        return self.total - self.skipped - self.scraped - self.failed
+
+    @property
+    def per_min(self) -> float:
+        span = (self.last - self.first) if self.first is not None and self.last is not None else 0
+        return 60 * self.scraped / span if span > 0 else 0.0
+
+
+def discover_jobs(url_dir: Path = URL_DIR, out_dir: Path = OUT_DIR,
+                  leagues: Optional[List[str]] = None) -> List[Job]:
+    jobs = []
+    for list_csv in sorted(url_dir.glob("url_players_*.csv")):
+        league = LEAGUES.get(list_csv.name)
+        if league is None:
+            print(f"  ? {list_csv.name}: no league name in LEAGUES, skipped")
+            continue
+        if leagues and league not in leagues:
+            continue
+        jobs.append(Job(league, list_csv, out_dir / f"{league}_{SEASON}.csv"))
+    return jobs
+
+
+def print_stats(jobs: List[Job], t0: float):
+    elapsed = time.perf_counter() - t0
+    print(f"  {'league':<22}{'total':>7}{'done':>7}{'new':>6}{'fail':>6}{'left':>6}{'/min':>8}")
+    for j in jobs:
+        print(f"  {j.league:<22}{j.total:>7}{j.skipped + j.scraped:>7}{j.scraped:>6}"
+              f"{j.failed:>6}{j.remaining:>6}{j.per_min:>8.1f}")
+    new = sum(j.scraped for j in jobs)
+    left = sum(j.remaining for j in jobs)
+    rate = new / elapsed if elapsed else 0
+    eta = f", ETA {left / rate / 60:.0f} min" if rate and left else ""
+    print(f"  {new} players in {elapsed / 60:.1f} min ({60 * rate:.1f}/min{eta})")
+
+
+# ——— run
+def run_jobs(jobs: List[Job], db: str = RESULTS_DB):
+    engine = make_engine()
+    by_url: Dict[str, List[Tuple[Job, str]]] = {}    # a player listed in two leagues is fetched once
+    t0 = time.perf_counter()
+
+    with ScrapeStore(db) as store:
+        for j in jobs:
+            profiles = list(dict.fromkeys(load_profiles(str(j.list_csv))))
+            done = store.done(j.league)
+            j.total = len(profiles)
+            for purl in profiles:
+                if purl in done:
+                    j.skipped += 1
+                else:
+                    by_url.setdefault(profile_to_scout(purl), []).append((j, purl))
+            print(f"→ {j.league}: {j.remaining} of {j.total} remaining → {j.out_csv}")
+
+        try:
+            for i, (scout_url, res) in enumerate(engine.run(by_url), 1):
+                for j, purl in by_url[scout_url]:
+                    j.first = j.first if j.first is not None else time.perf_counter()
+                    j.last = time.perf_counter()
+                    tag = f"[{j.league} {j.total - j.remaining + 1}/{j.total}]"
+                    if isinstance(res, Exception):
+                        j.failed += 1
+                        print(f"{tag} ✗ {purl}\n  {res}")
+                        continue
+                    store.add(j.league, purl, res.iloc[0].to_dict())
+                    j.scraped += 1
+                    print(f"{tag} ✓ {res.at[0, 'Player']}")
+                if i % PROGRESS_EVERY == 0:
+                    print_stats(jobs, t0)
+        finally:
+            store.commit()
+            for j in jobs:
+                if j.scraped:
+                    store.export(j.league, j.out_csv)
+
+    print_stats(jobs, t0)
+    s = engine.stats
+    print(f"  {s['cached']} from cache, fetch {s['fetch_s'] / max(s['fetched'], 1):.2f}s/page, "
+          f"parse {1e3 * s['parse_s'] / max(s['parsed'], 1):.0f}ms/page, {s['retries']} retries")
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import sys
+    jobs = discover_jobs(leagues=sys.argv[1:] or None)
+    if not jobs:
+        sys.exit("no jobs")
+    run_jobs(jobs)
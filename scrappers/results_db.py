@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# results_db.py  ─────────────────────────────────────────────
+"""
+ScrapeStore(path)  —  checkpoint + results of the fbref scrapes in one SQLite file.
+
+players(league, url, Player, Birthdate, Club, Footed, Nationality,
+        Position, Minutes, scraped_at,      one row per finished player;
+        listed_minutes)                     its presence *is* the checkpoint;
+                                            listed_minutes = league-listing
+                                            minutes when scraped (delta mode)
+stats(league, url, stat, per90)             tidy per-90 values, so players
+                                            with different stat sets coexist
+
+WAL journal, rows buffered and committed every BATCH_SIZE players.
+is_done() is a primary-key lookup; done(league) loads a league's set.
+
+    python -m scrappers.results_db export [League …] [--out-dir players_data]
+
+merges the store into the wide <League>_2024_25.csv files: a stored
+player replaces the CSV row with the same (Player, Birthdate) in
+place, players the CSV lacks are appended, and every other CSV row is
+kept, so exporting from a fresh or partial store never loses rows.
+New stats are appended to the columns (blank where a player lacks
+them).  A league with no stored rows is not written; files are
+replaced atomically.
+"""
+
+from __future__ import annotations
+import os, sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import pandas as pd
+
+# ——— config
+RESULTS_DB = "scrape_results.sqlite"
+BATCH_SIZE = 50
+META_COLS  = ["Player", "Birthdate", "Club", "Footed", "Nationality", "Position", "Minutes"]
+ROW_KEY    = ["Player", "Birthdate"]       # matches stored players to existing CSV rows
+
+_META_SQL = ", ".join(f'"{c}"' for c in META_COLS)
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS players (
+    league TEXT, url TEXT, {_META_SQL}, scraped_at TEXT, listed_minutes INTEGER,
+    PRIMARY KEY (league, url));
+CREATE TABLE IF NOT EXISTS stats (
+    league TEXT, url TEXT, stat TEXT, per90 REAL,
+    PRIMARY KEY (league, url, stat));
+"""
+
+
+def _sql(v):
+    """numpy scalars → Python, NaN → NULL."""
+    if v is None or (isinstance(v, float) and v != v):
+        return None
+    return v.item() if hasattr(v, "item") else v
+
+
+class ScrapeStore:
+    def __init__(self, path: str = RESULTS_DB, batch_size: int = BATCH_SIZE):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(_SCHEMA)
+        if "listed_minutes" not in {c[1] for c in self.db.execute("PRAGMA table_info(players)")}:
+            self.db.execute("ALTER TABLE players ADD COLUMN listed_minutes INTEGER")
+        self.batch_size = batch_size
+        self._pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ——— checkpoint
+    def is_done(self, league: str, url: str) -> bool:
+        return self.db.execute("SELECT 1 FROM players WHERE league = ? AND url = ?",
+                               (league, url)).fetchone() is not None
+
+    def done(self, league: str) -> Set[str]:
+        return {u for (u,) in self.db.execute("SELECT url FROM players WHERE league = ?", (league,))}
+
+    def listed_minutes(self, league: str) -> Dict[str, Optional[int]]:
+        return dict(self.db.execute("SELECT url, listed_minutes FROM players WHERE league = ?", (league,)))
+
+    # ——— results
+    def add(self, league: str, url: str, row: Dict, listed_minutes: Optional[int] = None):
+        """One scraped player (a parse_player row as a dict); re-adding replaces it."""
+        meta = [_sql(row.get(c)) for c in META_COLS]
+        stats = [(league, url, k, float(v)) for k, v in row.items()
+                 if k not in META_COLS and v is not None and not pd.isna(v)]
+        self.db.execute("DELETE FROM stats WHERE league = ? AND url = ?", (league, url))
+        self.db.execute(f"INSERT OR REPLACE INTO players VALUES ({', '.join('?' * (len(META_COLS) + 4))})",
+                        [league, url, *meta, datetime.utcnow().isoformat(timespec="seconds"), listed_minutes])
+        self.db.executemany("INSERT INTO stats VALUES (?, ?, ?, ?)", stats)
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.commit()
+
+    def commit(self):
+        self.db.commit()
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        self.db.close()
+
+    # ——— export
+    def leagues(self) -> List[str]:
+        return [l for (l,) in self.db.execute("SELECT DISTINCT league FROM players ORDER BY league")]
+
+    def wide(self, league: str) -> pd.DataFrame:
+        players = pd.read_sql_query(
+            f"SELECT url, {_META_SQL} FROM players "
+            "WHERE league = ? ORDER BY rowid", self.db, params=(league,))
+        stats = pd.read_sql_query("SELECT url, stat, per90 FROM stats WHERE league = ? ORDER BY rowid",
+                                  self.db, params=(league,))
+        order = list(dict.fromkeys(stats["stat"]))
+        values = stats.pivot(index="url", columns="stat", values="per90").reindex(columns=order)
+        wide = players.join(values, on="url").drop(columns="url")
+        wide["Minutes"] = wide["Minutes"].astype("Int64")
+        return wide
+
+    def export(self, league: str, out_csv: Path) -> int:
+        """Merge the league's stored players into out_csv (see module doc); returns rows written."""
+        wide = self.wide(league)
+        if wide.empty:
+            return 0
+        out = Path(out_csv)
+        if out.exists():
+            wide = merge_rows(pd.read_csv(out), wide)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        tmp = out.with_suffix(f".{os.getpid()}.tmp")
+        wide.to_csv(tmp, index=False)
+        os.replace(tmp, out)
+        return len(wide)
+
+
+def _keys(df: pd.DataFrame) -> pd.Series:
+    return df[ROW_KEY].astype(str).agg("\x1f".join, axis=1)
+
+def merge_rows(old: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """old with rows sharing a ROW_KEY replaced by new's (in place), new's other rows appended."""
+    old_k, new_k = _keys(old), _keys(new)
+    at = dict(zip(old_k, range(len(old))))
+    order = pd.concat([pd.Series(range(len(old)))[~old_k.isin(new_k).to_numpy()],
+                       pd.Series([at.get(k, len(old) + i) for i, k in enumerate(new_k)])], ignore_index=True)
+    merged = pd.concat([old[~old_k.isin(new_k)], new], ignore_index=True)
+    merged = merged.iloc[order.argsort(kind="stable").to_numpy()].reset_index(drop=True)
+    merged["Minutes"] = merged["Minutes"].astype("Int64")
+    return merged[list(dict.fromkeys([*old.columns, *new.columns]))]
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    from scrappers.jobs import OUT_DIR, SEASON
+
+    pa = argparse.ArgumentParser()
+    pa.add_argument("command", choices=["export"])
+    pa.add_argument("leagues", nargs="*")
+    pa.add_argument("--db", default=RESULTS_DB)
+    pa.add_argument("--out-dir", type=Path, default=OUT_DIR)
+    a = pa.parse_args()
+
+    with ScrapeStore(a.db) as store:
+        for league in a.leagues or store.leagues():
+            out = a.out_dir / f"{league}_{SEASON}.csv"
+            n = store.export(league, out)
+            print(f"→ {out}  ({n} rows)" if n else f"  = {league}: nothing stored, {out} left as is")
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# stub_server.py  ─────────────────────────────────────────────
+"""
+StubServer  —  local stand-in for fbref.com and sofifa.com.
+
+    with StubServer(latency=(0.05, 0.15), p429=0.02) as stub:
+        set_session(stub.session())          # fbref_scraper now talks to the stub
+        scrape_player("https://fbref.com/en/players/…/scout/12586/…-Scouting-Report")
+
+Routes
+    /en/players/<pid>/scout/<n>/<slug>-Scouting-Report
+        the page saved in an HtmlCache for that URL if one is given
+        (replay), else a scouting report synthesised from a
+        players_data row picked by <pid> — same markup the parsers
+        read (#meta, commented scout_full_* table, summary footer)
+    /en/comps/<id>/stats/<slug>
+        a league Standard Stats page listing every players_url profile,
+        minutes taken from the same players_data row as its scouting
+        report plus stub.bump_minutes.get(<pid>, 0)
+    /players?…&offset=N
+        a sofifa listing page of ROWS_PER_PAGE rows from
+        fc25_dump/PL_CH_EAFC25.csv; empty past the end
+
+Knobs: latency (uniform seconds per response), p429 / p403 (random
+rejections, 429 with Retry-After), cf_delay (extra delay on the first
+request of every new connection, like a Cloudflare challenge).
+Responses carry an ETag (304 on If-None-Match) and are gzip'd when
+asked.  stub.session() is a pooled requests.Session whose https://fbref.com
+and https://sofifa.com traffic is rewritten to the stub.
+
+    python -m scrappers.stub_server --port 8765 --latency 0.1 0.3 --p429 0.05
+"""
+
+from __future__ import annotations
+import gzip, hashlib, html as H, random, threading, time, zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+# ——— config
+PLAYERS_GLOB  = "players_data/*.csv"
+PROFILES_GLOB = "players_url/*.csv"
+SOFIFA_CSV    = "fc25_dump/PL_CH_EAFC25.csv"
+ROWS_PER_PAGE = 60
+ORIGINS       = ("https://fbref.com", "https://sofifa.com")
+META          = ["Player", "Birthdate", "Club", "Footed", "Nationality", "Position", "Minutes"]
+
+
+# ——— synthetic pages
+def scouting_page(row: pd.Series) -> str:
+    stats, body = [c for c in row.index if c not in META], []
+    for i, s in enumerate(stats):
+        if i % 20 == 0:
+            body.append('<tr class="over_header thead"><th data-stat="statistic">Statistic</th>'
+                        '<th data-stat="per90">Per 90</th><th data-stat="percentile">Percentile</th></tr>')
+        v = row[s]
+        v = "" if pd.isna(v) else f"{v:.1f}%" if "%" in s else f"{v:.2f}"
+        body.append(f'<tr><th scope="row" data-stat="statistic">{H.escape(s)}</th>'
+                    f'<td data-stat="per90">{v}</td><td data-stat="percentile">50</td></tr>')
+    minutes = "" if pd.isna(row["Minutes"]) else f"{int(row['Minutes']):,}"
+    return f"""<!DOCTYPE html><html><head><title>{H.escape(str(row['Player']))} Scouting Report | FBref.com</title></head><body>
+<div id="info"><div id="meta"><div><h1><span>{H.escape(str(row['Player']))}</span></h1>
+<p><strong>Position:</strong> {H.escape(str(row['Position']))} &#9642; <strong>Footed:</strong> {H.escape(str(row['Footed']))}</p>
+<p><strong>Born:</strong> <span id="necro-birth" data-birth="{row['Birthdate']}">{row['Birthdate']}</span></p>
+<p><strong>National Team:</strong> <a href="/en/country/XXX/">{H.escape(str(row['Nationality']))}</a></p>
+<p><strong>Club:</strong> <a href="/en/squads/0000/">{H.escape(str(row['Club']))}</a></p></div></div></div>
+<div class="filter switcher"><div class="current"><a class="sr_preset">vs. {H.escape(str(row['Position']))}</a></div></div>
+<div id="all_scout_full"><div class="placeholder"></div>
+<!--
+<div class="table_container"><table class="stats_table" id="scout_full_XX"><caption>Scouting Report</caption>
+<thead><tr class="over_header"><th colspan="3">Standard Stats</th></tr>
+<tr><th data-stat="statistic">Statistic</th><th data-stat="per90">Per 90</th><th data-stat="percentile">Percentile</th></tr></thead>
+<tbody>{"".join(body)}</tbody></table></div>
+-->
+</div>
+<div id="tfooter_scout_summary_XX" class="footer"><div><strong>Last 365 Days: Based on {minutes} minutes played</strong></div></div>
+<div id="footer">{"<p>FBref footer filler.</p>" * 400}</div>
+</body></html>"""
+
+def standard_stats_page(rows) -> str:
+    """rows: (profile path, name, minutes) → fbref-style commented stats_standard table."""
+    trs = "".join(f'<tr><th data-stat="ranker">{i}</th>'
+                  f'<td data-stat="player"><a href="{path}">{H.escape(name)}</a></td>'
+                  f'<td data-stat="minutes">{"" if m is None else f"{m:,}"}</td></tr>'
+                  for i, (path, name, m) in enumerate(rows, 1))
+    return ('<html><body><div id="all_stats_standard"><!--\n'
+            '<table class="stats_table" id="stats_standard"><thead><tr><th data-stat="ranker">Rk</th>'
+            '<th data-stat="player">Player</th><th data-stat="minutes">Min</th></tr></thead>'
+            f'<tbody>{trs}</tbody></table>\n--></div></body></html>')
+
+def listing_page(rows: pd.DataFrame) -> str:
+    trs = []
+    for r in rows.itertuples(index=False):
+        path = urlsplit(r.player_url).path
+        team = f"/team/{zlib.crc32(str(r.club_name).encode())}/"
+        trs.append(f'<tr><td><a href="{path}" data-tippy-content="{H.escape(r.full_name)}">'
+                   f'{H.escape(r.full_name)}</a></td>'
+                   f'<td data-col="oa"><em title="{r.overall}">{r.overall}</em></td>'
+                   f'<td><a href="{team}">{H.escape(str(r.club_name))}</a></td></tr>')
+    return f"<html><body><table><thead><tr><th>Name</th></tr></thead><tbody>{''.join(trs)}</tbody></table></body></html>"
+
+
+# ——— server
+class StubServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: Tuple[float, float] = (0.0, 0.0), p429: float = 0.0, p403: float = 0.0,
+                 cf_delay: float = 0.0, replay=None, seed: int = 0):
+        self.latency, self.p429, self.p403, self.cf_delay = latency, p429, p403, cf_delay
+        self.replay = replay                                    # HtmlCache or None
+        self.rng = random.Random(seed)
+        self.counts: Dict[str, int] = {"200": 0, "304": 0, "403": 0, "429": 0, "404": 0, "connections": 0}
+        self._lock = threading.Lock()
+        self._players = pd.concat([pd.read_csv(p) for p in sorted(Path().glob(PLAYERS_GLOB))], ignore_index=True)
+        self._listing = pd.read_csv(SOFIFA_CSV) if Path(SOFIFA_CSV).exists() else pd.DataFrame()
+        self._profiles = list(dict.fromkeys(
+            u for p in sorted(Path().glob(PROFILES_GLOB)) for u in pd.read_csv(p)["player_url"].dropna()))
+        self.bump_minutes: Dict[str, int] = {}                 # pid → minutes added on the league page
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def session(self, pool_size: int = 8) -> requests.Session:
+        """Pooled session sending fbref / sofifa URLs to this server."""
+        from scrappers.fbref_scraper import HEADERS
+        s = requests.Session()
+        s.headers.update(HEADERS)
+        adapter = _RewriteAdapter(self.base_url, pool_connections=2, pool_maxsize=pool_size)
+        for origin in ORIGINS:
+            s.mount(origin, adapter)
+        s.mount(self.base_url, adapter)
+        return s
+
+    def _count(self, key: str):
+        with self._lock:
+            self.counts[key] += 1
+
+    # ——— pages
+    def _row(self, pid: str) -> pd.Series:
+        return self._players.iloc[zlib.crc32(pid.encode()) % len(self._players)]
+
+    def page(self, path: str, query: str) -> Optional[str]:
+        if "/scout/" in path:
+            if self.replay is not None:
+                html = self.replay.get(f"https://fbref.com{path}")
+                if html is not None:
+                    return html
+            return scouting_page(self._row(path.split("/")[3]))
+        if path.startswith("/en/comps/") and "/stats/" in path:
+            rows = []
+            for url in self._profiles:
+                p = urlsplit(url).path
+                pid = p.split("/")[3]
+                m = self._row(pid)["Minutes"]
+                rows.append((p, p.rsplit("/", 1)[-1].replace("-", " "),
+                             None if pd.isna(m) else int(m) + self.bump_minutes.get(pid, 0)))
+            return standard_stats_page(rows)
+        if path.rstrip("/") == "/players":
+            offset = int(parse_qs(query).get("offset", ["0"])[0])
+            return listing_page(self._listing.iloc[offset:offset + ROWS_PER_PAGE])
+        return None
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                stub._count("connections")
+                if stub.cf_delay:
+                    time.sleep(stub.cf_delay)                   # challenge on a fresh connection
+
+            def _empty(self, code: int, headers: Optional[Dict[str, str]] = None):
+                stub._count(str(code))
+                self.send_response(code)
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                lo, hi = stub.latency
+                with stub._lock:
+                    delay, roll = stub.rng.uniform(lo, hi), stub.rng.random()
+                time.sleep(delay)
+                if roll < stub.p429:
+                    return self._empty(429, {"Retry-After": "1"})
+                if roll < stub.p429 + stub.p403:
+                    return self._empty(403)
+
+                url = urlsplit(self.path)
+                page = stub.page(url.path, url.query)
+                if page is None:
+                    return self._empty(404)
+                body = page.encode("utf-8")
+                etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self._empty(304, {"ETag": etag})
+                gz = "gzip" in self.headers.get("Accept-Encoding", "")
+                if gz:
+                    body = gzip.compress(body, 5)
+                stub._count("200")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("ETag", etag)
+                if gz:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+class _RewriteAdapter(HTTPAdapter):
+    def __init__(self, base_url: str, **kw):
+        self.base_url = base_url
+        super().__init__(**kw)
+
+    def send(self, request, **kw):
+        for origin in ORIGINS:
+            if request.url.startswith(origin):
+                request.url = self.base_url + request.url[len(origin):]
+        return super().send(request, **kw)
+
+
+# ——— CLI
+if __name__ == "__main__":
+    import argparse
+    pa = argparse.ArgumentParser()
+    pa.add_argument("--port", type=int, default=8765)
+    pa.add_argument("--latency", type=float, nargs=2, default=[0.0, 0.0])
+    pa.add_argument("--p429", type=float, default=0.0)
+    pa.add_argument("--p403", type=float, default=0.0)
+    pa.add_argument("--cf-delay", type=float, default=0.0)
+    a = pa.parse_args()
+
+    stub = StubServer(port=a.port, latency=tuple(a.latency), p429=a.p429, p403=a.p403, cf_delay=a.cf_delay)
+    print(f"stub on {stub.base_url}  (Ctrl-C to stop)")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()